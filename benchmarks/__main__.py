@@ -0,0 +1,92 @@
+import json
+import sys
+from pathlib import Path
+
+import click
+
+from benchmarks.startup import (
+    budget_violations,
+    eagerly_imported,
+    run_startup_benchmarks,
+)
+from benchmarks.suite import (
+    DEFAULT_THRESHOLD,
+    Scale,
+    compare_results,
+    format_comparisons,
+    is_linear,
+    sort_scaling,
+    regressions,
+    results_to_json,
+    run_benchmarks,
+)
+
+
+@click.group()
+def main():
+    pass
+
+
+@main.command()
+@click.option("--out", type=click.Path(dir_okay=False), default=None)
+@click.option("--select", "selected", multiple=True)
+@click.option("--graph-nodes", type=int, default=Scale.graph_nodes)
+@click.option("--rules", type=int, default=Scale.rules)
+@click.option("--repeat", type=int, default=Scale.repeat)
+def run(out, selected, graph_nodes, rules, repeat):
+    scale = Scale(graph_nodes=graph_nodes, rules=rules, repeat=repeat)
+    results = results_to_json(run_benchmarks(scale, list(selected)), scale)
+    output = json.dumps(results, indent=2)
+    if out:
+        Path(out).write_text(output)
+    else:
+        click.echo(output)
+
+
+@main.command()
+@click.option("--out", type=click.Path(dir_okay=False), default=None)
+@click.option("--repeat", type=int, default=Scale.repeat)
+def startup(out, repeat):
+    results = run_startup_benchmarks(repeat)
+    for result in results:
+        click.echo(f"{result.name}: {result.best * 1000:.3f}ms")
+    if out:
+        Path(out).write_text(
+            json.dumps(results_to_json(results, Scale(repeat=repeat)), indent=2)
+        )
+    eager = eagerly_imported()
+    if eager:
+        click.echo(f"Imported eagerly: {', '.join(eager)}")
+    violations = budget_violations(results)
+    for name, duration in violations.items():
+        click.echo(f"{name} took {duration:.3f}ms, over its budget")
+    if eager or violations:
+        sys.exit(1)
+
+
+@main.command()
+@click.option("--repeat", type=int, default=3)
+def scaling(repeat):
+    per_node = sort_scaling(repeat=repeat)
+    for size, seconds in per_node.items():
+        click.echo(f"topological_sort[{size}]: {seconds * 1e6:.3f}us per node")
+    if not is_linear(per_node):
+        click.echo("topological_sort does not scale linearly")
+        sys.exit(1)
+
+
+@main.command()
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False))
+@click.argument("current", type=click.Path(exists=True, dir_okay=False))
+@click.option("--threshold", type=float, default=DEFAULT_THRESHOLD)
+def compare(baseline, current, threshold):
+    comparisons = compare_results(
+        json.loads(Path(baseline).read_text()), json.loads(Path(current).read_text())
+    )
+    click.echo(format_comparisons(comparisons, threshold))
+    if regressions(comparisons, threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
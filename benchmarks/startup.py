@@ -0,0 +1,136 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.suite import BenchmarkResult
+from benchmarks.synthetic import write_synthetic_package
+
+CLI_MODULE = "runner.command_cli"
+IMPORT_BUDGET_MS = 100.0
+HELP_BUDGET_MS = 400.0
+COMMAND_HELP_BUDGET_MS = 1000.0
+LAZY_MODULES = (
+    "runner.compiled_plan",
+    "runner.execution_plan",
+    "runner.incremental",
+    "runner.memory_accounting",
+    "runner.pipeline",
+    "runner.profiling",
+    "runner.result_cache",
+    "runner.run",
+    "runner.serialization",
+    "runner.streaming",
+    "runner.sweep",
+    "runner.utils.hashing",
+    "cProfile",
+    "csv",
+    "pickle",
+    "tracemalloc",
+)
+PACKAGE_NAME = "runner_startup_package"
+CLI_SCRIPT = f"""
+import {PACKAGE_NAME}
+from {PACKAGE_NAME}.base import Target
+from runner.command_cli import RunCallableCLI
+from runner.run import run
+
+RunCallableCLI(
+    {{"Target": (Target, "train")}},
+    command_runner=run,
+    add_options_from_outside_packages=True,
+    module={PACKAGE_NAME},
+)()
+"""
+
+
+def python_command(*args: str) -> List[str]:
+    return [sys.executable, "-X", "importtime", *args]
+
+
+def cumulative_import_time(stderr: str, module: str) -> float:
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise ValueError(f"{module} was not imported")
+
+
+def import_time(module: str, repeat: int) -> BenchmarkResult:
+    timings = [
+        cumulative_import_time(
+            subprocess.run(
+                python_command("-c", f"import {module}"),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stderr,
+            module,
+        )
+        for _ in range(repeat)
+    ]
+    return BenchmarkResult(
+        f"import {module}", min(timings), statistics.mean(timings), repeat
+    )
+
+
+def eagerly_imported(module: str = CLI_MODULE) -> List[str]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return [name for name in LAZY_MODULES if name in output]
+
+
+def command_time(name: str, args: List[str], cwd: str, repeat: int) -> BenchmarkResult:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=cwd,
+            capture_output=True,
+            check=True,
+            env=os.environ | {"PYTHONPATH": os.pathsep.join([cwd, str(Path.cwd())])},
+        )
+        timings.append(time.perf_counter() - start)
+    return BenchmarkResult(name, min(timings), statistics.mean(timings), repeat)
+
+
+def run_startup_benchmarks(repeat: int = 5) -> List[BenchmarkResult]:
+    results = [import_time(CLI_MODULE, repeat)]
+    with tempfile.TemporaryDirectory() as root:
+        write_synthetic_package(Path(root), PACKAGE_NAME, 10, 5, 5)
+        (Path(root) / "cli.py").write_text(CLI_SCRIPT)
+        results.append(command_time("run_cli --help", ["cli.py", "--help"], root, repeat))
+        results.append(
+            command_time(
+                "run_cli Target --help", ["cli.py", "Target", "--help"], root, repeat
+            )
+        )
+    return results
+
+
+def budget_violations(results: List[BenchmarkResult]) -> Dict[str, float]:
+    budgets = {
+        f"import {CLI_MODULE}": IMPORT_BUDGET_MS,
+        "run_cli --help": HELP_BUDGET_MS,
+        "run_cli Target --help": COMMAND_HELP_BUDGET_MS,
+    }
+    return {
+        result.name: result.best * 1000
+        for result in results
+        if result.best * 1000 > budgets.get(result.name, float("inf"))
+    }
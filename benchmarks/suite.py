@@ -0,0 +1,219 @@
+import dataclasses
+import importlib
+import logging
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from click import Context
+
+from benchmarks.synthetic import (
+    synthetic_graph,
+    synthetic_package,
+    synthetic_rules,
+)
+from runner.command_cli import RunCallableCLI
+from runner.dynamic_loading import find_subclasses
+from runner.object_creation import create_objects, topological_levels, topological_sort
+from runner.utils.regex import get_first_value_for_matching_patterns
+
+DEFAULT_THRESHOLD = 0.2
+SCALING_SIZES = (10_000, 30_000, 100_000)
+LINEAR_TOLERANCE = 2.0
+
+
+@dataclasses.dataclass
+class Scale:
+    depth: int = 30
+    wide_modules: int = 20
+    classes_per_module: int = 10
+    rules: int = 5_000
+    rule_lookups: int = 50
+    graph_nodes: int = 10_000
+    large_graph_nodes: int = 100_000
+    repeat: int = 5
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    best: float
+    mean: float
+    repeat: int
+
+
+def measure(name: str, func: Callable, repeat: int, setup: Callable = None) -> BenchmarkResult:
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        func(argument) if setup else func()
+        timings.append(time.perf_counter() - start)
+    return BenchmarkResult(name, min(timings), statistics.mean(timings), repeat)
+
+
+def run_benchmarks(scale: Scale, selected: Optional[List[str]] = None) -> List[BenchmarkResult]:
+    results = []
+
+    def wanted(name: str) -> bool:
+        return not selected or any(pattern in name for pattern in selected)
+
+    with synthetic_package(
+        scale.depth, scale.wide_modules, scale.classes_per_module
+    ) as package:
+        base_module = importlib.import_module(f"{package.__name__}.base")
+        base = base_module.Base
+        if wanted("find_subclasses"):
+            results.append(
+                measure(
+                    "find_subclasses",
+                    lambda: find_subclasses(package, base),
+                    scale.repeat,
+                )
+            )
+        if wanted("get_command"):
+            cli = RunCallableCLI(
+                {"Target": (base_module.Target, "train")},
+                command_runner=lambda **kwargs: None,
+                add_options_from_outside_packages=True,
+                module=package,
+            )
+            context = Context(cli)
+            results.append(
+                measure(
+                    "get_command",
+                    lambda: cli.get_command(context, "Target"),
+                    scale.repeat,
+                )
+            )
+
+    if wanted("get_first_value_for_matching_patterns"):
+        rules = synthetic_rules(scale.rules)
+        logger = logging.getLogger(__name__)
+        texts = [
+            f"model.layer{index * scale.rules // scale.rule_lookups}.lr"
+            for index in range(scale.rule_lookups)
+        ]
+        results.append(
+            measure(
+                "get_first_value_for_matching_patterns",
+                lambda: [
+                    get_first_value_for_matching_patterns(rules, text, logger)
+                    for text in texts
+                ],
+                scale.repeat,
+            )
+        )
+
+    if wanted("topological_sort"):
+        results.append(
+            measure(
+                "topological_sort",
+                lambda graph: topological_sort(graph, {}),
+                scale.repeat,
+                setup=lambda: synthetic_graph(scale.graph_nodes),
+            )
+        )
+    if wanted("topological_sort_large"):
+        results.append(
+            measure(
+                "topological_sort_large",
+                lambda graph: topological_sort(graph, {}),
+                scale.repeat,
+                setup=lambda: synthetic_graph(scale.large_graph_nodes),
+            )
+        )
+    if wanted("topological_levels"):
+        results.append(
+            measure(
+                "topological_levels",
+                lambda graph: topological_levels(graph, {}),
+                scale.repeat,
+                setup=lambda: synthetic_graph(scale.large_graph_nodes),
+            )
+        )
+    if wanted("create_objects"):
+        graph = synthetic_graph(scale.graph_nodes)
+        order = topological_sort(dict(graph), {})
+        results.append(
+            measure(
+                "create_objects",
+                lambda: create_objects(graph, order=order),
+                scale.repeat,
+            )
+        )
+    return results
+
+
+def sort_scaling(sizes=SCALING_SIZES, repeat: int = 3) -> Dict[int, float]:
+    per_node = {}
+    for size in sizes:
+        graph = synthetic_graph(size)
+        result = measure(
+            f"topological_sort[{size}]", lambda: topological_sort(graph, {}), repeat
+        )
+        per_node[size] = result.best / size
+    return per_node
+
+
+def is_linear(per_node: Dict[int, float], tolerance: float = LINEAR_TOLERANCE) -> bool:
+    return max(per_node.values()) <= min(per_node.values()) * tolerance
+
+
+def results_to_json(results: List[BenchmarkResult], scale: Scale) -> dict:
+    return {
+        "metadata": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "created_at": time.time(),
+            "scale": dataclasses.asdict(scale),
+        },
+        "benchmarks": {result.name: dataclasses.asdict(result) for result in results},
+    }
+
+
+@dataclasses.dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def regressed(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def compare_results(baseline: dict, current: dict) -> List[Comparison]:
+    return [
+        Comparison(
+            name,
+            baseline["benchmarks"][name]["best"],
+            current["benchmarks"][name]["best"],
+        )
+        for name in baseline["benchmarks"]
+        if name in current["benchmarks"]
+    ]
+
+
+def format_comparisons(comparisons: List[Comparison], threshold: float) -> str:
+    lines = []
+    for comparison in comparisons:
+        status = "REGRESSED" if comparison.regressed(threshold) else "ok"
+        lines.append(
+            f"{comparison.name}: {comparison.baseline * 1000:.3f}ms -> "
+            f"{comparison.current * 1000:.3f}ms ({comparison.ratio:.2f}x) {status}"
+        )
+    return "\n".join(lines)
+
+
+def regressions(comparisons: List[Comparison], threshold: float) -> Dict[str, float]:
+    return {
+        comparison.name: comparison.ratio
+        for comparison in comparisons
+        if comparison.regressed(threshold)
+    }
@@ -0,0 +1,117 @@
+import contextlib
+import importlib
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Pattern
+
+from runner.object_creation import ParameterGraph, ParameterNode
+
+BASE_MODULE = '''
+class Base:
+    def __init__(self, base_size: int = 1):
+        self.base_size = base_size
+
+
+class Target:
+    def __init__(self, component: Base, scale: float = 1.0):
+        self.component = component
+        self.scale = scale
+
+    def train(self, epochs: int = 1, name: str = "run"):
+        return epochs * self.scale
+'''
+
+
+def deep_module_source(depth: int) -> str:
+    lines = ["from ..base import Base", ""]
+    parent = "Base"
+    for level in range(depth):
+        lines += [
+            "",
+            f"class Deep{level}({parent}):",
+            f"    def __init__(self, deep{level}: int = {level}, **kwargs):",
+            "        super().__init__(**kwargs)",
+            f"        self.deep{level} = deep{level}",
+            "",
+        ]
+        parent = f"Deep{level}"
+    return "\n".join(lines)
+
+
+def wide_module_source(module_index: int, classes: int) -> str:
+    lines = ["from ..base import Base", ""]
+    for class_index in range(classes):
+        name = f"Wide{module_index}_{class_index}"
+        lines += [
+            "",
+            f"class {name}(Base):",
+            f"    def __init__(self, width: int = {class_index}, label: str = '{name}', **kwargs):",
+            "        super().__init__(**kwargs)",
+            "        self.width = width",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def write_synthetic_package(
+    root: Path, name: str, depth: int, wide_modules: int, classes_per_module: int
+) -> Path:
+    package = root / name
+    (package / "deep").mkdir(parents=True)
+    (package / "wide").mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "base.py").write_text(BASE_MODULE)
+    (package / "deep" / "__init__.py").write_text("")
+    (package / "deep" / "chain.py").write_text(deep_module_source(depth))
+    (package / "wide" / "__init__.py").write_text("")
+    for module_index in range(wide_modules):
+        (package / "wide" / f"module{module_index}.py").write_text(
+            wide_module_source(module_index, classes_per_module)
+        )
+    return package
+
+
+@contextlib.contextmanager
+def synthetic_package(
+    depth: int = 30,
+    wide_modules: int = 20,
+    classes_per_module: int = 10,
+    name: str = "runner_benchmark_package",
+):
+    with tempfile.TemporaryDirectory() as root:
+        write_synthetic_package(
+            Path(root), name, depth, wide_modules, classes_per_module
+        )
+        sys.path.insert(0, root)
+        importlib.invalidate_caches()
+        try:
+            yield importlib.import_module(name)
+        finally:
+            sys.path.remove(root)
+            for module_name in list(sys.modules):
+                if module_name == name or module_name.startswith(f"{name}."):
+                    del sys.modules[module_name]
+
+
+def synthetic_graph(nodes: int, fan_in: int = 2) -> ParameterGraph:
+    graph = {}
+    for index in range(nodes):
+        dependencies = range(max(0, index - fan_in), index)
+        if dependencies:
+            graph[f"node{index}"] = ParameterNode(
+                type=dict,
+                value=None,
+                edges={f"node{dependency}": f"p{dependency}" for dependency in dependencies},
+            )
+        else:
+            graph[f"node{index}"] = ParameterNode(type=int, value=index + 1, edges={})
+    return graph
+
+
+def synthetic_rules(count: int) -> Dict[Pattern, int]:
+    return {
+        re.compile(rf"model\.layer{index}\.(lr|momentum)"): index
+        for index in range(count)
+    }
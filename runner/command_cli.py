@@ -1,32 +1,51 @@
 import importlib.util
-import json
-import os
 import sys
 
 import functools
 from types import ModuleType
-from pathlib import Path
 from typing import Callable, List, Optional, Dict, Tuple, Any
 
 import click
-from click import MultiCommand, Context, Command, Option
+from click import MultiCommand, Context, Command, Option, Argument
 
+from runner.constants import PROFILERS, STREAM_FORMATS, is_pipeline
 from runner.dynamic_loading import find_subclasses
+from runner.instrumentation import RunTracer, current_tracer, phase, use_tracer
 from runner.parameters_analysis import cli_parameters_for_calling
-from runner.run import run
 from runner.utils.click import (
     convert_param_value,
     multiple_callbacks,
     ignore_emtpy_multiples,
     create_assigner_option,
     ParamTrueName,
+    ValueSourceType,
     convert_click_dict_to_nested,
 )
-from runner.utils.regex import convert_str_keys_to_pattern
 
 DEFAULT_CONFIG_JSON = "default_config.json"
 DEFAULT_RULES_JSON = "default_rules.json"
 DEFAULT_SETTINGS_JSON = "default_settings.json"
+PLAN_COMMAND = "plan"
+EXECUTE_COMMAND = "execute"
+TRACING_OPTIONS = ("--timings", "--timings-out", "--trace-out")
+TRACING_META_KEY = "runner.tracing"
+
+
+def run(*args, **kwargs):
+    # The run machinery (and the features it pulls in) is only imported once a command runs
+    from runner.run import run as run_target
+
+    return run_target(*args, **kwargs)
+
+
+def execute_plan(*args, **kwargs):
+    from runner.run import execute_plan as execute_plan_target
+
+    return execute_plan_target(*args, **kwargs)
+
+
+def wants_tracing(args: List[str]) -> bool:
+    return any(str(arg).split("=", 1)[0] in TRACING_OPTIONS for arg in args)
 
 
 class RunCallableCLI(MultiCommand):
@@ -43,11 +62,13 @@ class RunCallableCLI(MultiCommand):
         default_assign_connection: Dict[str, Any] = None,
         global_settings: Dict[str, Any] = None,
         logger=None,
+        plan_executor: Callable = None,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.callables = callables
+        self.plan_executor = plan_executor or execute_plan
         self.command_runner = command_runner
         self.logger = logger
         self.add_options_from_outside_packages = add_options_from_outside_packages
@@ -60,9 +81,34 @@ class RunCallableCLI(MultiCommand):
         self.global_settings = global_settings or {}
 
     def list_commands(self, ctx: Context) -> List[str]:
-        return list(self.callables.keys())
+        return list(self.callables.keys()) + [PLAN_COMMAND, EXECUTE_COMMAND]
+
+    def parse_args(self, ctx: Context, args: List[str]) -> List[str]:
+        ctx.meta[TRACING_META_KEY] = wants_tracing(args)
+        return super().parse_args(ctx, args)
+
+    def invoke(self, ctx: Context):
+        if current_tracer() is not None or not ctx.meta.get(TRACING_META_KEY):
+            return super().invoke(ctx)
+        # The command is built before run() starts its instrumentation, so the tracer is started here
+        # and run() reports into it, spans of the option generation included
+        with use_tracer(RunTracer()):
+            return super().invoke(ctx)
 
     def get_command(self, ctx: Context, cmd_name: str) -> Optional[Command]:
+        if cmd_name not in self.callables and cmd_name == PLAN_COMMAND:
+            return PlanCommands(self, PLAN_COMMAND)
+        if cmd_name not in self.callables and cmd_name == EXECUTE_COMMAND:
+            return Command(
+                EXECUTE_COMMAND,
+                params=[
+                    Argument(["plan_path"], type=click.Path(exists=True, dir_okay=False))
+                ]
+                + self.instrumentation_params()
+                + self.output_params()
+                + self.addtional_params(),
+                callback=self.plan_executor,
+            )
         if cmd_name in self.callables:
             klass, func_name = self.callables[cmd_name]
             alg_command = functools.partial(
@@ -96,36 +142,50 @@ class RunCallableCLI(MultiCommand):
                     **normal_command_config,
                 )
 
-            init_params = cli_parameters_for_calling(
-                klass,
-                None,
-                self.add_options_from_outside_packages,
-                self.module,
-                logger=self.logger,
-            )
-            func_params = cli_parameters_for_calling(
-                klass,
-                func_name,
-                self.add_options_from_outside_packages,
-                self.module,
-                logger=self.logger,
-            )
-            parameters = init_params + func_params
-
-            params = [
-                Option(
-                    ["--" + "-".join(param.name.split("."))],
-                    type=param.type,
-                    multiple=param.multiple,
-                    default=param.default,
-                    is_flag=param.flag,
-                    callback=functools.partial(
-                        multiple_callbacks,
-                        callbacks=[convert_param_value, ignore_emtpy_multiples],
-                    ),
+            with phase("cli_init_parameters_analysis"):
+                init_params = cli_parameters_for_calling(
+                    klass,
+                    None,
+                    self.add_options_from_outside_packages,
+                    self.module,
+                    logger=self.logger,
                 )
-                for param in parameters
-            ]
+            methods = [func_name]
+            if is_pipeline(func_name):
+                from runner.pipeline import pipeline_methods
+
+                methods = pipeline_methods(func_name)
+            func_params = {}
+            with phase("cli_method_parameters_analysis"):
+                for method in methods:
+                    # Methods of a pipeline share the config, so a parameter they have in common is one option
+                    for param in cli_parameters_for_calling(
+                        klass,
+                        method,
+                        self.add_options_from_outside_packages,
+                        self.module,
+                        logger=self.logger,
+                    ):
+                        func_params.setdefault(param.name, param)
+            parameters = init_params + list(func_params.values())
+
+            with phase("cli_options_creation", options=len(parameters)):
+                params = [
+                    Option(
+                        ["--" + "-".join(param.name.split("."))],
+                        type=ValueSourceType(param.type)
+                        if param.value_source
+                        else param.type,
+                        multiple=param.multiple,
+                        default=param.default,
+                        is_flag=param.flag,
+                        callback=functools.partial(
+                            multiple_callbacks,
+                            callbacks=[convert_param_value, ignore_emtpy_multiples],
+                        ),
+                    )
+                    for param in parameters
+                ]
             params += [
                 create_assigner_option("value"),
                 create_assigner_option("type"),
@@ -136,10 +196,41 @@ class RunCallableCLI(MultiCommand):
                     type=str,
                     multiple=True,
                 ),
+                Option(["--result-cache"], type=click.Path(file_okay=False)),
+                Option(["--code-version"], type=str),
             ]
+            params += self.instrumentation_params()
+            params += self.output_params()
+            if is_pipeline(func_name):
+                params.append(
+                    Option(["--pipeline-workers"], type=click.IntRange(min=1), default=1)
+                )
             params += self.addtional_params()
             return Command(cmd_name, params=params, callback=convert_params_true_values_to_dict)
 
+    def instrumentation_params(self):
+        return [
+            Option(["--timings"], is_flag=True, default=False),
+            Option(["--timings-out"], type=click.Path(dir_okay=False)),
+            Option(["--trace-out"], type=click.Path(dir_okay=False)),
+            Option(["--profile"], type=click.Choice(PROFILERS)),
+            Option(["--profile-out"], type=click.Path(dir_okay=False)),
+            Option(["--memory"], is_flag=True, default=False),
+            Option(["--memory-out"], type=click.Path(dir_okay=False)),
+        ]
+
+    def output_params(self):
+        return [
+            Option(["--batch-input"], type=click.Path(dir_okay=False, allow_dash=True)),
+            Option(["--batch-output"], type=click.Path(dir_okay=False, allow_dash=True)),
+            Option(["--batch-chunk-size"], type=click.IntRange(min=1), default=1),
+            Option(["--batch-workers"], type=click.IntRange(min=1), default=1),
+            Option(["--stream-out"], type=click.Path(dir_okay=False, allow_dash=True)),
+            Option(["--stream-format"], type=click.Choice(STREAM_FORMATS), default="jsonl"),
+            Option(["--stream-flush-every"], type=click.IntRange(min=1), default=100),
+            Option(["--result-out"], type=click.Path(dir_okay=False)),
+        ]
+
     def addtional_params(self):
         return []
 
@@ -161,27 +252,13 @@ class RunCallableCLI(MultiCommand):
             default_rules_file_name = DEFAULT_RULES_JSON
             default_settings_file_name = DEFAULT_SETTINGS_JSON
 
-        default_config = (
-            json.loads(Path(default_config_file_name).read_text())
-            if os.path.exists(default_config_file_name)
-            else {}
-        )
-        default_rules = (
-            json.loads(Path(default_rules_file_name).read_text())
-            if os.path.exists(default_rules_file_name)
-            else {}
-        )
-        global_settings = (
-            json.loads(Path(default_settings_file_name).read_text())
-            if os.path.exists(default_settings_file_name)
-            else {}
-        )
+        from runner.config_bundle import load_settings_bundle
 
-        default_rules = {
-            rule_name: convert_str_keys_to_pattern(rules)
-            for rule_name, rules in default_rules.items()
-        }
-        default_config = convert_click_dict_to_nested(default_config)
+        default_config, default_rules, global_settings = load_settings_bundle(
+            default_config_file_name,
+            default_rules_file_name,
+            default_settings_file_name,
+        )
         return cls(
             *args,
             **kwargs,
@@ -191,15 +268,42 @@ class RunCallableCLI(MultiCommand):
         )
 
 
-def run_class(*args, callback, **kwargs):
-    callback(*args, runner=run, **kwargs)
+class PlanCommands(MultiCommand):
+    def __init__(self, cli: RunCallableCLI, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cli = cli
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        return list(self.cli.callables.keys())
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Optional[Command]:
+        if cmd_name not in self.cli.callables:
+            return None
+        command = self.cli.get_command(ctx, cmd_name)
+        command.params.append(
+            Option(
+                ["--out", "plan_out"],
+                type=click.Path(dir_okay=False),
+                required=True,
+            )
+        )
+        return command
+
+
+def run_class(*args, callback, runner=run, **kwargs):
+    callback(*args, runner=runner, **kwargs)
 
 
 class RunnerWithCLI(RunCallableCLI):
     def __init__(self, *args, command_runner, **kwargs):
         self.user_func = command_runner
         callback = functools.partial(run_class, callback=command_runner)
-        super().__init__(*args, command_runner=callback, **kwargs)
+        plan_executor = functools.partial(
+            run_class, callback=command_runner, runner=execute_plan
+        )
+        super().__init__(
+            *args, command_runner=callback, plan_executor=plan_executor, **kwargs
+        )
 
     def addtional_params(self):
         params = super().addtional_params()
@@ -0,0 +1,170 @@
+from array import array
+from typing import Any, Dict, List, Mapping, Optional
+
+
+class PathTable:
+    __slots__ = ("paths", "ids")
+
+    def __init__(self):
+        self.paths: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, path: str) -> int:
+        path_id = self.ids.get(path)
+        if path_id is None:
+            path_id = len(self.paths)
+            self.paths.append(path)
+            self.ids[path] = path_id
+        return path_id
+
+    def longest_prefix(self, path: str) -> Optional[str]:
+        if path in self.ids:
+            return path
+        parts = path.split(".")
+        for end in range(len(parts) - 1, 0, -1):
+            prefix = ".".join(parts[:end])
+            if prefix in self.ids:
+                return prefix
+        return None
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def longest_prefix_in(mapping: Mapping[str, Any], path: str) -> Optional[str]:
+    parts = path.split(".")
+    for end in range(len(parts), 0, -1):
+        prefix = ".".join(parts[:end])
+        if prefix in mapping:
+            return prefix
+    return None
+
+
+class CompactGraph:
+    __slots__ = (
+        "table",
+        "node_count",
+        "offsets",
+        "targets",
+        "suffixes",
+        "argument_names",
+    )
+
+    def __init__(
+        self,
+        table: PathTable,
+        node_count: int,
+        offsets: array,
+        targets: array,
+        suffixes: List[Optional[str]],
+        argument_names: List[str],
+    ):
+        self.table = table
+        self.node_count = node_count
+        self.offsets = offsets
+        self.targets = targets
+        self.suffixes = suffixes
+        self.argument_names = argument_names
+
+    @classmethod
+    def from_graph(
+        cls, graph: Mapping[str, Any], additional_nodes: Mapping[str, Any] = None
+    ) -> "CompactGraph":
+        additional_nodes = additional_nodes or {}
+        table = PathTable()
+        for key in graph:
+            table.intern(key)
+        node_count = len(table)
+        offsets = array("q", [0])
+        targets = array("q")
+        suffixes = []
+        argument_names = []
+        for node in graph.values():
+            for edge, argument_name in node.edges.items():
+                base = table.longest_prefix(edge) or longest_prefix_in(
+                    additional_nodes, edge
+                )
+                if base is None:
+                    raise ValueError(f"Edge {edge} not found in mapping")
+                targets.append(table.intern(base))
+                suffixes.append(
+                    edge[len(base) + 1 :] if base != edge else None
+                )
+                argument_names.append(argument_name)
+            offsets.append(len(targets))
+        return cls(table, node_count, offsets, targets, suffixes, argument_names)
+
+    @property
+    def paths(self) -> List[str]:
+        return self.table.paths
+
+    def is_external(self, path_id: int) -> bool:
+        return path_id >= self.node_count
+
+    def edge_range(self, path_id: int) -> range:
+        if self.is_external(path_id):
+            return range(0)
+        return range(self.offsets[path_id], self.offsets[path_id + 1])
+
+    def in_degrees(self) -> array:
+        in_degree = array("q", bytes(8 * len(self.table)))
+        for target in self.targets:
+            in_degree[target] += 1
+        return in_degree
+
+    def sort(self) -> List[int]:
+        in_degree = self.in_degrees()
+        queue = [path_id for path_id in range(len(self.table)) if in_degree[path_id] == 0]
+        # The queue only grows, so reading it by index is a FIFO without popping
+        position = 0
+        while position < len(queue):
+            path_id = queue[position]
+            position += 1
+            for edge_id in self.edge_range(path_id):
+                target = self.targets[edge_id]
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+        if len(queue) != len(self.table):
+            cycle = " -> ".join(self.paths[path_id] for path_id in self.find_cycle())
+            raise ValueError(f"Graph has at least one cycle: {cycle}")
+        queue.reverse()
+        return queue
+
+    def levels(self, order: List[int] = None) -> List[List[int]]:
+        order = order if order is not None else self.sort()
+        level = array("q", bytes(8 * len(self.table)))
+        levels = []
+        for path_id in order:
+            node_level = 0
+            for edge_id in self.edge_range(path_id):
+                node_level = max(node_level, level[self.targets[edge_id]] + 1)
+            level[path_id] = node_level
+            if node_level == len(levels):
+                levels.append([])
+            levels[node_level].append(path_id)
+        return levels
+
+    def find_cycle(self) -> List[int]:
+        unvisited, in_progress, done = 0, 1, 2
+        state = bytearray(len(self.table))
+        for start in range(len(self.table)):
+            if state[start] != unvisited:
+                continue
+            stack = [(start, iter(self.edge_range(start)))]
+            state[start] = in_progress
+            while stack:
+                path_id, edges = stack[-1]
+                edge_id = next(edges, None)
+                if edge_id is None:
+                    state[path_id] = done
+                    stack.pop()
+                    continue
+                target = self.targets[edge_id]
+                if state[target] == in_progress:
+                    path = [frame[0] for frame in stack]
+                    return path[path.index(target) :] + [target]
+                if state[target] == unvisited:
+                    state[target] = in_progress
+                    stack.append((target, iter(self.edge_range(target))))
+        return []
@@ -0,0 +1,181 @@
+import ast
+import keyword
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+
+from runner.instrumentation import CREATE_OBJECT_PHASE, current_tracer
+from runner.object_creation import (
+    ParameterGraph,
+    ParameterNode,
+    create_object,
+    search_close_edge_in_data,
+    topological_sort,
+)
+from runner.value_sources import is_value_source
+
+if TYPE_CHECKING:
+    from runner.compact_graph import CompactGraph
+
+MAX_COMPILED_PLANS = 128
+PLAN_FUNCTION_NAME = "construct"
+
+_compiled_plans: "OrderedDict[Tuple, Callable]" = OrderedDict()
+
+
+def value_kind(node: ParameterNode) -> str:
+    if node.value is None:
+        return "none"
+    if isinstance(node.value, str) or is_value_source(node.value):
+        return "str"
+    return "value"
+
+
+def graph_structure_key(graph: ParameterGraph, order: List[str]) -> Tuple:
+    return tuple(
+        (
+            key,
+            node.type,
+            node.creator,
+            tuple(node.edges.items()),
+            value_kind(node),
+        )
+        if (node := graph.get(key)) is not None
+        else (key,)
+        for key in order
+    )
+
+
+def is_safe_attribute_path(suffix: str) -> bool:
+    try:
+        expression = ast.parse(f"base.{suffix}", mode="eval").body
+    except SyntaxError:
+        return False
+    while isinstance(expression, (ast.Attribute, ast.Subscript)):
+        if isinstance(expression, ast.Subscript) and not (
+            isinstance(expression.slice, ast.Constant)
+            and isinstance(expression.slice.value, (int, str))
+        ):
+            return False
+        expression = expression.value
+    return isinstance(expression, ast.Name) and expression.id == "base"
+
+
+def get_attribute_path(base_obj: Any, suffix: str) -> Any:
+    return eval(f"base_obj.{suffix}")
+
+
+def dependency_expression(edge: str, created_locals: Dict[str, str]) -> str:
+    base_edge = search_close_edge_in_data(created_locals, edge)
+    if not base_edge:
+        raise ValueError(f"Edge {edge} not found in mapping")
+    base_local = created_locals[base_edge]
+    if base_edge == edge:
+        return base_local
+    suffix = edge[len(base_edge) + 1 :]
+    if is_safe_attribute_path(suffix):
+        return f"{base_local}.{suffix}"
+    return f"get_attribute_path({base_local}, {suffix!r})"
+
+
+def keyword_arguments(arguments: Dict[str, str]) -> str:
+    plain = [
+        f"{name}={expression}"
+        for name, expression in arguments.items()
+        if name.isidentifier() and not keyword.iskeyword(name)
+    ]
+    special = {
+        name: expression
+        for name, expression in arguments.items()
+        if not (name.isidentifier() and not keyword.iskeyword(name))
+    }
+    if special:
+        plain.append(
+            "**{" + ", ".join(f"{name!r}: {value}" for name, value in special.items()) + "}"
+        )
+    return ", ".join(plain)
+
+
+def generate_plan_source(
+    graph: ParameterGraph, order: List[str], traced: bool = False
+) -> Tuple[str, Dict[str, Any]]:
+    constants = {
+        "create_object": create_object,
+        "get_attribute_path": get_attribute_path,
+        "CREATE_OBJECT_PHASE": CREATE_OBJECT_PHASE,
+    }
+    created_locals = {}
+    lines = [f"def {PLAN_FUNCTION_NAME}(nodes, additional, tracer=None):"]
+    for index, key in enumerate(order):
+        local = f"v{index}"
+        node = graph.get(key)
+        if node is None:
+            lines.append(f"    {local} = additional[{key!r}]")
+            created_locals[key] = local
+            continue
+        arguments = {
+            name: dependency_expression(edge, created_locals)
+            for edge, name in node.edges.items()
+        }
+        dependencies = "{" + ", ".join(
+            f"{name!r}: {expression}" for name, expression in arguments.items()
+        ) + "}"
+        kind = value_kind(node)
+        if traced:
+            # Same span as the interpreted create_objects emits for every node
+            lines.append(
+                f"    with tracer.phase(CREATE_OBJECT_PHASE, path={key!r},"
+                f" type=nodes[{index}].type, creator=nodes[{index}].creator):"
+            )
+        indent = "        " if traced else "    "
+        if node.creator is not None:
+            constants[f"c{index}"] = node.creator
+            lines.append(f"{indent}{local} = c{index}(nodes[{index}], {dependencies})")
+        elif node.type is None and kind == "none":
+            lines.append(f"{indent}{local} = None")
+        elif node.type is not None and kind == "none":
+            constants[f"t{index}"] = node.type
+            lines.append(f"{indent}{local} = t{index}({keyword_arguments(arguments)})")
+        elif node.type is not None and kind == "value":
+            constants[f"t{index}"] = node.type
+            lines.append(
+                f"{indent}{local} = nodes[{index}].value or t{index}({keyword_arguments(arguments)})"
+            )
+        else:
+            lines.append(f"{indent}{local} = create_object(nodes[{index}], {dependencies})")
+        created_locals[key] = local
+    lines.append(
+        "    return {"
+        + ", ".join(f"{key!r}: {local}" for key, local in created_locals.items())
+        + "}"
+    )
+    return "\n".join(lines) + "\n", constants
+
+
+def compile_construction_plan(
+    graph: ParameterGraph, order: List[str], traced: bool = False
+) -> Callable:
+    structure_key = (graph_structure_key(graph, order), traced)
+    plan = _compiled_plans.get(structure_key)
+    if plan is not None:
+        _compiled_plans.move_to_end(structure_key)
+        return plan
+    source, namespace = generate_plan_source(graph, order, traced)
+    exec(compile(source, "<construction plan>", "exec"), namespace)
+    plan = namespace[PLAN_FUNCTION_NAME]
+    _compiled_plans[structure_key] = plan
+    if len(_compiled_plans) > MAX_COMPILED_PLANS:
+        _compiled_plans.popitem(last=False)
+    return plan
+
+
+def create_objects_compiled(
+    graph: ParameterGraph,
+    additional_objects: Dict[str, Any] = None,
+    order: List[str] = None,
+    compact: "CompactGraph" = None,
+) -> Dict[str, Any]:
+    additional_objects = additional_objects or {}
+    order = order or topological_sort(dict(graph), additional_objects, compact)
+    tracer = current_tracer()
+    plan = compile_construction_plan(graph, order, traced=tracer is not None)
+    return plan([graph.get(key) for key in order], additional_objects, tracer)
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from runner.utils.click import convert_click_dict_to_nested
+from runner.utils.regex import convert_str_keys_to_pattern
+
+CACHE_DIR_ENV = "RUNNER_CACHE_DIR"
+CACHE_DIR_NAME = "cmd-run-algorithm"
+BUNDLE_SUFFIX = ".settings.bundle"
+BUNDLE_MAGIC = b"RSB3"
+
+SettingsBundle = Tuple[dict, Dict[str, dict], dict]
+
+
+def file_stamp(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def file_digest(path: str) -> Optional[str]:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def read_json(path: str) -> dict:
+    return json.loads(Path(path).read_text()) if os.path.exists(path) else {}
+
+
+def read_settings(config_path: str, rules_path: str, settings_path: str) -> list:
+    return [
+        convert_click_dict_to_nested(read_json(config_path)),
+        read_json(rules_path),
+        read_json(settings_path),
+    ]
+
+
+def parse_settings(raw_settings: list) -> SettingsBundle:
+    # Only the rule patterns are not JSON, they are compiled again from the cached strings
+    default_config, raw_rules, settings = raw_settings
+    default_rules = {
+        rule_name: convert_str_keys_to_pattern(rules) for rule_name, rules in raw_rules.items()
+    }
+    return default_config, default_rules, settings
+
+
+def cache_dir() -> Path:
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / CACHE_DIR_NAME
+
+
+def bundle_path_for(sources: List[str]) -> Path:
+    key = hashlib.sha256("\0".join(sources).encode()).hexdigest()
+    return cache_dir() / f"{key}{BUNDLE_SUFFIX}"
+
+
+def read_bundle(bundle_path: Path) -> Optional[dict]:
+    # marshal only loads plain values (and is cheaper to load than JSON), the digest drops corrupted files
+    try:
+        data = bundle_path.read_bytes()
+    except OSError:
+        return None
+    header_size = len(BUNDLE_MAGIC) + hashlib.sha256().digest_size
+    if not data.startswith(BUNDLE_MAGIC):
+        return None
+    payload = memoryview(data)[header_size:]
+    if hashlib.sha256(payload).digest() != data[len(BUNDLE_MAGIC) : header_size]:
+        return None
+    try:
+        content = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+    return content if isinstance(content, dict) else None
+
+
+def write_bundle(bundle_path: Path, content: dict):
+    payload = marshal.dumps(content)
+    try:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=bundle_path.parent)
+        with os.fdopen(descriptor, "wb") as bundle_file:
+            bundle_file.write(BUNDLE_MAGIC + hashlib.sha256(payload).digest() + payload)
+        os.replace(temp_path, bundle_path)
+    except OSError:
+        # A read only cache directory only loses the cache
+        pass
+
+
+def load_settings_bundle(
+    config_path: str, rules_path: str, settings_path: str
+) -> SettingsBundle:
+    sources = [str(Path(path).absolute()) for path in (config_path, rules_path, settings_path)]
+    stamps = [file_stamp(path) for path in sources]
+    if all(stamp is None for stamp in stamps):
+        return {}, {}, {}
+    bundle_path = bundle_path_for(sources)
+    content = read_bundle(bundle_path)
+    if content is not None and content.get("sources") == sources:
+        if content.get("stamps") == stamps:
+            return parse_settings(content["settings"])
+        digests = [file_digest(path) for path in sources]
+        if content.get("digests") == digests:
+            # Touched but unchanged files keep the bundle, only the stamps move
+            write_bundle(bundle_path, content | {"stamps": stamps})
+            return parse_settings(content["settings"])
+    else:
+        digests = [file_digest(path) for path in sources]
+    raw_settings = read_settings(config_path, rules_path, settings_path)
+    settings = parse_settings(raw_settings)
+    write_bundle(
+        bundle_path,
+        {
+            "sources": sources,
+            "stamps": stamps,
+            "digests": digests,
+            "settings": raw_settings,
+        },
+    )
+    return settings
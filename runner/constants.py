@@ -0,0 +1,14 @@
+from typing import Dict, Optional, Sequence, Union
+
+CPROFILE = "cprofile"
+SAMPLE = "sample"
+PROFILERS = (CPROFILE, SAMPLE)
+STREAM_FORMATS = ("jsonl", "csv", "frames")
+PIPELINE_SEPARATOR = ","
+PipelineSpec = Union[str, Sequence[str], Dict[str, Sequence[str]]]
+
+
+def is_pipeline(func_name: Optional[PipelineSpec]) -> bool:
+    if func_name is None:
+        return False
+    return not isinstance(func_name, str) or PIPELINE_SEPARATOR in func_name
@@ -0,0 +1,195 @@
+import ast
+import collections.abc
+import functools
+import inspect
+import json
+import types
+import typing
+from typing import Any, Callable, Literal, Union
+
+MAX_CONVERTERS = 1024
+NONE_STRINGS = ("None", "none", "null")
+TRUE_STRINGS = ("true", "1", "yes", "y", "on")
+FALSE_STRINGS = ("false", "0", "no", "n", "off")
+SEQUENCE_ORIGINS = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Iterable: list,
+    collections.abc.Collection: list,
+    collections.abc.Set: set,
+    collections.abc.MutableSet: set,
+}
+MAPPING_ORIGINS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def convert_none(value: Any) -> None:
+    if value is None or value in NONE_STRINGS:
+        return None
+    raise ValueError(f"{value!r} is not None")
+
+
+def convert_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in TRUE_STRINGS:
+            return True
+        if lowered in FALSE_STRINGS:
+            return False
+        raise ValueError(f"{value!r} is not a boolean")
+    return bool(value)
+
+
+def parse_container(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        raise ValueError(f"{value!r} is not a container literal") from None
+
+
+def split_items(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    stripped = value.strip()
+    if stripped[:1] in ("[", "(", "{"):
+        return parse_container(stripped)
+    return [item.strip() for item in stripped.split(",")] if stripped else []
+
+
+def scalar_converter(klass: type) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if isinstance(value, klass):
+            return value
+        return klass(value)
+
+    return convert
+
+
+def literal_converter(options: tuple) -> Callable[[Any], Any]:
+    by_text = {str(option): option for option in reversed(options)}
+
+    def convert(value: Any) -> Any:
+        if value in options:
+            return value
+        if str(value) in by_text:
+            return by_text[str(value)]
+        raise ValueError(f"{value!r} is not one of {list(options)}")
+
+    return convert
+
+
+def union_converter(members: tuple) -> Callable[[Any], Any]:
+    # str accepts everything, so it is tried only after the other members
+    ordered = sorted(members, key=lambda member: member is str)
+    converters = [compile_converter(member) for member in ordered]
+
+    def convert(value: Any) -> Any:
+        for converter in converters:
+            try:
+                return converter(value)
+            except (ValueError, TypeError):
+                continue
+        raise ValueError(f"{value!r} does not match any of {list(members)}")
+
+    return convert
+
+
+def sequence_converter(container: type, element: Any) -> Callable[[Any], Any]:
+    element_converter = compile_converter(element)
+
+    def convert(value: Any) -> Any:
+        return container(element_converter(item) for item in split_items(value))
+
+    return convert
+
+
+def tuple_converter(elements: tuple) -> Callable[[Any], Any]:
+    if len(elements) == 2 and elements[1] is Ellipsis:
+        return sequence_converter(tuple, elements[0])
+    converters = [compile_converter(element) for element in elements]
+
+    def convert(value: Any) -> tuple:
+        items = split_items(value)
+        if converters and len(items) != len(converters):
+            raise ValueError(f"{value!r} should have {len(converters)} items")
+        if not converters:
+            return tuple(items)
+        return tuple(converter(item) for converter, item in zip(converters, items))
+
+    return convert
+
+
+def mapping_converter(key: Any, value_type: Any) -> Callable[[Any], Any]:
+    key_converter = compile_converter(key)
+    value_converter = compile_converter(value_type)
+
+    def convert(value: Any) -> dict:
+        mapping = parse_container(value) if isinstance(value, str) else value
+        if not isinstance(mapping, collections.abc.Mapping):
+            raise ValueError(f"{value!r} is not a mapping")
+        return {
+            key_converter(inner_key): value_converter(inner_value)
+            for inner_key, inner_value in mapping.items()
+        }
+
+    return convert
+
+
+def build_converter(annotation: Any) -> Callable[[Any], Any]:
+    if annotation in (None, Any, str, object, inspect.Parameter.empty):
+        return identity
+    if annotation is type(None):
+        return convert_none
+    if annotation is bool:
+        return convert_bool
+    origin = typing.get_origin(annotation)
+    arguments = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return compile_converter(arguments[0])
+    if origin is Literal:
+        return literal_converter(arguments)
+    if origin in (Union, types.UnionType):
+        return union_converter(arguments)
+    if origin is tuple:
+        return tuple_converter(arguments)
+    if origin in SEQUENCE_ORIGINS:
+        return sequence_converter(
+            SEQUENCE_ORIGINS[origin], arguments[0] if arguments else Any
+        )
+    if origin in MAPPING_ORIGINS:
+        key, value_type = arguments if arguments else (Any, Any)
+        return mapping_converter(key, value_type)
+    if annotation in tuple(SEQUENCE_ORIGINS):
+        return sequence_converter(SEQUENCE_ORIGINS[annotation], Any)
+    if annotation is tuple:
+        return tuple_converter(())
+    if annotation in MAPPING_ORIGINS:
+        return mapping_converter(Any, Any)
+    if isinstance(annotation, type):
+        return scalar_converter(annotation)
+    return identity
+
+
+@functools.lru_cache(maxsize=MAX_CONVERTERS)
+def cached_converter(annotation: Any) -> Callable[[Any], Any]:
+    return build_converter(annotation)
+
+
+def compile_converter(annotation: Any) -> Callable[[Any], Any]:
+    try:
+        return cached_converter(annotation)
+    except TypeError:
+        # Annotations holding unhashable arguments can not be cached
+        return build_converter(annotation)
@@ -0,0 +1,136 @@
+import dataclasses
+import importlib
+import pickle
+from logging import Logger
+from typing import Any, Dict, List, Optional
+
+from runner.object_creation import ParameterGraph, ParameterNode
+from runner.serialization import dump_with_buffers, load_with_buffers
+
+PLAN_FORMAT_VERSION = 2
+IMPORT_PATH_SEPARATOR = ":"
+
+
+@dataclasses.dataclass
+class ExecutionPlan:
+    klass: type
+    func_name: str
+    init_graph: ParameterGraph
+    init_order: List[str]
+    func_graph: ParameterGraph
+    func_order: List[str]
+    logger_paths: List[str] = dataclasses.field(default_factory=list)
+
+
+def import_path(obj: Any) -> Optional[str]:
+    if obj is None:
+        return None
+    path = f"{obj.__module__}{IMPORT_PATH_SEPARATOR}{getattr(obj, '__qualname__', '')}"
+    try:
+        imported = import_from_path(path)
+    except (ImportError, AttributeError, ValueError):
+        imported = None
+    if imported is not obj:
+        raise ValueError(f"{obj} can not be imported by its name, it can not be planned")
+    return path
+
+
+def import_from_path(path: Optional[str]) -> Any:
+    if path is None:
+        return None
+    module_name, qualname = path.split(IMPORT_PATH_SEPARATOR)
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def reference_to_serializable(obj: Any, key: str) -> Optional[dict]:
+    if obj is None:
+        return None
+    try:
+        return {"import": import_path(obj)}
+    except ValueError:
+        pass
+    # Typing generics pickle by value, lambdas and local classes need cloudpickle
+    try:
+        return {"pickle": pickle.dumps(obj, protocol=5)}
+    except (pickle.PicklingError, AttributeError, TypeError):
+        pass
+    try:
+        import cloudpickle
+    except ImportError:
+        raise ValueError(
+            f"{obj!r} of {key} can not be imported by its name or pickled, install cloudpickle to plan it"
+        ) from None
+    return {"pickle": cloudpickle.dumps(obj, protocol=5)}
+
+
+def reference_from_serializable(data: Optional[dict]) -> Any:
+    if data is None:
+        return None
+    if "import" in data:
+        return import_from_path(data["import"])
+    return pickle.loads(data["pickle"])
+
+
+def logger_paths(graph: ParameterGraph) -> List[str]:
+    return [key for key, node in graph.items() if isinstance(node.value, Logger)]
+
+
+def graph_to_serializable(graph: ParameterGraph) -> Dict[str, dict]:
+    return {
+        key: {
+            "type": reference_to_serializable(node.type, key),
+            # Loggers are given again when the plan is executed
+            "value": None if isinstance(node.value, Logger) else node.value,
+            "edges": node.edges,
+            "creator": reference_to_serializable(node.creator, key),
+            "annotation": reference_to_serializable(node.annotation, key),
+        }
+        for key, node in graph.items()
+    }
+
+
+def graph_from_serializable(data: Dict[str, dict]) -> ParameterGraph:
+    return {
+        key: ParameterNode(
+            type=reference_from_serializable(node["type"]),
+            value=node["value"],
+            edges=node["edges"],
+            creator=reference_from_serializable(node["creator"]),
+            annotation=reference_from_serializable(node["annotation"]),
+        )
+        for key, node in data.items()
+    }
+
+
+def dump_plan(plan: ExecutionPlan, path: str):
+    dump_with_buffers(
+        {
+            "version": PLAN_FORMAT_VERSION,
+            "class": import_path(plan.klass),
+            "func_name": plan.func_name,
+            "init_graph": graph_to_serializable(plan.init_graph),
+            "init_order": plan.init_order,
+            "func_graph": graph_to_serializable(plan.func_graph),
+            "func_order": plan.func_order,
+            "logger_paths": logger_paths(plan.init_graph) + plan.logger_paths,
+        },
+        path,
+    )
+
+
+def load_plan(path: str) -> ExecutionPlan:
+    data = load_with_buffers(path)
+    if data.get("version") != PLAN_FORMAT_VERSION:
+        raise ValueError(f"Unsupported plan version {data.get('version')} in {path}")
+    return ExecutionPlan(
+        import_from_path(data["class"]),
+        data["func_name"],
+        graph_from_serializable(data["init_graph"]),
+        data["init_order"],
+        graph_from_serializable(data["func_graph"]),
+        data["func_order"],
+        data["logger_paths"],
+    )
@@ -0,0 +1,80 @@
+import dataclasses
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple
+
+from runner.compact_graph import CompactGraph
+from runner.object_creation import ParameterGraph
+from runner.utils.python import flatten_nested
+
+STRUCTURAL_SUFFIXES = ("__type", "__creator", "__connected_params", "__init", "__const")
+_MISSING = object()
+
+
+@dataclasses.dataclass
+class GraphSkeleton:
+    init_graph: ParameterGraph
+    init_order: List[str]
+    func_graph: ParameterGraph
+    func_order: List[str]
+    init_compact: Optional[CompactGraph] = None
+    func_compact: Optional[CompactGraph] = None
+
+
+def _differs(old: Any, new: Any) -> bool:
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except ValueError:
+        return True
+
+
+def changed_config_paths(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    return [
+        path
+        for path in old.keys() | new.keys()
+        if _differs(old.get(path, _MISSING), new.get(path, _MISSING))
+    ]
+
+
+class IncrementalGraphResolver:
+    def __init__(self):
+        self.structure: Optional[Tuple] = None
+        self.config: Dict[str, Any] = {}
+        self.skeleton: Optional[GraphSkeleton] = None
+
+    def _value_nodes(self, path: str):
+        graphs = (self.skeleton.init_graph, self.skeleton.func_graph)
+        return [graph[path] for graph in graphs if path in graph]
+
+    def _can_patch(self, path: str, old_config: dict, new_config: dict) -> bool:
+        if path not in old_config or path not in new_config:
+            return False
+        if path.endswith(STRUCTURAL_SUFFIXES):
+            return False
+        value = new_config[path]
+        if value is None or value == "None" or isinstance(value, Mapping):
+            return False
+        nodes = self._value_nodes(path)
+        return bool(nodes) and all(
+            not node.edges and node.creator is None and node.value is not None
+            for node in nodes
+        )
+
+    def patch(self, structure: Tuple, config: dict) -> Optional[GraphSkeleton]:
+        if self.skeleton is None or structure != self.structure:
+            return None
+        new_config = flatten_nested(config)
+        changed = changed_config_paths(self.config, new_config)
+        if not all(self._can_patch(path, self.config, new_config) for path in changed):
+            return None
+        for path in changed:
+            for node in self._value_nodes(path):
+                node.value = new_config[path]
+        self.config = new_config
+        return self.skeleton
+
+    def store(self, structure: Tuple, config: dict, skeleton: GraphSkeleton):
+        self.structure = structure
+        self.config = flatten_nested(config)
+        self.skeleton = skeleton
@@ -0,0 +1,182 @@
+import contextlib
+import contextvars
+import dataclasses
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+CREATE_OBJECT_PHASE = "create_object"
+
+_current_tracer: contextvars.ContextVar = contextvars.ContextVar(
+    "runner_tracer", default=None
+)
+
+
+@dataclasses.dataclass
+class PhaseEvent:
+    name: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    depth: int
+    metadata: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class RunTracer:
+    def __init__(self, hooks: List[Callable[[PhaseEvent], None]] = None):
+        self.hooks = list(hooks or [])
+        self.start_hooks: List[Callable[[str, Dict[str, Any]], None]] = []
+        self.events: List[PhaseEvent] = []
+        self.thread_names: Dict[int, str] = {}
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def phase(self, name: str, **metadata):
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        for start_hook in self.start_hooks:
+            start_hook(name, metadata)
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            event = PhaseEvent(
+                name,
+                start_ns,
+                time.perf_counter_ns(),
+                threading.get_ident(),
+                depth,
+                metadata,
+            )
+            self._local.depth = depth
+            self.thread_names.setdefault(event.thread_id, threading.current_thread().name)
+            self.events.append(event)
+            for hook in self.hooks:
+                hook(event)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        phases = {}
+        for event in sorted(self.events, key=lambda event: event.start_ns):
+            phase_summary = phases.setdefault(
+                event.name, {"count": 0, "total": 0.0, "depth": event.depth}
+            )
+            phase_summary["count"] += 1
+            phase_summary["total"] += event.duration
+        return phases
+
+    def format_summary(self) -> str:
+        lines = ["Run timings:"]
+        for name, phase_summary in self.summary().items():
+            indent = "  " * (phase_summary["depth"] + 1)
+            lines.append(
+                f"{indent}{name}: {phase_summary['total'] * 1000:.3f}ms"
+                f" ({phase_summary['count']} calls)"
+            )
+        return "\n".join(lines)
+
+    def to_json(self) -> dict:
+        return {
+            "summary": self.summary(),
+            "events": [
+                {
+                    "name": event.name,
+                    "start_ns": event.start_ns,
+                    "duration_ns": event.end_ns - event.start_ns,
+                    "thread_id": event.thread_id,
+                    "depth": event.depth,
+                    "metadata": event.metadata,
+                }
+                for event in self.events
+            ],
+        }
+
+    def to_chrome_trace(self) -> dict:
+        from runner.utils.hashing import qualified_name
+
+        first_start = min((event.start_ns for event in self.events), default=0)
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in self.thread_names.items()
+        ]
+        for event in self.events:
+            label = event.metadata.get("path")
+            trace_events.append(
+                {
+                    "name": f"{event.name} {label}" if label else event.name,
+                    "cat": event.name,
+                    "ph": "X",
+                    "ts": (event.start_ns - first_start) / 1000,
+                    "dur": (event.end_ns - event.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": event.thread_id,
+                    "args": {
+                        key: qualified_name(value) if callable(value) else value
+                        for key, value in event.metadata.items()
+                    },
+                }
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def current_tracer() -> Optional[RunTracer]:
+    return _current_tracer.get()
+
+
+@contextlib.contextmanager
+def use_tracer(tracer: Optional[RunTracer]):
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+def phase(name: str, **metadata):
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.phase(name, **metadata)
+
+
+@contextlib.contextmanager
+def run_instrumentation(
+    timings: bool = False,
+    timings_out: Optional[str] = None,
+    timing_hooks: List[Callable[[PhaseEvent], None]] = None,
+    trace_out: Optional[str] = None,
+):
+    tracer = current_tracer()
+    if tracer is None and (timings or timings_out or timing_hooks or trace_out):
+        tracer = RunTracer()
+    if tracer is not None and timing_hooks:
+        tracer.hooks.extend(timing_hooks)
+    try:
+        with use_tracer(tracer):
+            yield tracer
+    finally:
+        if tracer is not None and timing_hooks:
+            for hook in timing_hooks:
+                tracer.hooks.remove(hook)
+        if timings:
+            print(tracer.format_summary(), file=sys.stderr)
+        if timings_out:
+            Path(timings_out).write_text(json.dumps(tracer.to_json(), default=repr))
+        if trace_out:
+            Path(trace_out).write_text(
+                json.dumps(tracer.to_chrome_trace(), default=repr)
+            )
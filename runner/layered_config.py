@@ -0,0 +1,64 @@
+from collections.abc import Mapping
+from typing import Any, Iterator, List, Optional, Sequence
+
+
+class LayeredConfig(Mapping):
+    def __init__(self, *layers: Mapping, names: Optional[Sequence[str]] = None):
+        # Layers are ordered from the lowest to the highest priority
+        self.layers: List[Mapping] = list(layers)
+        self.names: List[str] = (
+            list(names) if names is not None else [str(index) for index in range(len(layers))]
+        )
+        if len(self.names) != len(self.layers):
+            raise ValueError("LayeredConfig needs a name for every layer")
+
+    def _lookup(self, key: str):
+        nested, nested_names = [], []
+        for layer, name in zip(reversed(self.layers), reversed(self.names)):
+            if key not in layer:
+                continue
+            value = layer[key]
+            if isinstance(value, Mapping):
+                nested.append(value)
+                nested_names.append(name)
+                continue
+            if nested:
+                # A value below a nested config is hidden by it
+                break
+            return value, name
+        if not nested:
+            raise KeyError(key)
+        return (
+            LayeredConfig(*reversed(nested), names=list(reversed(nested_names))),
+            nested_names[0],
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        return self._lookup(key)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        keys = {}
+        for layer in self.layers:
+            keys.update(dict.fromkeys(layer))
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in layer for layer in self.layers)
+
+    def source(self, key: str) -> Optional[str]:
+        try:
+            return self._lookup(key)[1]
+        except KeyError:
+            return None
+
+    def to_dict(self) -> dict:
+        return {
+            key: value.to_dict() if isinstance(value, LayeredConfig) else value
+            for key, value in self.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(self.names)})"
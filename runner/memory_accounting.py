@@ -0,0 +1,171 @@
+import contextlib
+import dataclasses
+import json
+import os
+import resource
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from runner.resource_usage import max_rss_bytes
+from runner.instrumentation import (
+    PhaseEvent,
+    RunTracer,
+    CREATE_OBJECT_PHASE,
+    current_tracer,
+    use_tracer,
+)
+
+SNAPSHOT_PHASES = ("init_object_creation", "method_object_creation", "target_call")
+TOP_ALLOCATIONS = 10
+
+
+def current_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss() -> int:
+    return max_rss_bytes(resource.getrusage(resource.RUSAGE_SELF))
+
+
+@dataclasses.dataclass
+class PhaseMemory:
+    name: str
+    start_ns: int
+    depth: int
+    path: Optional[str]
+    allocated: int
+    traced_peak: int
+    rss_start: Optional[int]
+    rss_end: Optional[int]
+    peak_rss: int
+    top_lines: List[str] = dataclasses.field(default_factory=list)
+
+
+class MemoryTracker:
+    def __init__(self, top: int = TOP_ALLOCATIONS):
+        self.top = top
+        self.phases: List[PhaseMemory] = []
+        self._stack: List[Dict[str, Any]] = []
+        self._started_tracing = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def phase_started(self, name: str, metadata: Dict[str, Any]):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+        self._stack.append(
+            {
+                "traced": current,
+                "peak": current,
+                "rss": current_rss(),
+                "snapshot": tracemalloc.take_snapshot()
+                if name in SNAPSHOT_PHASES
+                else None,
+            }
+        )
+
+    def phase_finished(self, event: PhaseEvent):
+        frame = self._stack.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, frame["peak"])
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+        top_lines = []
+        if frame["snapshot"] is not None:
+            statistics = tracemalloc.take_snapshot().compare_to(
+                frame["snapshot"], "lineno"
+            )
+            top_lines = [str(statistic) for statistic in statistics[: self.top]]
+        tracemalloc.reset_peak()
+        self.phases.append(
+            PhaseMemory(
+                event.name,
+                event.start_ns,
+                event.depth,
+                event.metadata.get("path"),
+                current - frame["traced"],
+                peak,
+                frame["rss"],
+                current_rss(),
+                peak_rss(),
+                top_lines,
+            )
+        )
+
+    def top_parameters(self) -> List[PhaseMemory]:
+        nodes = [phase for phase in self.phases if phase.name == CREATE_OBJECT_PHASE]
+        return sorted(nodes, key=lambda phase: phase.allocated, reverse=True)[
+            : self.top
+        ]
+
+    def run_phases(self) -> List[PhaseMemory]:
+        return sorted(
+            (phase for phase in self.phases if phase.name != CREATE_OBJECT_PHASE),
+            key=lambda phase: phase.start_ns,
+        )
+
+    def report(self) -> dict:
+        return {
+            "phases": [dataclasses.asdict(phase) for phase in self.run_phases()],
+            "top_parameters": [
+                dataclasses.asdict(phase) for phase in self.top_parameters()
+            ],
+        }
+
+    def format_report(self) -> str:
+        lines = ["Run memory:"]
+        for phase in self.run_phases():
+            lines.append(
+                f"{'  ' * (phase.depth + 1)}{phase.name}: allocated {format_bytes(phase.allocated)},"
+                f" traced peak {format_bytes(phase.traced_peak)},"
+                f" rss {format_bytes(phase.rss_end)}, peak rss {format_bytes(phase.peak_rss)}"
+            )
+        lines.append("Top allocating parameters:")
+        for phase in self.top_parameters():
+            lines.append(f"  {phase.path}: {format_bytes(phase.allocated)}")
+        return "\n".join(lines)
+
+
+def format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "unknown"
+    return f"{size / (1024 * 1024):.2f}MB"
+
+
+@contextlib.contextmanager
+def memory_session(memory: bool = False, memory_out: Optional[str] = None):
+    if not (memory or memory_out):
+        yield None
+        return
+    tracer = current_tracer() or RunTracer()
+    tracker = MemoryTracker()
+    tracker.start()
+    tracer.start_hooks.append(tracker.phase_started)
+    tracer.hooks.append(tracker.phase_finished)
+    try:
+        with use_tracer(tracer):
+            yield tracker
+    finally:
+        tracer.start_hooks.remove(tracker.phase_started)
+        tracer.hooks.remove(tracker.phase_finished)
+        tracker.stop()
+        if memory:
+            print(tracker.format_report(), file=sys.stderr)
+        if memory_out:
+            Path(memory_out).write_text(json.dumps(tracker.report(), default=repr))
@@ -1,10 +1,16 @@
+import contextlib
 import dataclasses
 import functools
-from collections import deque
-from typing import List, Any, Dict, Callable
+from typing import List, Any, Dict, Callable, Set, Tuple
 
+from runner.compact_graph import CompactGraph
+from runner.converters import compile_converter
+from runner.instrumentation import current_tracer, CREATE_OBJECT_PHASE
+from runner.utils.python import flatten_nested, nested_from_paths
+from runner.value_sources import is_value_source, load_value_source
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class ParameterNode:
     type: type  # This is needed only for creating the class, We need to understand what to do with typing module
     value: Any
@@ -12,6 +18,8 @@ class ParameterNode:
         str, str
     ]  # Maps from edge path to parameter name as it is used in the class
     creator: Callable = None
+    # Typing annotations (Optional, Union, List[...]) that only drive value conversion
+    annotation: Any = dataclasses.field(default=None, compare=False)
 
 
 ParameterGraph = Dict[str, ParameterNode]
@@ -26,6 +34,22 @@ def search_close_edge_in_data(mapping: Dict[str, Any], edge: str) -> str:
     return None
 
 
+def dependency_closure(graph: ParameterGraph, paths: List[str]) -> Tuple[Set[str], Set[str]]:
+    needed, external = set(), set()
+    stack = list(paths)
+    while stack:
+        path = stack.pop()
+        if path in needed:
+            continue
+        if path not in graph:
+            external.add(path)
+            continue
+        needed.add(path)
+        for edge in graph[path].edges:
+            stack.append(search_close_edge_in_data(graph, edge) or edge.split(".")[0])
+    return needed, external
+
+
 def find_closes_edge_in_nested_from_mapping(
     mapping: Dict[str, Any], edge: str, additional_nodes: Dict[str, Any] = None
 ) -> str:
@@ -47,72 +71,130 @@ def get_value_from_created_objects(created: Dict[str, Any], edge: str) -> Any:
 
 
 def topological_sort(
-    graph: ParameterGraph, additional_nodes: Dict[str, Any]
+    graph: ParameterGraph,
+    additional_nodes: Dict[str, Any],
+    compact: CompactGraph = None,
 ) -> List[str]:
-    in_degree = {node: 0 for node in graph}
-    nodes = list(graph.values())
-    for node in nodes[:]:
-        for neighbor in node.edges:
-            neighbor = find_closes_edge_in_nested_from_mapping(
-                graph, neighbor , additional_nodes
-            )
-            if neighbor not in graph and neighbor in additional_nodes:
-                node_value = additional_nodes[neighbor]
-                graph[neighbor] = ParameterNode(
-                    value=node_value, type=type(node_value), edges={}
-                )
-                in_degree[neighbor] = 1
-            else:
-                in_degree[neighbor] += 1
-    # Initialize queue with nodes that have in-degree 0
-    queue = deque([node for node in graph if in_degree[node] == 0])
-
-    topological_order = []
-    while queue:
-        node_key = queue.popleft()
-        node_key = find_closes_edge_in_nested_from_mapping(graph, node_key)
-        node = graph[node_key]
-        topological_order.append(node_key)
-
-        for neighbor in node.edges:
-            neighbor = find_closes_edge_in_nested_from_mapping(graph, neighbor)
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+    compact = compact or CompactGraph.from_graph(graph, additional_nodes)
+    return [compact.paths[path_id] for path_id in compact.sort()]
 
-    if len(topological_order) != len(graph):
-        raise ValueError("Graph has at least one cycle")
 
-    return list(reversed(topological_order))
+def topological_levels(
+    graph: ParameterGraph, additional_nodes: Dict[str, Any]
+) -> List[List[str]]:
+    compact = CompactGraph.from_graph(graph, additional_nodes)
+    return [
+        [compact.paths[path_id] for path_id in level] for level in compact.levels()
+    ]
+
+
+def dependency_value(
+    compact: CompactGraph, created: Dict[str, Any], edge_id: int
+) -> Any:
+    base_obj = created[compact.paths[compact.targets[edge_id]]]
+    suffix = compact.suffixes[edge_id]
+    if suffix is None:
+        return base_obj
+    return eval(f"base_obj.{suffix}")
 
 
 def create_objects(
-    graph: ParameterGraph, additional_objects: Dict[str, Any] = None
+    graph: ParameterGraph,
+    additional_objects: Dict[str, Any] = None,
+    order: List[str] = None,
+    compact: CompactGraph = None,
 ) -> Dict[str, Any]:
     additional_objects = additional_objects or {}
-    order = topological_sort(graph, additional_objects)
+    # A compact graph built for the same structure (and additional keys) can be reused between calls
+    compact = compact or CompactGraph.from_graph(graph, additional_objects)
+    order = order or [compact.paths[path_id] for path_id in compact.sort()]
     created_objects = {}
+    tracer = current_tracer()
 
     for node_key in order:
+        if node_key not in graph:
+            created_objects[node_key] = additional_objects[node_key]
+            continue
         node = graph[node_key]
         dependencies = {
-            node.edges[neighbor]: get_value_from_created_objects(
-                created_objects, neighbor
+            compact.argument_names[edge_id]: dependency_value(
+                compact, created_objects, edge_id
             )
-            for neighbor in node.edges
+            for edge_id in compact.edge_range(compact.table.ids[node_key])
         }
         creator = node.creator or create_object
-        created_objects[node_key] = creator(node, dependencies)
+        node_phase = (
+            tracer.phase(
+                CREATE_OBJECT_PHASE,
+                path=node_key,
+                type=node.type,
+                creator=node.creator,
+            )
+            if tracer is not None
+            else contextlib.nullcontext()
+        )
+        with node_phase:
+            created_objects[node_key] = creator(node, dependencies)
 
     return created_objects
 
 
+def values_to_overrides(graph: ParameterGraph, values: Dict[str, Any]) -> Dict[str, Any]:
+    overrides, leaf_values = {}, {}
+    # Nested and dotted keys both end on the graph paths, a dict for a leaf parameter stays its value
+    for path, value in flatten_nested(nested_from_paths(values)).items():
+        node_path = search_close_edge_in_data(graph, path)
+        if node_path is None:
+            raise ValueError(f"{path} is not a parameter of the call")
+        if node_path == path:
+            overrides[path] = value
+        else:
+            leaf_values.setdefault(node_path, {})[path[len(node_path) + 1 :]] = value
+    return overrides | {
+        path: nested_from_paths(values) for path, values in leaf_values.items()
+    }
+
+
+def create_with_overrides(
+    graph: ParameterGraph,
+    created_objects: Dict[str, Any],
+    order: List[str],
+    overrides: Dict[str, Any],
+) -> Dict[str, Any]:
+    affected = set(overrides)
+    for node_key in order:
+        if node_key in graph and any(
+            (search_close_edge_in_data(graph, edge) or edge) in affected
+            for edge in graph[node_key].edges
+        ):
+            affected.add(node_key)
+    # Only the overridden nodes and what depends on them are created again, with the usual conversions,
+    # the other nodes keep their objects but stay in the graph so edges resolve to the same paths
+    changed_graph = {
+        key: ParameterNode(None, created_objects[key], {}, existing_value)
+        if key not in affected
+        else dataclasses.replace(node, value=overrides[key])
+        if key in overrides
+        else node
+        for key, node in graph.items()
+    }
+    return create_objects(changed_graph, created_objects, order)
+
+
+def existing_value(node: ParameterNode, dependencies: Dict[str, Any]) -> Any:
+    return node.value
+
+
 def create_object(node: ParameterNode, dependencies: Dict[str, Any]):
     if node.value is None and node.type is None:
         return None
-    if node.value is not None and isinstance(node.value, str) and node.type != str:
+    if is_value_source(node.value):
+        return load_value_source(node.value)
+    if isinstance(node.value, str) and node.type is None:
+        return compile_converter(node.annotation)(node.value)
+    if isinstance(node.value, str) and node.type != str:
         try:
-            return node.type(node.value)
+            return compile_converter(node.type)(node.value)
         except ValueError:
             pass
     return node.value or node.type(**dependencies)
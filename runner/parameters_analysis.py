@@ -1,22 +1,25 @@
 import dataclasses
-import importlib
 import inspect
 import logging
 import typing
 from collections import defaultdict
 from collections import deque
+from collections.abc import Mapping
 from dataclasses import field
 from logging import Logger
 from types import ModuleType
 from typing import Dict, Pattern, Any, Optional, List
 
-from runner.dynamic_loading import find_class_by_name, find_subclasses
+from runner.dynamic_loading import find_subclasses
+from runner.instrumentation import phase
+from runner.layered_config import LayeredConfig
 from runner.object_creation import ParameterGraph, ParameterNode
 from runner.utils.python import PRIMITIVES, notation_belong_to_typing, location_in_dict
+from runner.type_resolver import default_type_resolver
 from runner.utils.regex import get_first_value_for_matching_patterns
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ParameterHierarchy:
     type: type  # This is needed only for creating the class, We need to understand what to do with typing module
     value: Any
@@ -24,13 +27,15 @@ class ParameterHierarchy:
     path_in_tree: str = ""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CliParam:
     type: type
     multiple: bool
     default: Any
     name: str
     flag: bool = False
+    # List values that may also be given as an @file: source
+    value_source: bool = False
 
 
 ParameterType = Dict[str, ParameterHierarchy]
@@ -84,19 +89,8 @@ def get_path_and_name(path: str):
 
 def create_type_from_name(module: ModuleType, param_type: Any, only_class: bool = True):
     if isinstance(param_type, str):
-        if "." in param_type:
-            module_name, class_name = get_path_and_name(param_type)
-            try:
-                class_type = getattr(importlib.import_module(module_name), class_name)
-            except ModuleNotFoundError:
-                class_type = None
-        else:
-            class_type = find_class_by_name(module, param_type, only_class)
-        if class_type is None:
-            class_type = eval(param_type)
-    else:
-        class_type = param_type
-    return class_type
+        return default_type_resolver.resolve(module, param_type, only_class)
+    return param_type
 
 
 def extract_type_from_annotation(annotation):
@@ -226,7 +220,8 @@ def cli_parameters_for_calling(
                     True,
                 )
             )
-            sub_classes = find_subclasses(base_module, param_type)
+            with phase("subclass_discovery", path=full_param_path, type=param_type):
+                sub_classes = find_subclasses(base_module, param_type)
             for sub_class in set(sub_classes + [param_type]):
                 klass_parameters = cli_parameters_for_calling(
                     sub_class,
@@ -241,7 +236,13 @@ def cli_parameters_for_calling(
             typing.get_args(param_type)[0], True
         ):
             parameters += [
-                CliParam(typing.get_args(param_type)[0], True, None, full_param_path),
+                CliParam(
+                    typing.get_args(param_type)[0],
+                    True,
+                    None,
+                    full_param_path,
+                    value_source=True,
+                ),
                 CliParam(str, True, None, create_const_param_name(full_param_path)),
             ]
         else:
@@ -264,15 +265,22 @@ def extract_value_from_settings(
 ):
     full_param_name = f"{initials}{param_name}"
     value = (
-        key_value_config.get(param_name) if isinstance(key_value_config, dict) else None
+        key_value_config.get(param_name) if isinstance(key_value_config, Mapping) else None
     )
     if value is not None:
-        logger.info(f"Parameter {full_param_name} has a value of {value} from config")
+        source = (
+            f" ({key_value_config.source(param_name)})"
+            if isinstance(key_value_config, LayeredConfig)
+            else ""
+        )
+        logger.info(
+            f"Parameter {full_param_name} has a value of {value} from config{source}"
+        )
         return value
 
     value = (
         key_value_config_default.get(param_name)
-        if isinstance(key_value_config_default, dict)
+        if isinstance(key_value_config_default, Mapping)
         else None
     )
     if value is not None:
@@ -443,9 +451,13 @@ def needed_parameters_for_calling(
 
         if param_value == "None":
             final_parameter = ParameterNode(None, None, connected_params, creator)
-        elif param_value is not None and not isinstance(param_value, dict):
+        elif param_value is not None and not isinstance(param_value, Mapping):
             final_parameter = ParameterNode(
-                param_type, param_value, connected_params, creator
+                param_type,
+                param_value,
+                connected_params,
+                creator,
+                value.annotation if notation_belong_to_typing(value.annotation) else None,
             )
             logger.info(f"Parameter {full_param_path} has a value of {param_value}")
         elif (
@@ -477,7 +489,7 @@ def needed_parameters_for_calling(
             final_parameter = None
         if (
             final_parameter
-            and final_parameter.type
+            and isinstance(final_parameter.type, type)
             and not isinstance(final_parameter.value, final_parameter.type)
             and final_parameter.value is not None
         ):
@@ -0,0 +1,261 @@
+import contextvars
+import dataclasses
+import threading
+from concurrent.futures import Future
+from logging import Logger
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+from runner.compact_graph import CompactGraph
+from runner.constants import PIPELINE_SEPARATOR, PipelineSpec, is_pipeline
+from runner.instrumentation import current_tracer, phase
+from runner.object_creation import (
+    ParameterGraph,
+    ParameterNode,
+    create_objects,
+    dependency_closure,
+    only_creation_relevant_parameters_from_created,
+    topological_sort,
+)
+from runner.parameters_analysis import Rules
+from runner.profiling import profiled
+
+
+
+@dataclasses.dataclass
+class MethodStep:
+    name: str
+    edges: Dict[str, str]
+
+
+@dataclasses.dataclass
+class MethodGraph:
+    graph: ParameterGraph
+    order: List[str]
+
+
+@dataclasses.dataclass
+class RegisteredObject:
+    definition: List[Tuple[str, ParameterNode]]
+    future: Future
+
+
+def node_definition(graph: ParameterGraph, path: str) -> List[Tuple[str, ParameterNode]]:
+    needed, _ = dependency_closure(graph, [path])
+    return [(key, graph[key]) for key in sorted(needed)]
+
+
+def same_definition(
+    definition: List[Tuple[str, ParameterNode]], other: List[Tuple[str, ParameterNode]]
+) -> bool:
+    try:
+        return definition == other
+    except ValueError:
+        # Values without a single truth value (arrays) are not compared, the node is created again
+        return False
+
+
+def parse_pipeline(spec: PipelineSpec) -> Dict[str, MethodStep]:
+    if isinstance(spec, str):
+        spec = [name.strip() for name in spec.split(PIPELINE_SEPARATOR) if name.strip()]
+    if not isinstance(spec, dict):
+        spec = {
+            name: [spec[index - 1]] if index else [] for index, name in enumerate(spec)
+        }
+    steps = {}
+    for name, dependencies in spec.items():
+        unknown = [dependency for dependency in dependencies if dependency not in spec]
+        if unknown:
+            raise ValueError(f"Method {name} depends on unknown methods {unknown}")
+        steps[name] = MethodStep(name, {dependency: dependency for dependency in dependencies})
+    return steps
+
+
+def pipeline_levels(steps: Dict[str, MethodStep]) -> List[List[str]]:
+    compact = CompactGraph.from_graph(steps)
+    return [[compact.paths[path_id] for path_id in level] for level in compact.levels()]
+
+
+def pipeline_methods(spec: PipelineSpec) -> List[str]:
+    return [name for level in pipeline_levels(parse_pipeline(spec)) for name in level]
+
+
+def run_pipeline(
+    algorithm_class: type,
+    spec: PipelineSpec,
+    default_config: dict,
+    config: dict,
+    default_rules: Rules,
+    rules: Rules,
+    module: ModuleType,
+    add_options_from_outside_packages: bool,
+    logger: Logger,
+    *,
+    use_logger: bool,
+    compile_construction: bool = False,
+    profiler: Optional[Any] = None,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    from runner.run import resolve_parameters_graph
+
+    steps = parse_pipeline(spec)
+    init_graph = resolve_parameters_graph(
+        algorithm_class,
+        None,
+        default_config,
+        config,
+        default_rules,
+        rules,
+        module,
+        add_options_from_outside_packages,
+        logger,
+    )
+    if "logger" in init_graph and use_logger:
+        init_graph["logger"].value = logger
+    with phase("topological_sort"):
+        init_order = topological_sort(dict(init_graph), {})
+    method_graphs = resolve_method_graphs(
+        algorithm_class,
+        pipeline_methods(spec),
+        init_order,
+        default_config,
+        config,
+        default_rules,
+        rules,
+        module,
+        add_options_from_outside_packages,
+        logger,
+    )
+    return execute_pipeline(
+        algorithm_class,
+        steps,
+        init_graph,
+        init_order,
+        method_graphs,
+        logger,
+        compile_construction=compile_construction,
+        profiler=profiler,
+        workers=workers,
+    )
+
+
+def resolve_method_graphs(
+    klass: type,
+    methods: List[str],
+    init_order: List[str],
+    default_config: dict,
+    config: dict,
+    default_rules: Rules,
+    rules: Rules,
+    module: ModuleType,
+    add_options_from_outside_packages: bool,
+    logger: Logger,
+) -> Dict[str, MethodGraph]:
+    from runner.run import resolve_parameters_graph
+
+    init_nodes = dict.fromkeys(key for key in init_order if "." not in key)
+    method_graphs = {}
+    for method in methods:
+        graph = resolve_parameters_graph(
+            klass,
+            method,
+            default_config,
+            config,
+            default_rules,
+            rules,
+            module,
+            add_options_from_outside_packages,
+            logger,
+        )
+        with phase("topological_sort", method=method):
+            order = topological_sort(dict(graph), init_nodes)
+        method_graphs[method] = MethodGraph(graph, order)
+    return method_graphs
+
+
+def execute_pipeline(
+    algorithm_class: type,
+    steps: Dict[str, MethodStep],
+    init_graph: ParameterGraph,
+    init_order: List[str],
+    method_graphs: Dict[str, MethodGraph],
+    logger: Logger,
+    *,
+    compile_construction: bool = False,
+    profiler: Optional[Any] = None,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    construct = create_objects
+    if compile_construction:
+        from runner.compiled_plan import create_objects_compiled
+
+        construct = create_objects_compiled
+    with phase("init_object_creation"):
+        all_init_params = construct(init_graph, order=init_order)
+    init_params = only_creation_relevant_parameters_from_created(all_init_params)
+    with phase("algorithm_construction", type=algorithm_class), profiled(profiler):
+        algorithm = algorithm_class(**init_params)
+
+    # Parameters the methods have in common (same path and definition) are created once for the pipeline,
+    # the first method to reach a path claims it and the others wait for its object
+    registry: Dict[str, RegisteredObject] = {}
+    registry_lock = threading.Lock()
+
+    def create_method_objects(method: str) -> Dict[str, Any]:
+        method_graph = method_graphs[method]
+        definitions = {
+            key: node_definition(method_graph.graph, key) for key in method_graph.graph
+        }
+        with registry_lock:
+            reused = {
+                key: registry[key].future
+                for key, definition in definitions.items()
+                if key in registry and same_definition(registry[key].definition, definition)
+            }
+            claimed = {key: Future() for key in definitions if key not in registry}
+            for key, future in claimed.items():
+                registry[key] = RegisteredObject(definitions[key], future)
+        graph = {key: node for key, node in method_graph.graph.items() if key not in reused}
+        try:
+            # Reused paths were claimed by methods that registered earlier, so waiting never cycles
+            additional = init_params | {key: future.result() for key, future in reused.items()}
+            with phase("method_object_creation", method=method, reused=len(reused)):
+                created = construct(graph, additional, method_graph.order)
+        except BaseException as error:
+            for future in claimed.values():
+                future.set_exception(error)
+            raise
+        for key, future in claimed.items():
+            future.set_result(created[key])
+        return created
+
+    def call_method(method: str):
+        run_parameters = create_method_objects(method)
+        func_parameters = only_creation_relevant_parameters_from_created(run_parameters)
+        logger.info(f"Start running with {algorithm}-{method}")
+        with phase("target_call", function=method), profiled(profiler):
+            return getattr(algorithm, method)(**func_parameters)
+
+    results = {}
+    levels = pipeline_levels(steps)
+    tracer = current_tracer()
+    # Profilers and memory tracking keep a single stack per run, so they keep the methods on one thread
+    sequential = profiler is not None or (tracer is not None and tracer.start_hooks)
+    if workers <= 1 or sequential or all(len(level) == 1 for level in levels):
+        for level in levels:
+            for method in level:
+                results[method] = call_method(method)
+        return results
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for level in levels:
+            # Each thread runs in a copy of the caller's context so its phases reach the run tracer
+            futures = {
+                method: pool.submit(contextvars.copy_context().run, call_method, method)
+                for method in level
+            }
+            for method, future in futures.items():
+                results[method] = future.result()
+    return results
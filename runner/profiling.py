@@ -0,0 +1,120 @@
+import contextlib
+import cProfile
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Set
+
+from runner.constants import CPROFILE, PROFILERS, SAMPLE
+
+DEFAULT_PROFILE_OUTPUTS = {CPROFILE: "run.prof", SAMPLE: "run.collapsed"}
+TRUNCATED_STACK = "[truncated]"
+
+
+class CProfileProfiler:
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    @contextlib.contextmanager
+    def profiling(self):
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+
+    def dump(self, path: str):
+        self.profile.dump_stats(path)
+
+
+class SamplingProfiler:
+    def __init__(
+        self, interval: float = 0.01, max_depth: int = 256, max_stacks: int = 100_000
+    ):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.max_stacks = max_stacks
+        self.stacks: Counter = Counter()
+        self._targets: Set[int] = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _frame_stack(self, frame) -> str:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                targets = list(self._targets)
+            if not targets:
+                continue
+            frames = sys._current_frames()
+            for thread_id in targets:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = self._frame_stack(frame)
+                if stack not in self.stacks and len(self.stacks) >= self.max_stacks:
+                    stack = TRUNCATED_STACK
+                self.stacks[stack] += 1
+            del frames
+
+    @contextlib.contextmanager
+    def profiling(self):
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._targets.add(thread_id)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._sample, name="runner-sampling-profiler", daemon=True
+                )
+                self._thread.start()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._targets.discard(thread_id)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def dump(self, path: str):
+        self.stop()
+        with Path(path).open("w") as output:
+            for stack, count in self.stacks.most_common():
+                output.write(f"{stack} {count}\n")
+
+
+def create_profiler(profile: Optional[str]):
+    if profile is None:
+        return None
+    if profile == CPROFILE:
+        return CProfileProfiler()
+    if profile == SAMPLE:
+        return SamplingProfiler()
+    raise ValueError(f"Unknown profiler {profile}, choose one of {PROFILERS}")
+
+
+def profiled(profiler):
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.profiling()
+
+
+@contextlib.contextmanager
+def profiling_session(profile: Optional[str], profile_out: Optional[str] = None):
+    profiler = create_profiler(profile)
+    try:
+        yield profiler
+    finally:
+        if profiler is not None:
+            profiler.dump(profile_out or DEFAULT_PROFILE_OUTPUTS[profile])
@@ -0,0 +1,60 @@
+import dataclasses
+import resource
+import sys
+import time
+from typing import Optional
+
+
+@dataclasses.dataclass
+class ResourceUsage:
+    wall_time: float
+    user_time: float
+    system_time: float
+    max_rss: int
+    minor_page_faults: int
+    major_page_faults: int
+    voluntary_context_switches: int
+    involuntary_context_switches: int
+
+
+def max_rss_bytes(usage: resource.struct_rusage) -> int:
+    # Linux reports kilobytes while macOS reports bytes
+    return usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+def usage_delta(
+    before: resource.struct_rusage, after: resource.struct_rusage, wall_time: float
+) -> ResourceUsage:
+    return ResourceUsage(
+        wall_time=wall_time,
+        user_time=after.ru_utime - before.ru_utime,
+        system_time=after.ru_stime - before.ru_stime,
+        max_rss=max_rss_bytes(after),
+        minor_page_faults=after.ru_minflt - before.ru_minflt,
+        major_page_faults=after.ru_majflt - before.ru_majflt,
+        voluntary_context_switches=after.ru_nvcsw - before.ru_nvcsw,
+        involuntary_context_switches=after.ru_nivcsw - before.ru_nivcsw,
+    )
+
+
+class UsageMeasurement:
+    def __init__(self):
+        self.usage: Optional[ResourceUsage] = None
+        self.children_usage: Optional[ResourceUsage] = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self._self_before = resource.getrusage(resource.RUSAGE_SELF)
+        self._children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        wall_time = time.perf_counter() - self._start
+        self.usage = usage_delta(
+            self._self_before, resource.getrusage(resource.RUSAGE_SELF), wall_time
+        )
+        self.children_usage = usage_delta(
+            self._children_before,
+            resource.getrusage(resource.RUSAGE_CHILDREN),
+            wall_time,
+        )
@@ -0,0 +1,92 @@
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from runner.object_creation import ParameterGraph
+from runner.serialization import dump_with_buffers, load_with_buffers
+from runner.utils.hashing import qualified_name, stable_hash
+
+AUTO_CODE_VERSION = "auto"
+CACHE_FILE_SUFFIX = ".pkl5"
+DEFAULT_MAX_CACHE_BYTES = 1 << 30
+
+
+def class_source_fingerprint(klass: type) -> str:
+    source_file = inspect.getsourcefile(klass)
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+
+
+def result_cache_key(
+    klass: type,
+    func_name: str,
+    init_graph: ParameterGraph,
+    func_graph: ParameterGraph,
+    code_version: Optional[str] = None,
+) -> str:
+    if code_version == AUTO_CODE_VERSION:
+        code_version = class_source_fingerprint(klass)
+    return stable_hash(
+        [qualified_name(klass), func_name, init_graph, func_graph, code_version]
+    )
+
+
+class ResultCache:
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: Optional[int] = DEFAULT_MAX_CACHE_BYTES,
+        max_entries: Optional[int] = None,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        path = self._entry_path(key)
+        try:
+            value = load_with_buffers(path)
+        except (FileNotFoundError, ValueError, EOFError, pickle.UnpicklingError):
+            return False, None
+        # The modification time doubles as the LRU access time
+        os.utime(path)
+        return True, value
+
+    def put(self, key: str, value: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            dump_with_buffers(value, temp_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        os.replace(temp_path, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for entry in self.directory.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Evicted by a concurrent run between the listing and the stat
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (
+            (self.max_bytes is not None and total_bytes > self.max_bytes)
+            or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            _, size, oldest = entries.pop(0)
+            try:
+                oldest.unlink()
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
@@ -0,0 +1,79 @@
+import dataclasses
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+COMPLETED_STATUS = "completed"
+FAILED_STATUS = "failed"
+MAX_SUMMARY_LENGTH = 200
+
+
+@dataclasses.dataclass
+class TrialRecord:
+    config_hash: str
+    status: str
+    started_at: float
+    duration: float
+    result: Any = None
+    error: Optional[str] = None
+    config: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    usage: Optional[Dict[str, Dict[str, float]]] = None
+
+
+def summarize_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value[:MAX_SUMMARY_LENGTH]
+    if isinstance(value, dict):
+        return {str(key): summarize_value(inner) for key, inner in value.items()}
+    if isinstance(value, (list, tuple)) and len(value) <= 10:
+        return [summarize_value(inner) for inner in value]
+    return repr(value)[:MAX_SUMMARY_LENGTH]
+
+
+class JsonlResultsStore:
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.records: Dict[str, TrialRecord] = {}
+        self._needs_newline = False
+        if self.path.exists():
+            self.records = {
+                record.config_hash: record for record in self._read_records()
+            }
+
+    def _read_records(self) -> List[TrialRecord]:
+        records = []
+        with self.path.open() as store_file:
+            for line in store_file:
+                self._needs_newline = not line.endswith("\n")
+                try:
+                    records.append(TrialRecord(**json.loads(line)))
+                except (json.JSONDecodeError, TypeError):
+                    # A crash in the middle of a write leaves a truncated last line
+                    continue
+        return records
+
+    def completed_hashes(self) -> Set[str]:
+        return {
+            config_hash
+            for config_hash, record in self.records.items()
+            if record.status == COMPLETED_STATUS
+        }
+
+    def is_completed(self, config_hash: str) -> bool:
+        record = self.records.get(config_hash)
+        return record is not None and record.status == COMPLETED_STATUS
+
+    def append(self, record: TrialRecord):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as store_file:
+            if self._needs_newline:
+                store_file.write("\n")
+                self._needs_newline = False
+            store_file.write(json.dumps(dataclasses.asdict(record), default=repr))
+            store_file.write("\n")
+            store_file.flush()
+            os.fsync(store_file.fileno())
+        self.records[record.config_hash] = record
@@ -1,18 +1,112 @@
+import contextlib
+import dataclasses
+import importlib
+import inspect
 import logging
 import os
 from logging import Logger
-from typing import List, Optional, Dict, Pattern, Any
+from types import ModuleType
+from typing import List, Optional, Dict, Pattern, Any, Union, Callable, TYPE_CHECKING
 
+from runner.compact_graph import CompactGraph
+from runner.converters import compile_converter
 from runner.dynamic_loading import find_class_by_name
+from runner.instrumentation import PhaseEvent, phase, run_instrumentation
+from runner.layered_config import LayeredConfig
 from runner.object_creation import (
     create_objects,
+    create_with_overrides,
     only_creation_relevant_parameters_from_created,
+    topological_sort,
+    values_to_overrides,
+    ParameterGraph,
 )
 from runner.parameters_analysis import (
     needed_parameters_for_calling,
     find_missing_vertaxes,
 )
 from runner.parameters_analysis import Rules
+from runner.pipeline import is_pipeline
+from runner.profiling import profiling_session, profiled
+from runner.resource_usage import ResourceUsage, UsageMeasurement
+from runner.streaming import BatchOptions, StreamOptions, run_batch, stream_result
+from runner.utils.python import nested_from_paths
+
+if TYPE_CHECKING:
+    from runner.incremental import IncrementalGraphResolver
+    from runner.result_cache import ResultCache
+
+
+@dataclasses.dataclass
+class RunResult:
+    value: Any
+    usage: ResourceUsage
+    children_usage: ResourceUsage
+
+
+def run_result(value: Any, measurement: UsageMeasurement, return_usage: bool):
+    if not return_usage:
+        return value
+    return RunResult(value, measurement.usage, measurement.children_usage)
+
+
+def memory_session(memory: bool, memory_out: Optional[str]):
+    if not (memory or memory_out):
+        return contextlib.nullcontext()
+    # tracemalloc and the memory report are loaded only for runs that ask for them
+    from runner import memory_accounting
+
+    return memory_accounting.memory_session(memory, memory_out)
+
+
+def write_result(value: Any, result_out: Optional[str], logger: Optional[Logger]):
+    from runner.serialization import dump_result, result_path
+
+    logger = logger if isinstance(logger, Logger) else logging.getLogger(__name__)
+    path = result_path(value, result_out)
+    if path != result_out:
+        logger.warning(
+            f"{type(value).__name__} result is not an array, saving it to {path} instead of {result_out}"
+        )
+    with phase("result_write"):
+        size = dump_result(value, path)
+    logger.info(f"Saved result ({size} bytes) to {path}")
+
+
+def resolve_parameters_graph(
+    klass: type,
+    func_name: Optional[str],
+    default_config: dict,
+    config: dict,
+    default_rules: Rules,
+    rules: Rules,
+    module: ModuleType,
+    add_options_from_outside_packages: bool,
+    logger: Logger,
+) -> ParameterGraph:
+    graph_name = "method" if func_name else "init"
+    with phase(f"{graph_name}_graph_analysis"):
+        parameters_graph = needed_parameters_for_calling(
+            klass,
+            func_name,
+            default_config,
+            config,
+            default_rules,
+            rules,
+            module,
+            add_options_from_outside_packages,
+            logger=logger,
+        )
+    with phase(f"{graph_name}_missing_vertex_discovery"):
+        return find_missing_vertaxes(
+            parameters_graph,
+            default_config,
+            config,
+            default_rules,
+            rules,
+            module,
+            logger=logger,
+        )
 
 
 def run(
@@ -32,14 +126,122 @@ def run(
     global_settings: dict,
     use_config: Optional[List[str]],
     logger: Logger = None,
+    *,
+    result_cache: Union[str, "ResultCache", None] = None,
+    code_version: Optional[str] = None,
+    graph_resolver: "IncrementalGraphResolver" = None,
+    compile_construction: bool = False,
+    plan_out: Optional[str] = None,
+    timings: bool = False,
+    timings_out: Optional[str] = None,
+    timing_hooks: List[Callable[[PhaseEvent], None]] = None,
+    trace_out: Optional[str] = None,
+    profile: Optional[str] = None,
+    profile_out: Optional[str] = None,
+    memory: bool = False,
+    memory_out: Optional[str] = None,
+    batch_input: Optional[str] = None,
+    batch_output: Optional[str] = None,
+    batch_chunk_size: int = 1,
+    batch_workers: int = 1,
+    stream_out: Optional[str] = None,
+    stream_format: str = "jsonl",
+    stream_flush_every: int = 100,
+    result_out: Optional[str] = None,
+    pipeline_workers: int = 1,
+    shared_objects: Optional[Dict[str, Any]] = None,
+    build_paths: Optional[List[str]] = None,
+    return_usage: bool = False,
     **config,
+):
+    batch = (
+        BatchOptions(batch_input, batch_output, batch_chunk_size, batch_workers)
+        if batch_input
+        else None
+    )
+    stream = (
+        StreamOptions(stream_out, stream_format, stream_flush_every)
+        if stream_out
+        else None
+    )
+    with run_instrumentation(
+        timings, timings_out, timing_hooks, trace_out
+    ), memory_session(memory, memory_out), profiling_session(
+        profile, profile_out
+    ) as profiler, UsageMeasurement() as measurement:
+        value = run_with_instrumentation(
+            class_name=class_name,
+            func_name=func_name,
+            base_module=base_module,
+            default_config=default_config,
+            default_assign_value=default_assign_value,
+            default_assign_type=default_assign_type,
+            default_assign_creator=default_assign_creator,
+            default_assign_connection=default_assign_connection,
+            assign_value=assign_value,
+            assign_type=assign_type,
+            assign_creator=assign_creator,
+            assign_connection=assign_connection,
+            add_options_from_outside_packages=add_options_from_outside_packages,
+            global_settings=global_settings,
+            use_config=use_config,
+            logger=logger,
+            result_cache=result_cache,
+            code_version=code_version,
+            graph_resolver=graph_resolver,
+            compile_construction=compile_construction,
+            plan_out=plan_out,
+            profiler=profiler,
+            batch=batch,
+            stream=stream,
+            pipeline_workers=pipeline_workers,
+            shared_objects=shared_objects,
+            build_paths=build_paths,
+            config=config,
+        )
+        if result_out and not plan_out:
+            write_result(value, result_out, logger)
+    return run_result(value, measurement, return_usage)
+
+
+def run_with_instrumentation(
+    *,
+    class_name: str,
+    func_name: str,
+    base_module: str,
+    default_config: dict,
+    default_assign_value: Dict[Pattern, Any],
+    default_assign_type: Dict[Pattern, Any],
+    default_assign_creator: Dict[Pattern, Any],
+    default_assign_connection: Dict[Pattern, Any],
+    assign_value: Dict[Pattern, Any],
+    assign_type: Dict[Pattern, Any],
+    assign_creator: Dict[Pattern, Any],
+    assign_connection: Dict[Pattern, Any],
+    add_options_from_outside_packages: bool,
+    global_settings: dict,
+    use_config: Optional[List[str]],
+    logger: Optional[Logger],
+    result_cache: Union[str, "ResultCache", None],
+    code_version: Optional[str],
+    graph_resolver: Optional["IncrementalGraphResolver"],
+    compile_construction: bool,
+    plan_out: Optional[str],
+    profiler: Optional[Any],
+    batch: Optional[BatchOptions],
+    stream: Optional[StreamOptions],
+    pipeline_workers: int,
+    shared_objects: Optional[Dict[str, Any]],
+    build_paths: Optional[List[str]],
+    config: dict,
 ):
     use_logger = logger is not None and isinstance(logger, Logger)
     logger = logger or logging.getLogger(__name__)
-    if isinstance(base_module, str):
-        module = __import__(base_module)
-    else:
-        module = base_module
+    with phase("module_import"):
+        if isinstance(base_module, str):
+            module = importlib.import_module(base_module)
+        else:
+            module = base_module
 
     default_rules = Rules(
         value_rules=default_assign_value,
@@ -54,59 +256,222 @@ def run(
         connected_params_rules=assign_connection,
     )
 
-    algorithm_class = find_class_by_name(module, class_name)
+    with phase("class_lookup"):
+        algorithm_class = find_class_by_name(module, class_name)
 
-    if use_config:
-        for config_name in use_config:
-            config = config | global_settings[config_name]
+    with phase("config_merge"):
+        use_config = use_config or []
+        config = LayeredConfig(
+            config,
+            *(global_settings[config_name] for config_name in use_config),
+            names=["cli"] + [f"preset {config_name}" for config_name in use_config],
+        )
 
-    parameters_graph = needed_parameters_for_calling(
-        algorithm_class,
-        None,
-        default_config,
-        config,
-        default_rules,
-        rules,
-        module,
+    if is_pipeline(func_name):
+        if plan_out or batch or stream or build_paths or shared_objects or result_cache is not None:
+            raise ValueError(
+                "Plans, batch inputs, streamed outputs, shared objects and the result cache "
+                f"need a single method, got {func_name}"
+            )
+        from runner.pipeline import run_pipeline
+
+        return run_pipeline(
+            algorithm_class,
+            func_name,
+            default_config,
+            config,
+            default_rules,
+            rules,
+            module,
+            add_options_from_outside_packages,
+            logger,
+            use_logger=use_logger,
+            compile_construction=compile_construction,
+            profiler=profiler,
+            workers=pipeline_workers,
+        )
+
+    structure = (
+        class_name,
+        func_name,
+        module.__name__,
         add_options_from_outside_packages,
-        logger=logger,
-    )
-    parameters_graph = find_missing_vertaxes(
-        parameters_graph,
         default_config,
-        config,
         default_rules,
         rules,
-        module,
-        logger=logger,
     )
+    skeleton = graph_resolver.patch(structure, config) if graph_resolver else None
+    if skeleton is not None:
+        parameters_graph = skeleton.init_graph
+        train_parameters_graph = skeleton.func_graph
+        init_order, func_order = skeleton.init_order, skeleton.func_order
+        init_compact, func_compact = skeleton.init_compact, skeleton.func_compact
+    else:
+        parameters_graph = resolve_parameters_graph(
+            algorithm_class,
+            None,
+            default_config,
+            config,
+            default_rules,
+            rules,
+            module,
+            add_options_from_outside_packages,
+            logger,
+        )
+        train_parameters_graph = resolve_parameters_graph(
+            algorithm_class,
+            func_name,
+            default_config,
+            config,
+            default_rules,
+            rules,
+            module,
+            add_options_from_outside_packages,
+            logger,
+        )
+        init_order, func_order = None, None
+        init_compact, func_compact = None, None
     if "logger" in parameters_graph and use_logger:
         parameters_graph["logger"].value = logger
-    all_init_params = create_objects(parameters_graph)
-    init_params = only_creation_relevant_parameters_from_created(all_init_params)
-    algorithm = algorithm_class(**init_params)
 
-    train_parameters_graph = needed_parameters_for_calling(
+    with phase("topological_sort"):
+        # The compact graphs are built once per structure and shared by sorting and creation
+        init_compact = init_compact or CompactGraph.from_graph(parameters_graph, {})
+        init_order = init_order or topological_sort(
+            dict(parameters_graph), {}, init_compact
+        )
+        init_nodes = dict.fromkeys(key for key in init_order if "." not in key)
+        func_compact = func_compact or CompactGraph.from_graph(
+            train_parameters_graph, init_nodes
+        )
+        func_order = func_order or topological_sort(
+            dict(train_parameters_graph), init_nodes, func_compact
+        )
+    if graph_resolver is not None and skeleton is None:
+        from runner.incremental import GraphSkeleton
+
+        graph_resolver.store(
+            structure,
+            config,
+            GraphSkeleton(
+                parameters_graph,
+                init_order,
+                train_parameters_graph,
+                func_order,
+                init_compact,
+                func_compact,
+            ),
+        )
+    if build_paths:
+        from runner.shared_inputs import build_objects
+
+        with phase("shared_objects_creation", paths=build_paths):
+            return build_objects(
+                parameters_graph,
+                init_order,
+                train_parameters_graph,
+                func_order,
+                build_paths,
+            )
+    if plan_out:
+        from runner.execution_plan import ExecutionPlan, dump_plan
+
+        plan = ExecutionPlan(
+            algorithm_class,
+            func_name,
+            parameters_graph,
+            init_order,
+            train_parameters_graph,
+            func_order,
+        )
+        dump_plan(plan, plan_out)
+        logger.info(f"Saved execution plan for {class_name}-{func_name} to {plan_out}")
+        return plan
+
+    if result_cache is not None and batch is None and stream is None:
+        from runner.result_cache import ResultCache, result_cache_key
+
+        if isinstance(result_cache, str):
+            result_cache = ResultCache(result_cache)
+        cache_key = result_cache_key(
+            algorithm_class,
+            func_name,
+            parameters_graph,
+            train_parameters_graph,
+            code_version,
+        )
+        found, cached_result = result_cache.get(cache_key)
+        if found:
+            logger.info(f"Using cached result {cache_key} for {class_name}-{func_name}")
+            return cached_result
+
+    if shared_objects:
+        from runner.shared_inputs import share_nodes
+
+        parameters_graph, init_order = share_nodes(
+            parameters_graph, init_order, shared_objects
+        )
+        train_parameters_graph, func_order = share_nodes(
+            train_parameters_graph, func_order, shared_objects
+        )
+        init_compact, func_compact = None, None
+    result = execute_graphs(
         algorithm_class,
         func_name,
-        default_config,
-        config,
-        default_rules,
-        rules,
-        module,
-        add_options_from_outside_packages,
-        logger=logger,
-    )
-    train_parameters_graph = find_missing_vertaxes(
+        parameters_graph,
+        init_order,
         train_parameters_graph,
-        default_config,
-        config,
-        default_rules,
-        rules,
-        module,
-        logger=logger,
+        func_order,
+        logger,
+        compile_construction=compile_construction,
+        profiler=profiler,
+        batch=batch,
+        stream=stream,
+        init_compact=init_compact,
+        func_compact=func_compact,
     )
-    run_parameters = create_objects(train_parameters_graph, init_params)
+    if result_cache is not None and batch is None and stream is None:
+        import pickle
+
+        try:
+            result_cache.put(cache_key, result)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            # The cache is best effort, a result that can not be pickled is still returned
+            logger.warning(f"Could not cache the result of {class_name}-{func_name}: {error}")
+    return result
+
+
+def execute_graphs(
+    algorithm_class: type,
+    func_name: str,
+    init_graph: ParameterGraph,
+    init_order: List[str],
+    func_graph: ParameterGraph,
+    func_order: List[str],
+    logger: Logger,
+    *,
+    compile_construction: bool = False,
+    profiler: Optional[Any] = None,
+    batch: Optional[BatchOptions] = None,
+    stream: Optional[StreamOptions] = None,
+    init_compact: Optional[CompactGraph] = None,
+    func_compact: Optional[CompactGraph] = None,
+):
+    construct = create_objects
+    if compile_construction:
+        from runner.compiled_plan import create_objects_compiled
+
+        construct = create_objects_compiled
+    with phase("init_object_creation"):
+        all_init_params = construct(init_graph, order=init_order, compact=init_compact)
+    init_params = only_creation_relevant_parameters_from_created(all_init_params)
+    with phase("algorithm_construction", type=algorithm_class), profiled(profiler):
+        algorithm = algorithm_class(**init_params)
+
+    with phase("method_object_creation"):
+        run_parameters = construct(
+            func_graph, init_params, func_order, compact=func_compact
+        )
     func_parameters = only_creation_relevant_parameters_from_created(run_parameters)
     function = getattr(algorithm, func_name)
 
@@ -114,4 +479,110 @@ def run(
     logger.info(
         f"Train with {os.linesep.join([f'{key}={value}' for key, value in func_parameters.items()])}"
     )
-    function(**func_parameters)
+    if batch is not None:
+        prepare = batch_record_parameters(function, func_graph, func_order, run_parameters)
+        with phase("batch_calls", function=func_name), profiled(profiler):
+            return run_batch(function, prepare, batch)
+    with phase("target_call", function=func_name), profiled(profiler):
+        result = function(**func_parameters)
+        if stream is not None:
+            # A generator target does its work while it is consumed, so streaming stays in the call phase
+            result = stream_result(result, stream)
+        return result
+
+
+def batch_record_parameters(
+    function: Callable,
+    func_graph: ParameterGraph,
+    func_order: List[str],
+    run_parameters: Dict[str, Any],
+) -> Callable[[dict], Dict[str, Any]]:
+    signature = inspect.signature(function).parameters
+
+    def convert_default(key: str, value: Any) -> Any:
+        annotation = signature[key].annotation
+        if not isinstance(value, str) or annotation in (inspect.Parameter.empty, str):
+            return value
+        return compile_converter(annotation)(value)
+
+    def record_parameters(record: dict) -> Dict[str, Any]:
+        # A record goes through the graph like the CLI values, nested paths and conversions included
+        record = nested_from_paths(record)
+        # Parameters left to their defaults are not in the graph, only their annotation converts them
+        defaults = {
+            key: convert_default(key, record.pop(key))
+            for key in list(record)
+            if key not in func_graph and key in signature
+        }
+        overrides = values_to_overrides(func_graph, record)
+        created = create_with_overrides(func_graph, run_parameters, func_order, overrides)
+        return only_creation_relevant_parameters_from_created(created) | defaults
+
+    return record_parameters
+
+
+def execute_plan(
+    plan_path: str,
+    logger: Logger = None,
+    *,
+    compile_construction: bool = False,
+    timings: bool = False,
+    timings_out: Optional[str] = None,
+    timing_hooks: List[Callable[[PhaseEvent], None]] = None,
+    trace_out: Optional[str] = None,
+    profile: Optional[str] = None,
+    profile_out: Optional[str] = None,
+    memory: bool = False,
+    memory_out: Optional[str] = None,
+    batch_input: Optional[str] = None,
+    batch_output: Optional[str] = None,
+    batch_chunk_size: int = 1,
+    batch_workers: int = 1,
+    stream_out: Optional[str] = None,
+    stream_format: str = "jsonl",
+    stream_flush_every: int = 100,
+    result_out: Optional[str] = None,
+    return_usage: bool = False,
+):
+    batch = (
+        BatchOptions(batch_input, batch_output, batch_chunk_size, batch_workers)
+        if batch_input
+        else None
+    )
+    stream = (
+        StreamOptions(stream_out, stream_format, stream_flush_every)
+        if stream_out
+        else None
+    )
+    use_logger = logger is not None and isinstance(logger, Logger)
+    logger = logger or logging.getLogger(__name__)
+    with run_instrumentation(
+        timings, timings_out, timing_hooks, trace_out
+    ), memory_session(memory, memory_out), profiling_session(
+        profile, profile_out
+    ) as profiler, UsageMeasurement() as measurement:
+        with phase("plan_loading"):
+            from runner.execution_plan import load_plan
+
+            plan = load_plan(plan_path)
+        if "logger" in plan.init_graph and use_logger:
+            plan.init_graph["logger"].value = logger
+        # Loggers are left out of plans, the one of this execution takes their place
+        for path in plan.logger_paths:
+            plan.init_graph[path].value = logger
+        value = execute_graphs(
+            plan.klass,
+            plan.func_name,
+            plan.init_graph,
+            plan.init_order,
+            plan.func_graph,
+            plan.func_order,
+            logger,
+            compile_construction=compile_construction,
+            profiler=profiler,
+            batch=batch,
+            stream=stream,
+        )
+        if result_out:
+            write_result(value, result_out, logger)
+    return run_result(value, measurement, return_usage)
@@ -0,0 +1,75 @@
+import pickle
+import struct
+from pathlib import Path
+from typing import Any
+
+BUFFERS_MAGIC = b"RPB5"
+_HEADER = struct.Struct("<4sI")
+_LENGTH = struct.Struct("<Q")
+NUMPY_RESULT_SUFFIX = ".npy"
+PICKLE_RESULT_SUFFIX = ".pkl5"
+
+
+def dump_with_buffers(obj: Any, path: str) -> int:
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    with Path(path).open("wb") as output:
+        output.write(_HEADER.pack(BUFFERS_MAGIC, len(raw_buffers)))
+        output.write(_LENGTH.pack(len(payload)))
+        for raw in raw_buffers:
+            output.write(_LENGTH.pack(raw.nbytes))
+        output.write(payload)
+        for raw in raw_buffers:
+            output.write(raw)
+        return output.tell()
+
+
+def load_with_buffers(path: str) -> Any:
+    data = bytearray(Path(path).stat().st_size)
+    with Path(path).open("rb") as source:
+        source.readinto(data)
+    view = memoryview(data)
+    magic, buffers_count = _HEADER.unpack_from(view)
+    if magic != BUFFERS_MAGIC:
+        raise ValueError(f"{path} is not a pickled buffers file")
+    offset = _HEADER.size
+    lengths = []
+    for _ in range(buffers_count + 1):
+        lengths.append(_LENGTH.unpack_from(view, offset)[0])
+        offset += _LENGTH.size
+    chunks = []
+    for length in lengths:
+        chunks.append(view[offset : offset + length])
+        offset += length
+    return pickle.loads(chunks[0], buffers=chunks[1:])
+
+
+def is_array_like(obj: Any) -> bool:
+    return hasattr(obj, "__array__") and not isinstance(obj, type)
+
+
+def result_path(obj: Any, path: str) -> str:
+    if Path(path).suffix == NUMPY_RESULT_SUFFIX and not is_array_like(obj):
+        return str(Path(path).with_suffix(PICKLE_RESULT_SUFFIX))
+    return path
+
+
+def dump_result(obj: Any, path: str) -> int:
+    if Path(path).suffix != NUMPY_RESULT_SUFFIX:
+        return dump_with_buffers(obj, path)
+    if not is_array_like(obj):
+        raise ValueError(f"Can not save a {type(obj).__name__} result to {path}")
+    import numpy
+
+    with Path(path).open("wb") as output:
+        numpy.save(output, numpy.asarray(obj), allow_pickle=False)
+        return output.tell()
+
+
+def load_result(path: str) -> Any:
+    if Path(path).suffix != NUMPY_RESULT_SUFFIX:
+        return load_with_buffers(path)
+    import numpy
+
+    return numpy.load(path, mmap_mode="r")
@@ -0,0 +1,157 @@
+import contextlib
+import dataclasses
+import os
+import pickle
+import sys
+from multiprocessing import resource_tracker, util
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from runner.object_creation import (
+    ParameterGraph,
+    ParameterNode,
+    create_objects,
+    dependency_closure,
+    existing_value,
+    search_close_edge_in_data,
+)
+
+_attached_blocks: Dict[str, SharedMemory] = {}
+_attach_lock = None
+
+
+@dataclasses.dataclass
+class SharedObject:
+    payload: bytes
+    blocks: List[Tuple[str, int]]
+
+
+def share_nodes(
+    graph: ParameterGraph, order: List[str], shared_objects: Dict[str, Any]
+) -> Tuple[ParameterGraph, List[str]]:
+    shared = [path for path in shared_objects if path in graph]
+    if not shared:
+        return graph, order
+    prefixes = tuple(f"{path}." for path in shared)
+    graph = {
+        key: node for key, node in graph.items() if not key.startswith(prefixes)
+    }
+    for path in shared:
+        graph[path] = ParameterNode(None, shared_objects[path], {}, existing_value)
+    return graph, [key for key in order if not key.startswith(prefixes)]
+
+
+def build_objects(
+    init_graph: ParameterGraph,
+    init_order: List[str],
+    func_graph: ParameterGraph,
+    func_order: List[str],
+    paths: List[str],
+) -> Dict[str, Any]:
+    missing = [path for path in paths if path not in init_graph and path not in func_graph]
+    if missing:
+        raise ValueError(f"Shared paths {missing} are not parameters of the run")
+    func_needed, func_external = dependency_closure(
+        func_graph, [path for path in paths if path not in init_graph]
+    )
+    init_needed, _ = dependency_closure(
+        init_graph, [path for path in paths if path in init_graph] + list(func_external)
+    )
+    # Only the shared paths and what they depend on are created, not the whole run
+    created = create_objects(
+        {key: init_graph[key] for key in init_needed},
+        order=[key for key in init_order if key in init_needed],
+    )
+    if func_needed:
+        created |= create_objects(
+            {key: func_graph[key] for key in func_needed},
+            created,
+            [key for key in func_order if key in func_needed or key in created],
+        )
+    return {path: created[path] for path in paths}
+
+
+def publish(obj: Any) -> Tuple[SharedObject, List[SharedMemory]]:
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    blocks, memories = [], []
+    for buffer in buffers:
+        raw = buffer.raw()
+        memory = SharedMemory(create=True, size=max(raw.nbytes, 1))
+        memory.buf[: raw.nbytes] = raw
+        memories.append(memory)
+        blocks.append((memory.name, raw.nbytes))
+    return SharedObject(payload, blocks), memories
+
+
+def tracker_name(memory: SharedMemory) -> Optional[str]:
+    # Only POSIX blocks are tracked, under their public name with the leading slash
+    return f"/{memory.name}" if os.name == "posix" else None
+
+
+def attach_block(name: str) -> SharedMemory:
+    memory = _attached_blocks.get(name)
+    if memory is not None:
+        return memory
+    if sys.version_info >= (3, 13):
+        memory = SharedMemory(name=name, track=False)
+    else:
+        # Attaching registers the block with the resource tracker the pool shares with the publisher,
+        # the lock keeps each register and unregister pair together across the workers
+        with _attach_lock or contextlib.nullcontext():
+            memory = SharedMemory(name=name)
+            if tracker_name(memory) is not None:
+                resource_tracker.unregister(tracker_name(memory), "shared_memory")
+    # Views into the block live as long as the objects built on them, detach_all closes it
+    _attached_blocks[name] = memory
+    return memory
+
+
+def detach_all():
+    for name, memory in list(_attached_blocks.items()):
+        try:
+            memory.close()
+        except BufferError:
+            # Objects built on the block are still alive, exiting the process unmaps it
+            continue
+        del _attached_blocks[name]
+
+
+def init_worker(lock: Any = None):
+    global _attach_lock
+    _attach_lock = lock
+    # Pool workers exit through multiprocessing's finalizers, atexit handlers do not run there
+    util.Finalize(None, detach_all, exitpriority=0)
+
+
+def attach(shared: SharedObject) -> Any:
+    buffers = [
+        attach_block(name).buf[:size].toreadonly() for name, size in shared.blocks
+    ]
+    return pickle.loads(shared.payload, buffers=buffers)
+
+
+def attach_all(shared: Dict[str, SharedObject]) -> Dict[str, Any]:
+    return {path: attach(shared_object) for path, shared_object in shared.items()}
+
+
+@contextlib.contextmanager
+def published(objects: Optional[Dict[str, Any]]) -> Iterator[Dict[str, SharedObject]]:
+    if not objects:
+        yield {}
+        return
+    memories = []
+    try:
+        shared = {}
+        for path, obj in objects.items():
+            shared[path], path_memories = publish(obj)
+            memories += path_memories
+        yield shared
+    finally:
+        for memory in memories:
+            memory.close()
+            if sys.version_info < (3, 13) and tracker_name(memory) is not None:
+                # Workers (all shut down by now) dropped the block from the shared tracker,
+                # unlink expects it registered
+                resource_tracker.register(tracker_name(memory), "shared_memory")
+            memory.unlink()
@@ -0,0 +1,225 @@
+import collections
+import contextlib
+import csv
+import dataclasses
+import itertools
+import json
+import struct
+import sys
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional
+
+from runner.constants import STREAM_FORMATS
+
+STDIO_PATH = "-"
+FRAME_HEADER = struct.Struct("<Q")
+
+
+@dataclasses.dataclass
+class BatchOptions:
+    input_path: str
+    output_path: Optional[str] = None
+    chunk_size: int = 1
+    workers: int = 1
+
+
+@dataclasses.dataclass
+class StreamOptions:
+    output_path: Optional[str] = None
+    format: str = "jsonl"
+    flush_every: int = 100
+    flush_interval: float = 1.0
+
+
+@contextlib.contextmanager
+def open_stream(path: Optional[str], mode: str, default: IO):
+    if path is None or path == STDIO_PATH:
+        yield default
+        return
+    with open(path, mode) as stream:
+        yield stream
+
+
+def read_jsonl(stream: IO) -> Iterator[dict]:
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError(f"Batch input line {line_number} is not a JSON object")
+        yield record
+
+
+class JsonlSink:
+    def __init__(self, stream: IO):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, record: Any):
+        self.stream.write(json.dumps(record, default=repr))
+        self.stream.write("\n")
+        self.count += 1
+
+    def flush(self):
+        self.stream.flush()
+
+
+class CsvSink:
+    def __init__(self, stream: IO):
+        self.stream = stream
+        self.writer = None
+        self.count = 0
+
+    def write(self, record: Any):
+        if self.writer is None:
+            if isinstance(record, Mapping):
+                self.writer = csv.DictWriter(self.stream, fieldnames=list(record))
+                self.writer.writeheader()
+            else:
+                self.writer = csv.writer(self.stream)
+        if not isinstance(record, (Mapping, list, tuple)):
+            record = [record]
+        self.writer.writerow(record)
+        self.count += 1
+
+    def flush(self):
+        self.stream.flush()
+
+
+class FrameSink:
+    def __init__(self, stream: IO):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, record: Any):
+        import pickle
+
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        self.stream.write(FRAME_HEADER.pack(len(payload)))
+        self.stream.write(payload)
+        self.count += 1
+
+    def flush(self):
+        self.stream.flush()
+
+
+def read_frames(stream: IO) -> Iterator[Any]:
+    import pickle
+
+    while header := stream.read(FRAME_HEADER.size):
+        (size,) = FRAME_HEADER.unpack(header)
+        yield pickle.loads(stream.read(size))
+
+
+SINKS = {"jsonl": JsonlSink, "csv": CsvSink, "frames": FrameSink}
+
+
+@contextlib.contextmanager
+def open_sink(path: Optional[str], format: str):
+    if format == "frames":
+        with open_stream(path, "wb", sys.stdout.buffer) as stream:
+            yield FrameSink(stream)
+        return
+    with open_stream(path, "w", sys.stdout) as stream:
+        yield SINKS[format](stream)
+
+
+def is_stream(value: Any) -> bool:
+    return isinstance(value, Iterator)
+
+
+def stream_items(
+    items: Iterable[Any],
+    sink,
+    flush_every: int = 100,
+    flush_interval: float = 1.0,
+) -> int:
+    # The producer only advances after its last item was written, so it never runs ahead of the sink
+    last_flush = time.monotonic()
+    for item in items:
+        sink.write(item)
+        now = time.monotonic()
+        if sink.count % flush_every == 0 or now - last_flush >= flush_interval:
+            sink.flush()
+            last_flush = now
+    sink.flush()
+    return sink.count
+
+
+def stream_result(value: Any, options: StreamOptions) -> Any:
+    if not is_stream(value):
+        return value
+    with open_sink(options.output_path, options.format) as sink:
+        return stream_items(value, sink, options.flush_every, options.flush_interval)
+
+
+def chunks(records: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(records)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def call_with_record(
+    function: Callable, prepare: Callable[[dict], Dict[str, Any]], index: int, record: dict
+) -> Dict[str, Any]:
+    try:
+        return {"index": index, "result": function(**prepare(record))}
+    except Exception as error:
+        return {"index": index, "error": f"{type(error).__name__}: {error}"}
+
+
+def stream_calls(
+    function: Callable,
+    prepare: Callable[[dict], Dict[str, Any]],
+    records: Iterable[dict],
+    sink: JsonlSink,
+    chunk_size: int = 1,
+    workers: int = 1,
+) -> int:
+    chunk_size = max(chunk_size, 1)
+    if workers <= 1:
+        for chunk in chunks(enumerate(records), chunk_size):
+            for index, record in chunk:
+                sink.write(call_with_record(function, prepare, index, record))
+            sink.flush()
+        return sink.count
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The target is called once per record, up to max(workers, chunk_size) records are in flight
+    # and the results are still written in input order
+    window = max(workers, chunk_size)
+    pending = collections.deque()
+
+    def write_oldest():
+        sink.write(pending.popleft().result())
+        if sink.count % chunk_size == 0:
+            sink.flush()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, record in enumerate(records):
+            pending.append(pool.submit(call_with_record, function, prepare, index, record))
+            if len(pending) >= window:
+                write_oldest()
+        while pending:
+            write_oldest()
+    sink.flush()
+    return sink.count
+
+
+def run_batch(
+    function: Callable, prepare: Callable[[dict], Dict[str, Any]], options: BatchOptions
+) -> int:
+    with open_stream(options.input_path, "r", sys.stdin) as input_stream, open_stream(
+        options.output_path, "w", sys.stdout
+    ) as output_stream:
+        return stream_calls(
+            function,
+            prepare,
+            read_jsonl(input_stream),
+            JsonlSink(output_stream),
+            options.chunk_size,
+            options.workers,
+        )
@@ -0,0 +1,297 @@
+import dataclasses
+import inspect
+import itertools
+import logging
+import math
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging import Logger
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from runner.incremental import IncrementalGraphResolver
+from runner.results_store import (
+    JsonlResultsStore,
+    TrialRecord,
+    COMPLETED_STATUS,
+    FAILED_STATUS,
+    summarize_value,
+)
+from runner.resource_usage import ResourceUsage, UsageMeasurement
+from runner.run import run
+from runner.utils.hashing import stable_hash
+from runner.utils.python import merge_nested, nested_from_paths
+
+if TYPE_CHECKING:
+    from runner.shared_inputs import SharedObject
+
+MINIMIZE = "min"
+MAXIMIZE = "max"
+
+# Keyword options of run change how a trial executes or reports (caches, hooks, outputs), not its result
+EXECUTION_OPTIONS = frozenset(
+    name
+    for name, parameter in inspect.signature(run).parameters.items()
+    if parameter.kind == inspect.Parameter.KEYWORD_ONLY and name != "code_version"
+) | {"logger"}
+
+_worker_graph_resolver = None
+
+
+def worker_graph_resolver() -> IncrementalGraphResolver:
+    global _worker_graph_resolver
+    if _worker_graph_resolver is None:
+        _worker_graph_resolver = IncrementalGraphResolver()
+    return _worker_graph_resolver
+
+
+def grid_trials(grid: Dict[str, List[Any]]) -> List[dict]:
+    paths = list(grid.keys())
+    return [
+        nested_from_paths(dict(zip(paths, values)))
+        for values in itertools.product(*grid.values())
+    ]
+
+
+def trial_config_hash(run_kwargs: Dict[str, Any]) -> str:
+    return stable_hash(
+        {key: value for key, value in run_kwargs.items() if key not in EXECUTION_OPTIONS}
+    )
+
+
+def trial_usage(usage: ResourceUsage) -> Dict[str, float]:
+    # max_rss is the high-water mark of the (reused) worker process, not what this trial used
+    return {key: value for key, value in dataclasses.asdict(usage).items() if key != "max_rss"}
+
+
+def picklable_run_kwargs(run_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value.__name__ if isinstance(value, ModuleType) else value
+        for key, value in run_kwargs.items()
+    }
+
+
+def build_shared_objects(
+    runner: Callable, shared: List[str], run_kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    return runner(**run_kwargs, build_paths=shared)
+
+
+def run_trial(
+    runner: Callable,
+    config_hash: str,
+    trial: dict,
+    run_kwargs: Dict[str, Any],
+    incremental: bool = False,
+    shared: Optional[Dict[str, "SharedObject"]] = None,
+) -> TrialRecord:
+    if incremental:
+        run_kwargs = run_kwargs | {"graph_resolver": worker_graph_resolver()}
+    if shared:
+        from runner.shared_inputs import attach_all
+
+        run_kwargs = run_kwargs | {"shared_objects": attach_all(shared)}
+    started_at = time.time()
+    error = None
+    try:
+        with UsageMeasurement() as measurement:
+            result = runner(**run_kwargs)
+    except Exception:
+        error = traceback.format_exc()
+    usage = {
+        "self": trial_usage(measurement.usage),
+        "children": trial_usage(measurement.children_usage),
+    }
+    if error is not None:
+        return TrialRecord(
+            config_hash,
+            FAILED_STATUS,
+            started_at,
+            measurement.usage.wall_time,
+            error=error,
+            config=trial,
+            usage=usage,
+        )
+    return TrialRecord(
+        config_hash,
+        COMPLETED_STATUS,
+        started_at,
+        measurement.usage.wall_time,
+        result=summarize_value(result),
+        config=trial,
+        usage=usage,
+    )
+
+
+def run_sweep(
+    trials: List[dict],
+    store: Optional[JsonlResultsStore] = None,
+    max_workers: int = 1,
+    runner: Callable = run,
+    logger: Logger = None,
+    incremental: bool = False,
+    shared: Optional[List[str]] = None,
+    usage_hooks: List[Callable[[UsageMeasurement], None]] = None,
+    **run_kwargs,
+) -> List[TrialRecord]:
+    logger = logger or logging.getLogger(__name__)
+    pending = {}
+    records = {}
+    trial_hashes = []
+    for trial in trials:
+        trial_kwargs = picklable_run_kwargs(merge_nested(run_kwargs, trial))
+        config_hash = trial_config_hash(trial_kwargs)
+        trial_hashes.append(config_hash)
+        if store is not None and store.is_completed(config_hash):
+            logger.info(f"Skipping trial {config_hash}, already completed")
+            records[config_hash] = store.records[config_hash]
+        else:
+            pending[config_hash] = (trial, trial_kwargs)
+
+    def finish(record: TrialRecord):
+        if record.status == FAILED_STATUS:
+            logger.warning(f"Trial {record.config_hash} failed:\n{record.error}")
+        if store is not None:
+            store.append(record)
+        records[record.config_hash] = record
+
+    shared_objects = {}
+    if shared and pending:
+        logger.info(f"Building shared parameters {shared} once for the sweep")
+        shared_objects = build_shared_objects(
+            runner, shared, picklable_run_kwargs(run_kwargs) | {"logger": logger}
+        )
+
+    # Pool workers are reused between trials, so the sweep as a whole is measured here: the workers
+    # are children of this process once the pool shut down
+    with UsageMeasurement() as sweep_measurement:
+        if max_workers <= 1:
+            for config_hash, (trial, trial_kwargs) in pending.items():
+                finish(
+                    run_trial(
+                        runner,
+                        config_hash,
+                        trial,
+                        trial_kwargs
+                        | {"logger": logger}
+                        | ({"shared_objects": shared_objects} if shared_objects else {}),
+                        incremental,
+                    )
+                )
+        else:
+            import multiprocessing
+
+            from runner.shared_inputs import init_worker, published
+
+            # The blocks are created before the pool so the workers share the parent's resource tracker,
+            # and unlinked after it shut down, once every worker has dropped them from the tracker
+            with published(shared_objects) as shared_blocks, ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=init_worker,
+                initargs=(multiprocessing.Lock(),),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        run_trial,
+                        runner,
+                        config_hash,
+                        trial,
+                        trial_kwargs,
+                        incremental,
+                        shared_blocks,
+                    )
+                    for config_hash, (trial, trial_kwargs) in pending.items()
+                ]
+                for future in as_completed(futures):
+                    finish(future.result())
+
+    sweep_usage = (
+        sweep_measurement.children_usage if max_workers > 1 else sweep_measurement.usage
+    )
+    logger.info(
+        f"Sweep of {len(pending)} trials took {sweep_usage.wall_time:.2f}s, "
+        f"{sweep_usage.user_time + sweep_usage.system_time:.2f}s CPU, "
+        f"peak RSS {sweep_usage.max_rss} bytes"
+    )
+    for hook in usage_hooks or []:
+        hook(sweep_measurement)
+
+    return [records[config_hash] for config_hash in trial_hashes]
+
+
+def metric_from_result(result: Any, metric: Optional[str]) -> float:
+    value = result[metric] if metric is not None else result
+    return float(value)
+
+
+def ranked_completed_indices(
+    records: List[TrialRecord],
+    metric: Optional[str],
+    mode: str,
+    logger: Logger = None,
+) -> List[int]:
+    logger = logger or logging.getLogger(__name__)
+    scores = {}
+    for index, record in enumerate(records):
+        if record.status != COMPLETED_STATUS:
+            continue
+        try:
+            scores[index] = metric_from_result(record.result, metric)
+        except (KeyError, IndexError, TypeError, ValueError):
+            logger.warning(
+                f"Trial {record.config_hash} result has no {metric or 'numeric'} metric,"
+                f" ranking it as failed"
+            )
+    return sorted(scores, key=scores.get, reverse=mode == MAXIMIZE)
+
+
+def successive_halving(
+    trials: List[dict],
+    budget_path: str,
+    min_budget: int,
+    max_budget: int,
+    eta: int = 3,
+    metric: Optional[str] = None,
+    mode: str = MINIMIZE,
+    store: Optional[JsonlResultsStore] = None,
+    max_workers: int = 1,
+    runner: Callable = run,
+    logger: Logger = None,
+    incremental: bool = False,
+    shared: Optional[List[str]] = None,
+    **run_kwargs,
+) -> List[TrialRecord]:
+    logger = logger or logging.getLogger(__name__)
+    if mode not in (MINIMIZE, MAXIMIZE):
+        raise ValueError(f"mode should be {MINIMIZE} or {MAXIMIZE}, got {mode}")
+    if eta < 2:
+        raise ValueError(f"eta should be at least 2, got {eta}")
+    if not 0 < min_budget <= max_budget:
+        raise ValueError(
+            f"Budgets should satisfy 0 < min_budget <= max_budget, got {min_budget} and {max_budget}"
+        )
+    survivors = trials
+    budget = min_budget
+    while True:
+        rung_trials = [
+            merge_nested(trial, nested_from_paths({budget_path: budget}))
+            for trial in survivors
+        ]
+        logger.info(f"Running {len(rung_trials)} trials with {budget_path}={budget}")
+        records = run_sweep(
+            rung_trials,
+            store,
+            max_workers,
+            runner,
+            logger,
+            incremental,
+            shared,
+            **run_kwargs,
+        )
+        ranked = ranked_completed_indices(records, metric, mode, logger)
+        if budget >= max_budget or len(ranked) <= 1:
+            return [records[index] for index in ranked]
+        promoted = max(1, math.ceil(len(survivors) / eta))
+        survivors = [survivors[index] for index in ranked[:promoted]]
+        budget = min(budget * eta, max_budget)
@@ -0,0 +1,134 @@
+import ast
+import builtins
+import importlib
+import typing
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from runner.dynamic_loading import find_class_by_name
+from runner.utils.python import flatten_nested
+
+MAX_RESOLVED_TYPES = 1024
+TYPE_SUFFIX = "__type"
+CREATOR_SUFFIX = "__creator"
+CONST_SUFFIX = "__const"
+IMMUTABLE_LITERALS = (int, float, complex, str, bytes, bool, type(None))
+
+_UNRESOLVED = object()
+_NOT_CACHED = object()
+
+
+def import_dotted_name(name: str) -> Any:
+    parts = name.split(".")
+    for end in range(len(parts) - 1, 0, -1):
+        try:
+            obj = importlib.import_module(".".join(parts[:end]))
+        except (ImportError, ValueError):
+            continue
+        try:
+            for attribute in parts[end:]:
+                obj = getattr(obj, attribute)
+        except AttributeError:
+            return _UNRESOLVED
+        return obj
+    return _UNRESOLVED
+
+
+def literal_value(name: str) -> Any:
+    try:
+        return ast.literal_eval(name)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return _UNRESOLVED
+
+
+class TypeResolver:
+    def __init__(self, max_size: int = MAX_RESOLVED_TYPES):
+        self.max_size = max_size
+        self._cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, module: ModuleType, name: str, only_class: bool) -> Any:
+        if "." in name:
+            resolved = import_dotted_name(name)
+        else:
+            resolved = find_class_by_name(module, name, only_class) or _UNRESOLVED
+        if resolved is _UNRESOLVED and hasattr(builtins, name):
+            resolved = getattr(builtins, name)
+        if resolved is _UNRESOLVED and hasattr(typing, name):
+            resolved = getattr(typing, name)
+        if resolved is _UNRESOLVED:
+            resolved = literal_value(name)
+        return resolved
+
+    def resolve(self, module: ModuleType, name: str, only_class: bool = True) -> Any:
+        key = (getattr(module, "__name__", module), name, only_class)
+        resolved = self._cache.get(key, _NOT_CACHED)
+        if resolved is not _NOT_CACHED:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        else:
+            self.misses += 1
+            resolved = self._lookup(module, name, only_class)
+            # Mutable literals are rebuilt on every call so runs do not share them
+            if resolved is _UNRESOLVED or not isinstance(resolved, (list, dict, set)):
+                self._cache[key] = resolved
+                if len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+        if resolved is _UNRESOLVED:
+            raise NameError(f"Can not resolve {name} from {key[0]}")
+        return resolved
+
+    def warm_up(
+        self, module: ModuleType, names: Iterable[Tuple[str, bool]]
+    ) -> Dict[str, Any]:
+        resolved = {}
+        for name, only_class in names:
+            try:
+                resolved[name] = self.resolve(module, name, only_class)
+            except NameError:
+                resolved[name] = None
+        return resolved
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def type_names_from_config(config: dict) -> Iterable[Tuple[str, bool]]:
+    for path, value in flatten_nested(config).items():
+        if not isinstance(value, str):
+            continue
+        if path.endswith(TYPE_SUFFIX):
+            yield value, True
+        elif path.endswith((CREATOR_SUFFIX, CONST_SUFFIX)):
+            yield value, False
+
+
+def type_names_from_rules(rules) -> Iterable[Tuple[str, bool]]:
+    for value in rules.type_rules.values():
+        if isinstance(value, str):
+            yield value, True
+    for value in rules.creator_rules.values():
+        if isinstance(value, str):
+            yield value, False
+    for pattern, value in rules.value_rules.items():
+        if isinstance(value, str) and pattern.pattern.endswith(CONST_SUFFIX):
+            yield value, False
+
+
+default_type_resolver = TypeResolver()
+
+
+def warm_up_type_resolver(
+    module: ModuleType,
+    config: Optional[dict] = None,
+    rules: Iterable = (),
+    resolver: TypeResolver = default_type_resolver,
+) -> Dict[str, Any]:
+    names = list(type_names_from_config(config or {}))
+    for rule_set in rules:
+        names += list(type_names_from_rules(rule_set))
+    return resolver.warm_up(module, names)
@@ -5,6 +5,7 @@ from typing import Any
 import click
 from click import Option
 from runner.utils.regex import convert_str_keys_to_pattern
+from runner.value_sources import FILE_SOURCE_PREFIX
 
 
 @dataclasses.dataclass
@@ -13,6 +14,19 @@ class ParamTrueName:
     value: Any
 
 
+class ValueSourceType(click.ParamType):
+    name = "value-source"
+
+    def __init__(self, inner_type: Any):
+        self.inner_type = click.types.convert_type(inner_type)
+
+    def convert(self, value, param, ctx):
+        # File sources are loaded only when the object is created
+        if isinstance(value, str) and value.startswith(FILE_SOURCE_PREFIX):
+            return value
+        return self.inner_type.convert(value, param, ctx)
+
+
 def convert_assign_to_pattern(ctx, param, value):
     return convert_str_keys_to_pattern(dict(value))
 
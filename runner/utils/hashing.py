@@ -0,0 +1,77 @@
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+from types import ModuleType
+from typing import Any, Pattern
+
+from runner.value_sources import FILE_SOURCE_PREFIX
+
+
+def qualified_name(obj: Any) -> str:
+    module = getattr(obj, "__module__", None)
+    name = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", None)
+    if module and name:
+        return f"{module}.{name}"
+    return repr(obj)
+
+
+def _json_key(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, default=str)
+
+
+def value_source_form(value: str) -> Any:
+    path = value[len(FILE_SOURCE_PREFIX) :]
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {"__value_source__": os.path.abspath(path), "missing": True}
+    # The file is read when the parameter is created, so the key follows its stat, not just its name
+    return {
+        "__value_source__": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def canonical_form(obj: Any) -> Any:
+    if isinstance(obj, str) and obj.startswith(FILE_SOURCE_PREFIX):
+        return value_source_form(obj)
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, dict):
+        return {
+            "__dict__": sorted(
+                (
+                    [canonical_form(key), canonical_form(value)]
+                    for key, value in obj.items()
+                ),
+                key=_json_key,
+            )
+        }
+    if isinstance(obj, (list, tuple)):
+        return [canonical_form(value) for value in obj]
+    if isinstance(obj, (set, frozenset)):
+        return {
+            "__set__": sorted((canonical_form(value) for value in obj), key=_json_key)
+        }
+    if dataclasses.is_dataclass(obj) and not inspect.isclass(obj):
+        return {
+            "__dataclass__": qualified_name(type(obj)),
+            "fields": [
+                canonical_form(getattr(obj, field.name))
+                for field in dataclasses.fields(obj)
+            ],
+        }
+    if isinstance(obj, Pattern):
+        return {"__pattern__": obj.pattern}
+    if isinstance(obj, ModuleType):
+        return {"__module__": obj.__name__}
+    if inspect.isclass(obj) or inspect.isroutine(obj):
+        return {"__type__": qualified_name(obj)}
+    return {"__repr__": f"{qualified_name(type(obj))}:{obj!r}"}
+
+
+def stable_hash(obj: Any) -> str:
+    return hashlib.sha256(_json_key(canonical_form(obj)).encode()).hexdigest()
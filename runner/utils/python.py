@@ -1,3 +1,7 @@
+import types
+import typing
+from collections.abc import Mapping
+
 PRIMITIVES = (
     bool,
     str,
@@ -29,6 +33,11 @@ PRIMITIVES = (
 
 
 def notation_belong_to_typing(annotation):
+    if isinstance(annotation, types.UnionType):
+        return True
+    # list[...] keeps its own handling as a multiple option
+    if isinstance(annotation, types.GenericAlias):
+        return typing.get_origin(annotation) is not list
     return hasattr(annotation, "__module__") and annotation.__module__ == "typing"
 
 
@@ -36,8 +45,40 @@ def location_in_dict(data: dict, location: str):
     nested_location = location.split(".")
     for i in range(len(nested_location), 0, -1):
         inner_location = ".".join(nested_location[:i])
-        if isinstance(data, dict) and inner_location in data:
+        if isinstance(data, Mapping) and inner_location in data:
             data = data[inner_location]
         else:
             return None
     return data
+
+
+def merge_nested(base: dict, override: dict) -> dict:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_nested(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def nested_from_paths(flat: dict, separator: str = ".") -> dict:
+    nested = {}
+    for path, value in flat.items():
+        current = nested
+        keys = path.split(separator)
+        for key in keys[:-1]:
+            current = current.setdefault(key, {})
+        current[keys[-1]] = value
+    return nested
+
+
+def flatten_nested(data: dict, prefix: str = "", separator: str = ".") -> dict:
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, Mapping) and value:
+            flat.update(flatten_nested(value, f"{path}{separator}", separator))
+        else:
+            flat[path] = value
+    return flat
@@ -0,0 +1,62 @@
+import ast
+from pathlib import Path
+from typing import Any, Iterator
+
+FILE_SOURCE_PREFIX = "@file:"
+NUMPY_SUFFIXES = (".npy",)
+TEXT_SUFFIXES = (".txt",)
+
+
+def parse_scalar(text: str) -> Any:
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+class TextValues:
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self.path.open() as values_file:
+            for line in values_file:
+                line = line.strip()
+                if line:
+                    yield parse_scalar(line)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r})"
+
+
+def source_path(value: Any) -> str:
+    if isinstance(value, (list, tuple)) and len(value) == 1:
+        value = value[0]
+    if isinstance(value, str) and value.startswith(FILE_SOURCE_PREFIX):
+        return value[len(FILE_SOURCE_PREFIX) :]
+    return None
+
+
+def is_value_source(value: Any) -> bool:
+    return source_path(value) is not None
+
+
+def load_numpy_array(path: str):
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            f"Loading {path} needs numpy, install it to use {FILE_SOURCE_PREFIX} arrays"
+        ) from None
+    return numpy.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def load_value_source(value: Any) -> Any:
+    path = source_path(value)
+    if path.endswith(NUMPY_SUFFIXES):
+        return load_numpy_array(path)
+    if path.endswith(TEXT_SUFFIXES):
+        return TextValues(path)
+    raise ValueError(
+        f"Unsupported value source {path}, use one of {NUMPY_SUFFIXES + TEXT_SUFFIXES}"
+    )
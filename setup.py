@@ -9,8 +9,10 @@ setup(
     name="cli-class-runner",
     version="0.0.1",
     author="Yedidya Kfir",
-    packages=find_packages(exclude=["test", "test.*"]),
+    python_requires=">=3.10",
+    packages=find_packages(exclude=["test", "test.*", "benchmarks", "benchmarks.*"]),
     install_requires=requirements,
+    extras_require={"arrays": ["numpy"], "plans": ["cloudpickle"]},
     entry_points={"console_scripts": ["run_cli = my_package.__main__:main"]},
     description="This package will allow you to run any function and class of your code from the cli. "
     "This can be helpfull for quick checks as well as running multiple expreriments with differnt parameters.",
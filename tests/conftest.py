@@ -2,6 +2,7 @@ import tests.mock_module.a
 from torch.optim import SGD
 
 from runner.object_creation import ParameterNode
+from tests import mock_module
 from tests.mock_module.a import MockB, MockD
 from tests.mock_module.sub_mock_module.b import BasicNet
 from tests.mock_module.utils import create_opt
@@ -15,3 +16,21 @@ EXPECTED_GRAPH = {
     "c": ParameterNode(type=BasicNet, value=None, edges={}),
     "f": ParameterNode(type=MockD, value=None, edges={}),
 }
+
+RUN_KWARGS = dict(
+    class_name="MockI",
+    func_name="func",
+    base_module=mock_module,
+    default_config={},
+    default_assign_value={},
+    default_assign_type={},
+    default_assign_creator={},
+    default_assign_connection={},
+    assign_value={},
+    assign_type={},
+    assign_creator={},
+    assign_connection={},
+    add_options_from_outside_packages=True,
+    global_settings={},
+    use_config=None,
+)
@@ -25,3 +25,29 @@ class MockB(MockBase):
 
 class MockD:
     pass
+
+
+class MockI:
+    def __init__(self, a: int = 1):
+        self.a = a
+
+    def func(self, b: int = 2):
+        return self.a * b
+
+
+class MockPipeline:
+    def __init__(self, a: int = 1):
+        self.a = a
+        self.calls = []
+
+    def fit(self, b: int = 2):
+        self.calls.append("fit")
+        self.a *= b
+        return self.a
+
+    def evaluate(self, c: int = 3):
+        self.calls.append("evaluate")
+        return self.a + c
+
+    def report(self, b: int = 2):
+        return list(self.calls)
@@ -0,0 +1,102 @@
+from benchmarks.startup import cumulative_import_time, eagerly_imported
+from benchmarks.suite import (
+    Scale,
+    compare_results,
+    regressions,
+    results_to_json,
+    run_benchmarks,
+    BenchmarkResult,
+)
+from benchmarks.synthetic import synthetic_graph
+from runner.object_creation import create_objects
+
+
+def test__synthetic_graph__creates_objects():
+    # Arrange
+    graph = synthetic_graph(5)
+
+    # Act
+    created = create_objects(graph)
+
+    # Assert
+    assert created["node0"] == 1
+    assert created["node2"] == {"p0": 1, "p1": {"p0": 1}}
+
+
+def test__run_benchmarks__small_scale():
+    # Arrange
+    scale = Scale(
+        depth=3,
+        wide_modules=2,
+        classes_per_module=2,
+        rules=10,
+        graph_nodes=50,
+        large_graph_nodes=100,
+        repeat=1,
+    )
+
+    # Act
+    results = run_benchmarks(scale)
+
+    # Assert
+    assert {result.name for result in results} == {
+        "find_subclasses",
+        "get_command",
+        "get_first_value_for_matching_patterns",
+        "topological_sort",
+        "topological_sort_large",
+        "topological_levels",
+        "create_objects",
+    }
+
+
+def test__run_benchmarks__selects_by_recorded_name():
+    # Arrange
+    scale = Scale(rules=10, rule_lookups=5, repeat=1)
+
+    # Act
+    results = run_benchmarks(scale, ["get_first_value"])
+
+    # Assert
+    assert [result.name for result in results] == ["get_first_value_for_matching_patterns"]
+
+
+def test__regressions__past_threshold():
+    # Arrange
+    baseline = results_to_json(
+        [BenchmarkResult("fast", 1.0, 1.0, 1), BenchmarkResult("slow", 1.0, 1.0, 1)],
+        Scale(),
+    )
+    current = results_to_json(
+        [BenchmarkResult("fast", 1.1, 1.1, 1), BenchmarkResult("slow", 1.5, 1.5, 1)],
+        Scale(),
+    )
+
+    # Act
+    result = regressions(compare_results(baseline, current), threshold=0.2)
+
+    # Assert
+    assert result == {"slow": 1.5}
+
+
+def test__cumulative_import_time__parses_module_line():
+    # Arrange
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        300 |   runner.run\n"
+        "import time:       200 |       1500 | runner.command_cli\n"
+    )
+
+    # Act
+    result = cumulative_import_time(stderr, "runner.command_cli")
+
+    # Assert
+    assert result == 0.0015
+
+
+def test__command_cli__keeps_optional_features_lazy():
+    # Act
+    result = eagerly_imported()
+
+    # Assert
+    assert result == []
@@ -1,6 +1,10 @@
+import json
+
 from runner.command_cli import RunCallableCLI
+from runner.run import run, execute_plan
+from runner.utils.click import ValueSourceType
 from click.testing import CliRunner
-from tests.mock_module.a import MockB
+from tests.mock_module.a import MockB, MockI, MockPipeline
 from tests.mock_module.sub_mock_module.b import MockH
 from unittest.mock import MagicMock
 from tests import mock_module
@@ -45,6 +49,23 @@ def test__RunCLIAlgorithm__sanity():
         "assign_creator": {},
         "assign_connection": {},
         "use_config": (),
+        "result_cache": None,
+        "code_version": None,
+        "timings": False,
+        "timings_out": None,
+        "trace_out": None,
+        "profile": None,
+        "profile_out": None,
+        "memory": False,
+        "memory_out": None,
+        "batch_input": None,
+        "batch_output": None,
+        "batch_chunk_size": 1,
+        "batch_workers": 1,
+        "stream_out": None,
+        "stream_format": "jsonl",
+        "stream_flush_every": 100,
+        "result_out": None,
     }
 
     cli = RunCallableCLI(
@@ -92,4 +113,95 @@ def test__cli_initialiation_by_other_classes__sanity():
 
 
 def test__cli__nested_parameter_maniuplation():
-    pass
\ No newline at end of file
+    pass
+
+
+def test__plan_and_execute_commands(tmp_path):
+    # Arrange
+    runner = CliRunner()
+    plan_path = str(tmp_path / "plan.bin")
+    plan_executor = MagicMock()
+    cli = RunCallableCLI(
+        {"MockI": (MockI, "func")}, run, True, mock_module, plan_executor=plan_executor
+    )
+
+    # Act
+    plan_result = runner.invoke(cli, ["plan", "MockI", "--a", "3", "--out", plan_path])
+    execute_result = runner.invoke(cli, ["execute", plan_path])
+
+    # Assert
+    assert plan_result.exit_code == 0
+    assert execute_result.exit_code == 0
+    plan_executor.assert_called_once_with(
+        plan_path=plan_path,
+        timings=False,
+        timings_out=None,
+        trace_out=None,
+        profile=None,
+        profile_out=None,
+        memory=False,
+        memory_out=None,
+        batch_input=None,
+        batch_output=None,
+        batch_chunk_size=1,
+        batch_workers=1,
+        stream_out=None,
+        stream_format="jsonl",
+        stream_flush_every=100,
+        result_out=None,
+    )
+    assert execute_plan(plan_path) == 6
+
+
+def test__pipeline_command__shares_options_between_methods():
+    # Arrange
+    runner = CliRunner()
+    cli = RunCallableCLI(
+        {"train": (MockPipeline, ["fit", "evaluate", "report"])}, run, True, mock_module
+    )
+
+    # Act
+    result = runner.invoke(cli, ["train", "--help"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert result.output.count("--b ") == 1
+    assert "--c " in result.output
+    assert "--pipeline-workers" in result.output
+
+
+def test__command_cli__timings_include_command_creation(tmp_path):
+    # Arrange
+    runner = CliRunner()
+    timings_path = tmp_path / "timings.json"
+    cli = RunCallableCLI({"MockI": (MockI, "func")}, run, True, mock_module)
+
+    # Act
+    result = runner.invoke(
+        cli, ["MockI", "--a", "3", "--timings-out", str(timings_path)]
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    names = {event["name"] for event in json.loads(timings_path.read_text())["events"]}
+    assert {"cli_init_parameters_analysis", "cli_options_creation", "target_call"} <= names
+
+
+class MockSeeds:
+    def func(self, seeds: list[int]):
+        return seeds
+
+
+def test__command_cli__only_list_values_accept_value_sources():
+    # Arrange
+    cli = RunCallableCLI({"MockSeeds": (MockSeeds, "func")}, run, True, mock_module)
+
+    # Act
+    options = {
+        param.name: param.type
+        for param in cli.get_command(None, "MockSeeds").params
+    }
+
+    # Assert
+    assert isinstance(options["seeds"], ValueSourceType)
+    assert not isinstance(options["seeds__connected_params"], ValueSourceType)
@@ -0,0 +1,84 @@
+import pytest
+
+from runner.compact_graph import CompactGraph
+from runner.object_creation import ParameterNode, topological_sort, topological_levels
+
+
+def test__compact_graph__interns_edges_into_shared_arrays():
+    # Arrange
+    graph = {
+        "a": ParameterNode(type=dict, value=None, edges={"b": "x", "c.inner": "y"}),
+        "b": ParameterNode(type=int, value=1, edges={}),
+        "c": ParameterNode(type=dict, value=None, edges={"external.attr": "z"}),
+    }
+
+    # Act
+    compact = CompactGraph.from_graph(graph, {"external": object()})
+
+    # Assert
+    assert compact.paths == ["a", "b", "c", "external"]
+    assert list(compact.offsets) == [0, 2, 2, 3]
+    assert list(compact.targets) == [1, 2, 3]
+    assert compact.suffixes == [None, "inner", "attr"]
+    assert compact.argument_names == ["x", "y", "z"]
+    assert compact.is_external(3)
+
+
+def test__compact_graph__missing_edge():
+    # Arrange
+    graph = {"a": ParameterNode(type=dict, value=None, edges={"missing": "x"})}
+
+    # Act + Assert
+    with pytest.raises(ValueError, match="missing"):
+        CompactGraph.from_graph(graph)
+
+
+def test__topological_sort__does_not_change_graph():
+    # Arrange
+    graph = {"a": ParameterNode(type=dict, value=None, edges={"external": "x"})}
+
+    # Act
+    order = topological_sort(graph, {"external": 1})
+
+    # Assert
+    assert order == ["external", "a"]
+    assert list(graph) == ["a"]
+
+
+def test__parameter_node__has_no_instance_dict():
+    # Arrange
+    node = ParameterNode(type=int, value=1, edges={})
+
+    # Act + Assert
+    with pytest.raises(AttributeError):
+        node.__dict__
+
+
+def test__topological_levels__groups_independent_nodes():
+    # Arrange
+    graph = {
+        "a": ParameterNode(type=dict, value=None, edges={"b": "x", "c": "y"}),
+        "b": ParameterNode(type=dict, value=None, edges={"d": "x"}),
+        "c": ParameterNode(type=int, value=1, edges={}),
+        "d": ParameterNode(type=int, value=2, edges={}),
+    }
+
+    # Act
+    levels = topological_levels(graph, {})
+
+    # Assert
+    assert [sorted(level) for level in levels] == [["c", "d"], ["b"], ["a"]]
+
+
+def test__topological_sort__reports_cycle_path():
+    # Arrange
+    graph = {
+        "a": ParameterNode(type=dict, value=None, edges={"b": "x"}),
+        "b": ParameterNode(type=dict, value=None, edges={"c.inner": "x"}),
+        "c": ParameterNode(type=dict, value=None, edges={"a": "x"}),
+        "d": ParameterNode(type=int, value=1, edges={}),
+    }
+
+    # Act + Assert
+    with pytest.raises(ValueError, match="cycle: a -> b -> c -> a"):
+        topological_sort(graph, {})
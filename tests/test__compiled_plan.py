@@ -0,0 +1,96 @@
+from torch.optim import SGD
+
+from runner.compiled_plan import compile_construction_plan, create_objects_compiled
+from runner.instrumentation import CREATE_OBJECT_PHASE, RunTracer, use_tracer
+from runner.object_creation import ParameterNode, create_objects, topological_sort
+from runner.run import run
+from tests.conftest import EXPECTED_GRAPH, RUN_KWARGS
+from tests.mock_module.a import MockB, MockD
+from tests.mock_module.sub_mock_module.b import BasicNet, MockH, MockC
+from tests.mock_module.utils import create_opt
+
+
+def test__create_objects_compiled__same_as_create_objects():
+    # Act
+    result = create_objects_compiled(EXPECTED_GRAPH)
+    expected = create_objects(dict(EXPECTED_GRAPH))
+
+    # Assert
+    assert result.keys() == expected.keys()
+    assert isinstance(result["a"], MockB)
+    assert result["a"].a is None
+    assert isinstance(result["a"].b, SGD)
+    assert isinstance(result["c"], BasicNet)
+    assert result["b"] == "bbb"
+    assert isinstance(result["f"], MockD)
+
+
+def test__create_objects_compiled__emits_node_spans_while_tracing():
+    # Arrange
+    tracer = RunTracer()
+
+    # Act
+    with use_tracer(tracer):
+        create_objects_compiled(EXPECTED_GRAPH)
+
+    # Assert
+    paths = {
+        event.metadata["path"]
+        for event in tracer.events
+        if event.name == CREATE_OBJECT_PHASE
+    }
+    assert paths == set(EXPECTED_GRAPH)
+
+
+def test__create_objects_compiled__nested_edges_and_additional_objects():
+    # Arrange
+    graph = {
+        "runner": ParameterNode(
+            type=MockH,
+            value=None,
+            edges={"external": "opt", "runner.eps": "eps", "net.linear": "module"},
+        ),
+        "runner.eps": ParameterNode(
+            type=MockC, value=None, edges={"new.a": "a", "new.b": "b", "new.c": "c"}
+        ),
+        "net": ParameterNode(type=BasicNet, value=None, edges={}),
+    }
+    additional_objects = {"new": MockC(1, "2", 3.0), "external": "SGD"}
+
+    # Act
+    result = create_objects_compiled(graph, additional_objects)
+
+    # Assert
+    assert result["runner"].opt == "SGD"
+    assert result["runner"].eps.c == 3.0
+    assert result["runner"].module is result["net"].linear
+
+
+def test__compile_construction_plan__cached_by_structure():
+    # Arrange
+    graph = {
+        "a": ParameterNode(type=int, value=3, edges={}),
+        "b": ParameterNode(type=SGD, value=None, edges={"c": "module"}, creator=create_opt),
+        "c": ParameterNode(type=BasicNet, value=None, edges={}),
+    }
+    other_values = {
+        "a": ParameterNode(type=int, value=5, edges={}),
+        "b": graph["b"],
+        "c": graph["c"],
+    }
+    order = topological_sort(dict(graph), {})
+
+    # Act
+    plan = compile_construction_plan(graph, order)
+
+    # Assert
+    assert compile_construction_plan(other_values, order) is plan
+    assert create_objects_compiled(other_values, order=order)["a"] == 5
+
+
+def test__run__compile_construction():
+    # Act
+    result = run(**RUN_KWARGS, compile_construction=True, a=3, b=5)
+
+    # Assert
+    assert result == 15
@@ -0,0 +1,110 @@
+import json
+import os
+import re
+
+import mock
+import pytest
+
+from runner.config_bundle import CACHE_DIR_ENV, load_settings_bundle
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(path))
+    return path
+
+
+def write_settings(tmp_path, lr=0.1):
+    (tmp_path / "config.json").write_text(json.dumps({"opt-lr": lr}))
+    (tmp_path / "rules.json").write_text(
+        json.dumps({"default_assign_value": {"^opt.momentum$": 0.9}})
+    )
+    (tmp_path / "settings.json").write_text(json.dumps({"fast": {"epochs": 1}}))
+    return [str(tmp_path / name) for name in ("config.json", "rules.json", "settings.json")]
+
+
+def test__load_settings_bundle__sanity(tmp_path, cache_dir):
+    # Arrange
+    paths = write_settings(tmp_path)
+
+    # Act
+    default_config, default_rules, global_settings = load_settings_bundle(*paths)
+
+    # Assert
+    assert default_config == {"opt": {"lr": 0.1}}
+    assert default_rules == {"default_assign_value": {re.compile("^opt.momentum$"): 0.9}}
+    assert global_settings == {"fast": {"epochs": 1}}
+    assert len(list(cache_dir.iterdir())) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "cache",
+        "config.json",
+        "rules.json",
+        "settings.json",
+    ]
+
+
+def test__load_settings_bundle__reuses_bundle(tmp_path):
+    # Arrange
+    paths = write_settings(tmp_path)
+    load_settings_bundle(*paths)
+
+    # Act
+    with mock.patch("runner.config_bundle.read_settings") as parse_mock:
+        result = load_settings_bundle(*paths)
+
+    # Assert
+    parse_mock.assert_not_called()
+    assert result[0] == {"opt": {"lr": 0.1}}
+
+
+def test__load_settings_bundle__touched_file_keeps_bundle(tmp_path):
+    # Arrange
+    paths = write_settings(tmp_path)
+    load_settings_bundle(*paths)
+    os.utime(paths[0], ns=(1, 1))
+
+    # Act
+    with mock.patch("runner.config_bundle.read_settings") as parse_mock:
+        load_settings_bundle(*paths)
+
+    # Assert
+    parse_mock.assert_not_called()
+
+
+def test__load_settings_bundle__changed_file_rebuilds(tmp_path):
+    # Arrange
+    paths = write_settings(tmp_path)
+    load_settings_bundle(*paths)
+    write_settings(tmp_path, lr=0.5)
+
+    # Act
+    default_config, _, _ = load_settings_bundle(*paths)
+
+    # Assert
+    assert default_config == {"opt": {"lr": 0.5}}
+
+
+def test__load_settings_bundle__tampered_bundle_rebuilds(tmp_path, cache_dir):
+    # Arrange
+    paths = write_settings(tmp_path)
+    load_settings_bundle(*paths)
+    (bundle_path,) = cache_dir.iterdir()
+    bundle_path.write_bytes(bundle_path.read_bytes().replace(b"opt", b"opx"))
+
+    # Act
+    default_config, _, _ = load_settings_bundle(*paths)
+
+    # Assert
+    assert default_config == {"opt": {"lr": 0.1}}
+
+
+def test__load_settings_bundle__no_files(tmp_path, cache_dir):
+    # Act
+    result = load_settings_bundle(
+        str(tmp_path / "a.json"), str(tmp_path / "b.json"), str(tmp_path / "c.json")
+    )
+
+    # Assert
+    assert result == ({}, {}, {})
+    assert not cache_dir.exists()
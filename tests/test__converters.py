@@ -0,0 +1,58 @@
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+import pytest
+
+from runner.converters import compile_converter
+from runner.object_creation import ParameterNode, create_object
+
+
+@pytest.mark.parametrize(
+    "annotation,value,expected",
+    [
+        (int, "5", 5),
+        (bool, "False", False),
+        (Optional[int], "None", None),
+        (Optional[int], "3", 3),
+        (Union[int, str], "abc", "abc"),
+        (float | None, "0.5", 0.5),
+        (List[int], "1,2,3", [1, 2, 3]),
+        (list[float], "[1, 2.5]", [1.0, 2.5]),
+        (Tuple[int, str], "(1, 'a')", (1, "a")),
+        (Tuple[int, ...], "1, 2", (1, 2)),
+        (Dict[str, int], '{"a": "1"}', {"a": 1}),
+        (Literal["sgd", "adam"], "adam", "adam"),
+        (Literal[1, 2], "2", 2),
+        (Optional[List[Optional[int]]], "[1, null]", [1, None]),
+    ],
+)
+def test__compile_converter__sanity(annotation, value, expected):
+    # Act
+    result = compile_converter(annotation)(value)
+
+    # Assert
+    assert result == expected
+    assert type(result) == type(expected)
+
+
+def test__compile_converter__invalid_literal():
+    # Act + Assert
+    with pytest.raises(ValueError):
+        compile_converter(Literal["sgd", "adam"])("rmsprop")
+
+
+def test__compile_converter__cached_per_annotation():
+    # Act + Assert
+    assert compile_converter(Optional[int]) is compile_converter(Optional[int])
+
+
+def test__create_object__converts_with_annotation():
+    # Arrange
+    node = ParameterNode(
+        type=None, value="1,2", edges={}, annotation=Optional[List[int]]
+    )
+
+    # Act
+    result = create_object(node, {})
+
+    # Assert
+    assert result == [1, 2]
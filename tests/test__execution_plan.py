@@ -0,0 +1,90 @@
+import functools
+import logging
+import sys
+from logging import Logger
+from typing import List, Optional
+
+import mock
+import pytest
+
+from runner.execution_plan import (
+    ExecutionPlan,
+    dump_plan,
+    load_plan,
+    import_path,
+    import_from_path,
+)
+from runner.object_creation import ParameterNode
+from tests.conftest import EXPECTED_GRAPH
+from tests.mock_module.sub_mock_module.b import MockC
+
+
+def test__dump_plan__round_trip(tmp_path):
+    # Arrange
+    path = tmp_path / "plan.bin"
+    plan = ExecutionPlan(MockC, "func_name", EXPECTED_GRAPH, ["b", "a"], {}, [])
+
+    # Act
+    dump_plan(plan, path)
+    result = load_plan(path)
+
+    # Assert
+    assert result == plan
+
+
+def test__import_path__sanity():
+    # Act
+    path = import_path(MockC)
+
+    # Assert
+    assert path == "tests.mock_module.sub_mock_module.b:MockC"
+    assert import_from_path(path) is MockC
+
+
+def test__import_path__not_importable():
+    # Act + Assert
+    with pytest.raises(ValueError):
+        import_path(lambda node, dependencies: None)
+
+
+def test__dump_plan__round_trip_not_importable_references(tmp_path):
+    # Arrange
+    path = tmp_path / "plan.bin"
+    graph = {
+        "a": ParameterNode(type=List[int], value=[1], edges={}, annotation=Optional[MockC]),
+        "b": ParameterNode(type=dict, value=None, edges={}, creator=functools.partial(dict, b=1)),
+    }
+    plan = ExecutionPlan(MockC, "func_name", graph, ["a", "b"], {}, [])
+
+    # Act
+    dump_plan(plan, path)
+    result = load_plan(path)
+
+    # Assert
+    assert result.init_graph["a"] == graph["a"]
+    assert result.init_graph["b"].creator() == {"b": 1}
+
+
+def test__dump_plan__leaves_loggers_out(tmp_path):
+    # Arrange
+    path = tmp_path / "plan.bin"
+    graph = {"logger": ParameterNode(type=Logger, value=logging.getLogger("plan"), edges={})}
+    plan = ExecutionPlan(MockC, "func_name", graph, ["logger"], {}, [])
+
+    # Act
+    dump_plan(plan, path)
+    result = load_plan(path)
+
+    # Assert
+    assert result.init_graph["logger"].value is None
+    assert result.logger_paths == ["logger"]
+
+
+def test__dump_plan__lambda_creator_without_cloudpickle(tmp_path):
+    # Arrange
+    graph = {"a": ParameterNode(type=int, value=None, edges={}, creator=lambda node, dependencies: 1)}
+    plan = ExecutionPlan(MockC, "func_name", graph, ["a"], {}, [])
+
+    # Act + Assert
+    with mock.patch.dict(sys.modules, {"cloudpickle": None}), pytest.raises(ValueError, match="cloudpickle"):
+        dump_plan(plan, tmp_path / "plan.bin")
@@ -0,0 +1,65 @@
+import mock
+
+from runner.compact_graph import CompactGraph
+from runner.incremental import IncrementalGraphResolver
+from runner.run import run, needed_parameters_for_calling
+from runner.sweep import run_sweep, grid_trials
+from tests.conftest import RUN_KWARGS
+
+
+def test__run__incremental_resolver_patches_changed_values():
+    # Arrange
+    resolver = IncrementalGraphResolver()
+    run(**RUN_KWARGS, graph_resolver=resolver, a=2, b=3)
+
+    # Act
+    with mock.patch(
+        "runner.run.needed_parameters_for_calling",
+        side_effect=needed_parameters_for_calling,
+    ) as analysis_mock:
+        result = run(**RUN_KWARGS, graph_resolver=resolver, a=5, b=7)
+
+    # Assert
+    analysis_mock.assert_not_called()
+    assert result == 35
+
+
+def test__run__incremental_resolver_reuses_compact_graphs():
+    # Arrange
+    resolver = IncrementalGraphResolver()
+    run(**RUN_KWARGS, graph_resolver=resolver, a=2, b=3)
+
+    # Act
+    with mock.patch.object(
+        CompactGraph, "from_graph", side_effect=CompactGraph.from_graph
+    ) as from_graph_mock:
+        result = run(**RUN_KWARGS, graph_resolver=resolver, a=5, b=7)
+
+    # Assert
+    from_graph_mock.assert_not_called()
+    assert result == 35
+
+
+def test__run__incremental_resolver_rebuilds_on_structural_change():
+    # Arrange
+    resolver = IncrementalGraphResolver()
+    run(**RUN_KWARGS, graph_resolver=resolver, a=2, b=3)
+
+    # Act
+    with mock.patch(
+        "runner.run.needed_parameters_for_calling",
+        side_effect=needed_parameters_for_calling,
+    ) as analysis_mock:
+        result = run(**RUN_KWARGS, graph_resolver=resolver, a=2, b=3, b__type="float")
+
+    # Assert
+    assert analysis_mock.call_count == 2
+    assert result == 6.0
+
+
+def test__run_sweep__incremental():
+    # Act
+    records = run_sweep(grid_trials({"a": [1, 2], "b": [3, 4]}), incremental=True, **RUN_KWARGS)
+
+    # Assert
+    assert [record.result for record in records] == [3, 4, 6, 8]
@@ -0,0 +1,76 @@
+import json
+
+from runner.instrumentation import RunTracer, use_tracer, phase, current_tracer
+from runner.run import run
+from tests.conftest import RUN_KWARGS
+
+
+def test__phase__no_tracer_is_noop():
+    # Act
+    with phase("nothing"):
+        tracer = current_tracer()
+
+    # Assert
+    assert tracer is None
+
+
+def test__run_tracer__nested_phases():
+    # Arrange
+    tracer = RunTracer()
+
+    # Act
+    with use_tracer(tracer):
+        with phase("outer"):
+            with phase("inner", path="a"):
+                pass
+
+    # Assert
+    assert [(event.name, event.depth) for event in tracer.events] == [
+        ("inner", 1),
+        ("outer", 0),
+    ]
+    assert tracer.events[0].metadata == {"path": "a"}
+    assert tracer.summary()["outer"]["count"] == 1
+
+
+def test__run__timing_hooks_and_json(tmp_path):
+    # Arrange
+    events = []
+    timings_out = tmp_path / "timings.json"
+
+    # Act
+    run(**RUN_KWARGS, timing_hooks=[events.append], timings_out=str(timings_out), a=3, b=4)
+
+    # Assert
+    names = [event.name for event in events]
+    for expected in [
+        "module_import",
+        "class_lookup",
+        "config_merge",
+        "init_graph_analysis",
+        "init_missing_vertex_discovery",
+        "method_graph_analysis",
+        "topological_sort",
+        "create_object",
+        "init_object_creation",
+        "target_call",
+    ]:
+        assert expected in names
+    assert {event.metadata.get("path") for event in events} >= {"a", "b"}
+    assert "target_call" in json.loads(timings_out.read_text())["summary"]
+
+
+def test__run__chrome_trace(tmp_path):
+    # Arrange
+    trace_out = tmp_path / "trace.json"
+
+    # Act
+    run(**RUN_KWARGS, trace_out=str(trace_out), a=3, b=4)
+
+    # Assert
+    trace_events = json.loads(trace_out.read_text())["traceEvents"]
+    spans = {event["name"]: event for event in trace_events if event["ph"] == "X"}
+    assert spans["create_object a"]["args"]["path"] == "a"
+    assert spans["create_object a"]["args"]["type"] == "builtins.int"
+    assert spans["target_call"]["dur"] >= 0
+    assert any(event["ph"] == "M" for event in trace_events)
@@ -0,0 +1,65 @@
+from runner.layered_config import LayeredConfig
+from runner.utils.python import location_in_dict
+
+
+def test__layered_config__nested_merge():
+    # Arrange
+    config = LayeredConfig(
+        {"opt": {"lr": 0.1, "momentum": 0.9}, "epochs": 1},
+        {"opt": {"lr": 0.01}},
+        names=["cli", "preset fast"],
+    )
+
+    # Act
+    result = config.to_dict()
+
+    # Assert
+    assert result == {"opt": {"lr": 0.01, "momentum": 0.9}, "epochs": 1}
+
+
+def test__layered_config__tracks_source():
+    # Arrange
+    config = LayeredConfig(
+        {"opt": {"lr": 0.1, "momentum": 0.9}},
+        {"opt": {"lr": 0.01}},
+        names=["cli", "preset fast"],
+    )
+
+    # Act
+    optimizer = config["opt"]
+
+    # Assert
+    assert optimizer.source("lr") == "preset fast"
+    assert optimizer.source("momentum") == "cli"
+    assert optimizer.source("missing") is None
+
+
+def test__layered_config__value_hides_lower_nested_config():
+    # Arrange
+    config = LayeredConfig({"opt": {"lr": 0.1}}, {"opt": "None"})
+
+    # Act + Assert
+    assert config["opt"] == "None"
+
+
+def test__layered_config__does_not_copy_layers():
+    # Arrange
+    preset = {"opt": {"lr": 0.1}}
+    config = LayeredConfig({}, preset)
+
+    # Act
+    preset["opt"]["lr"] = 0.5
+
+    # Assert
+    assert config["opt"]["lr"] == 0.5
+
+
+def test__location_in_dict__layered_config():
+    # Arrange
+    config = LayeredConfig({"a": {"c": 1}}, {"a": {"d": 2}})
+
+    # Act
+    result = location_in_dict(config, "a")
+
+    # Assert
+    assert dict(result) == {"c": 1, "d": 2}
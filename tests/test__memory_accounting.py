@@ -0,0 +1,41 @@
+import json
+
+from runner.memory_accounting import memory_session
+from runner.object_creation import ParameterNode, create_objects
+from runner.run import run
+from tests.conftest import RUN_KWARGS
+
+
+def allocate_buffer(node, dependencies):
+    return bytearray(5 * 1024 * 1024)
+
+
+def test__memory_session__top_parameters():
+    # Arrange
+    graph = {
+        "big": ParameterNode(type=None, value=None, edges={}, creator=allocate_buffer),
+        "small": ParameterNode(type=int, value=3, edges={}),
+    }
+
+    # Act
+    with memory_session(memory=True) as tracker:
+        created = create_objects(graph)
+
+    # Assert
+    assert [phase.path for phase in tracker.top_parameters()] == ["big", "small"]
+    assert tracker.top_parameters()[0].allocated >= 5 * 1024 * 1024
+    assert len(created["big"]) == 5 * 1024 * 1024
+
+
+def test__run__memory_report(tmp_path):
+    # Arrange
+    memory_out = tmp_path / "memory.json"
+
+    # Act
+    run(**RUN_KWARGS, memory_out=str(memory_out), a=3, b=4)
+
+    # Assert
+    report = json.loads(memory_out.read_text())
+    phases = {phase["name"]: phase for phase in report["phases"]}
+    assert phases["target_call"]["peak_rss"] > 0
+    assert {phase["path"] for phase in report["top_parameters"]} == {"a", "b"}
@@ -1,7 +1,15 @@
+import pytest
 import torch
 from torch.optim import SGD
 
-from runner.object_creation import create_objects, ParameterNode
+from runner.object_creation import (
+    create_objects,
+    create_with_overrides,
+    dependency_closure,
+    topological_sort,
+    values_to_overrides,
+    ParameterNode,
+)
 from tests.conftest import EXPECTED_GRAPH
 from tests.mock_module.a import MockB, MockD
 from tests.mock_module.sub_mock_module.b import MockH, BasicNet, MockC
@@ -92,3 +100,49 @@ def test__created__from_additional_objects():
     assert result["runner"].eps.b == "2"
     assert result["runner"].eps.c == 3.0
     assert result["runner"].module == "123"
+
+
+OVERRIDE_GRAPH = {
+    "c": ParameterNode(type=MockC, value=None, edges={"c.a": "a", "c.b": "b", "c.c": "c"}),
+    "c.a": ParameterNode(type=int, value=1, edges={}),
+    "c.b": ParameterNode(type=str, value="2", edges={}),
+    "c.c": ParameterNode(type=float, value=3.0, edges={}),
+    "d": ParameterNode(type=dict, value={"x": 1}, edges={}),
+}
+
+
+def test__values_to_overrides__nested_and_dotted_keys():
+    # Act
+    result = values_to_overrides(OVERRIDE_GRAPH, {"c": {"a": "5"}, "c.c": 1.5, "d.y": 2})
+
+    # Assert
+    assert result == {"c.a": "5", "c.c": 1.5, "d": {"y": 2}}
+
+
+def test__values_to_overrides__unknown_path():
+    # Act & Assert
+    with pytest.raises(ValueError, match="e is not a parameter"):
+        values_to_overrides(OVERRIDE_GRAPH, {"e": 1})
+
+
+def test__create_with_overrides__recreates_dependents_only():
+    # Arrange
+    created = create_objects(OVERRIDE_GRAPH)
+    order = topological_sort(dict(OVERRIDE_GRAPH), {})
+
+    # Act
+    result = create_with_overrides(OVERRIDE_GRAPH, created, order, {"c.a": "5"})
+
+    # Assert
+    assert result["c"].a == 5
+    assert result["c"] is not created["c"]
+    assert result["d"] is created["d"]
+
+
+def test__dependency_closure__only_needed_nodes():
+    # Act
+    needed, external = dependency_closure(OVERRIDE_GRAPH, ["c"])
+
+    # Assert
+    assert needed == {"c", "c.a", "c.b", "c.c"}
+    assert external == set()
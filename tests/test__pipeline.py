@@ -0,0 +1,199 @@
+import logging
+import threading
+
+import mock
+import pytest
+
+from runner.object_creation import ParameterNode
+from runner.pipeline import (
+    MethodGraph,
+    execute_pipeline,
+    is_pipeline,
+    parse_pipeline,
+    pipeline_levels,
+    pipeline_methods,
+)
+from runner.run import run
+from tests import mock_module
+from tests.mock_module.a import MockPipeline
+
+
+def run_arguments(**kwargs):
+    return dict(
+        class_name="MockPipeline",
+        base_module=mock_module,
+        default_config={},
+        default_assign_value={},
+        default_assign_type={},
+        default_assign_creator={},
+        default_assign_connection={},
+        assign_value={},
+        assign_type={},
+        assign_creator={},
+        assign_connection={},
+        add_options_from_outside_packages=True,
+        global_settings={},
+        use_config=None,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "func_name,expected",
+    [("fit", False), ("fit,evaluate", True), (["fit"], True), (None, False)],
+)
+def test__is_pipeline__sanity(func_name, expected):
+    # Act & Assert
+    assert is_pipeline(func_name) == expected
+
+
+def test__parse_pipeline__string_is_a_chain():
+    # Act
+    steps = parse_pipeline("fit, evaluate,report")
+
+    # Assert
+    assert pipeline_levels(steps) == [["fit"], ["evaluate"], ["report"]]
+
+
+def test__pipeline_methods__independent_methods_share_a_level():
+    # Act
+    result = pipeline_methods({"report": ["fit", "evaluate"], "fit": [], "evaluate": []})
+
+    # Assert
+    assert sorted(result[:2]) == ["evaluate", "fit"]
+    assert result[2] == "report"
+
+
+def test__parse_pipeline__unknown_dependency():
+    # Act & Assert
+    with pytest.raises(ValueError, match="unknown methods"):
+        parse_pipeline({"evaluate": ["fit"]})
+
+
+def test__pipeline_levels__cycle():
+    # Act & Assert
+    with pytest.raises(ValueError, match="cycle"):
+        pipeline_levels(parse_pipeline({"fit": ["evaluate"], "evaluate": ["fit"]}))
+
+
+def test__run__pipeline_uses_one_instance():
+    # Act
+    result = run(**run_arguments(func_name="fit,evaluate,report", a=2, b=5, c=1))
+
+    # Assert
+    assert result == {"fit": 10, "evaluate": 11, "report": ["fit", "evaluate"]}
+
+
+def test__run__pipeline_workers_run_independent_methods():
+    # Act
+    result = run(
+        **run_arguments(
+            func_name={"fit": [], "evaluate": [], "report": ["fit", "evaluate"]},
+            pipeline_workers=2,
+        )
+    )
+
+    # Assert
+    assert sorted(result["report"]) == ["evaluate", "fit"]
+
+
+@pytest.mark.parametrize(
+    "option",
+    [
+        {"plan_out": "plan.bin"},
+        {"build_paths": ["b"]},
+        {"shared_objects": {"b": 3}},
+        {"result_cache": "cache"},
+    ],
+)
+def test__run__pipeline_rejects_single_method_options(tmp_path, option):
+    # Arrange
+    option = {
+        key: str(tmp_path / value) if isinstance(value, str) else value
+        for key, value in option.items()
+    }
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="need a single method"):
+        run(**run_arguments(func_name="fit,evaluate", **option))
+
+
+def method_graphs(fit_value, report_value, creator):
+    return {
+        "fit": MethodGraph(
+            {"b": ParameterNode(type=int, value=fit_value, edges={}, creator=creator)}, ["b"]
+        ),
+        "report": MethodGraph(
+            {"b": ParameterNode(type=int, value=report_value, edges={}, creator=creator)}, ["b"]
+        ),
+    }
+
+
+def test__execute_pipeline__shared_parameter_created_once():
+    # Arrange
+    creator = mock.MagicMock(return_value=2)
+
+    # Act
+    execute_pipeline(
+        MockPipeline,
+        parse_pipeline("fit,report"),
+        {},
+        [],
+        method_graphs(2, 2, creator),
+        logging.getLogger(__name__),
+    )
+
+    # Assert
+    assert creator.call_count == 1
+
+
+def test__execute_pipeline__different_definitions_created_per_method():
+    # Arrange
+    creator = mock.MagicMock(return_value=2)
+
+    # Act
+    execute_pipeline(
+        MockPipeline,
+        parse_pipeline("fit,report"),
+        {},
+        [],
+        method_graphs(2, 3, creator),
+        logging.getLogger(__name__),
+    )
+
+    # Assert
+    assert creator.call_count == 2
+
+
+def test__execute_pipeline__methods_create_their_objects_concurrently():
+    # Arrange
+    barrier = threading.Barrier(2, timeout=5)
+
+    def slow_creator(node, dependencies):
+        # Only returns when both methods create their objects at the same time
+        barrier.wait()
+        return node.value
+
+    graphs = {
+        "fit": MethodGraph(
+            {"b": ParameterNode(type=int, value=2, edges={}, creator=slow_creator)}, ["b"]
+        ),
+        "evaluate": MethodGraph(
+            {"c": ParameterNode(type=int, value=3, edges={}, creator=slow_creator)}, ["c"]
+        ),
+    }
+
+    # Act
+    result = execute_pipeline(
+        MockPipeline,
+        parse_pipeline({"fit": [], "evaluate": []}),
+        {},
+        [],
+        graphs,
+        logging.getLogger(__name__),
+        workers=2,
+    )
+
+    # Assert
+    assert result["fit"] == 2
+    assert result["evaluate"] in (4, 5)
@@ -0,0 +1,43 @@
+import pstats
+import time
+
+from runner.profiling import SamplingProfiler, CPROFILE
+from runner.run import run
+from tests.conftest import RUN_KWARGS
+
+
+def busy_wait(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test__sampling_profiler__collapsed_stacks(tmp_path):
+    # Arrange
+    profiler = SamplingProfiler(interval=0.001)
+    output = tmp_path / "run.collapsed"
+
+    # Act
+    with profiler.profiling():
+        busy_wait(0.1)
+    profiler.dump(output)
+
+    # Assert
+    lines = output.read_text().splitlines()
+    assert any("busy_wait" in line for line in lines)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+    assert not profiler._thread.is_alive()
+
+
+def test__run__cprofile_only_target(tmp_path):
+    # Arrange
+    output = tmp_path / "run.prof"
+
+    # Act
+    run(**RUN_KWARGS, profile=CPROFILE, profile_out=str(output), a=3, b=4)
+
+    # Assert
+    profiled_functions = {name for _, _, name in pstats.Stats(str(output)).stats}
+    assert "func" in profiled_functions
+    assert "__init__" in profiled_functions
+    assert "needed_parameters_for_calling" not in profiled_functions
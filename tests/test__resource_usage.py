@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+from runner.resource_usage import UsageMeasurement
+from runner.run import run, RunResult
+from tests.conftest import RUN_KWARGS
+
+
+def test__usage_measurement__sanity():
+    # Act
+    with UsageMeasurement() as measurement:
+        sum(range(100_000))
+
+    # Assert
+    assert measurement.usage.wall_time > 0
+    assert measurement.usage.user_time >= 0
+    assert measurement.usage.max_rss > 0
+
+
+def test__usage_measurement__includes_child_processes():
+    # Act
+    with UsageMeasurement() as measurement:
+        subprocess.run(
+            [sys.executable, "-c", "sum(range(3_000_000))"], check=True
+        )
+
+    # Assert
+    assert (
+        measurement.children_usage.user_time + measurement.children_usage.system_time
+        > 0
+    )
+
+
+def test__run__returns_value_by_default():
+    # Act
+    result = run(**RUN_KWARGS, a=3, b=4)
+
+    # Assert
+    assert result == 12
+
+
+def test__run__returns_run_result_with_usage():
+    # Act
+    result = run(**RUN_KWARGS, a=3, b=4, return_usage=True)
+
+    # Assert
+    assert isinstance(result, RunResult)
+    assert result.value == 12
+    assert result.usage.wall_time > 0
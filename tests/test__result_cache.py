@@ -0,0 +1,94 @@
+import os
+
+import mock
+
+from runner.object_creation import ParameterNode
+from runner.result_cache import ResultCache, result_cache_key
+from runner.run import run
+from tests.mock_module.a import MockI
+from tests.conftest import RUN_KWARGS
+
+
+def test__result_cache__put_and_get(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path)
+    value = {"loss": 0.1, "weights": bytearray(b"123")}
+
+    # Act
+    cache.put("key", value)
+
+    # Assert
+    assert cache.get("key") == (True, value)
+    assert cache.get("missing") == (False, None)
+
+
+def test__result_cache__evicts_least_recently_used(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path, max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    os.utime(tmp_path / "a.pkl5", (0, 0))
+    os.utime(tmp_path / "b.pkl5", (1, 1))
+    cache.get("a")
+
+    # Act
+    cache.put("c", 3)
+
+    # Assert
+    assert cache.get("a") == (True, 1)
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, 3)
+
+
+def test__result_cache_key__depends_on_values_and_code_version():
+    # Arrange
+    graph = {"a": ParameterNode(type=int, value=3, edges={})}
+    other_graph = {"a": ParameterNode(type=int, value=4, edges={})}
+
+    # Act
+    key = result_cache_key(MockI, "func", graph, {})
+
+    # Assert
+    assert key == result_cache_key(MockI, "func", dict(graph), {})
+    assert key != result_cache_key(MockI, "func", other_graph, {})
+    assert key != result_cache_key(MockI, "func", graph, {}, "v2")
+
+
+def test__result_cache_key__follows_value_source_files(tmp_path):
+    # Arrange
+    path = tmp_path / "seeds.txt"
+    path.write_text("1\n2\n")
+    graph = {"seeds": ParameterNode(type=list, value=f"@file:{path}", edges={})}
+    key = result_cache_key(MockI, "func", graph, {})
+
+    # Act
+    path.write_text("1\n2\n3\n")
+
+    # Assert
+    assert result_cache_key(MockI, "func", graph, {}) != key
+
+
+def test__run__returns_cached_result(tmp_path):
+    # Arrange
+    first_result = run(**RUN_KWARGS, result_cache=str(tmp_path), a=3, b=4)
+
+    # Act
+    with mock.patch("runner.run.create_objects") as create_objects_mock:
+        result = run(**RUN_KWARGS, result_cache=str(tmp_path), a=3, b=4)
+
+    # Assert
+    create_objects_mock.assert_not_called()
+    assert result == first_result == 12
+
+
+def test__run__result_that_can_not_be_cached_is_returned(tmp_path):
+    # Arrange
+    error = TypeError("cannot pickle 'generator' object")
+
+    # Act
+    with mock.patch("runner.result_cache.dump_with_buffers", side_effect=error):
+        result = run(**RUN_KWARGS, result_cache=str(tmp_path), a=3, b=4)
+
+    # Assert
+    assert result == 12
+    assert list(tmp_path.iterdir()) == []
@@ -10,9 +10,13 @@ from runner.parameters_analysis import Rules
 
 @mock.patch("runner.run.needed_parameters_for_calling")
 @mock.patch("runner.run.create_objects")
+@mock.patch("runner.run.topological_sort")
 @mock.patch("runner.run.find_class_by_name")
 def test__run__sanity(
-    find_class_by_name_mock, create_objects_mock, needed_parameters_for_calling_mock
+    find_class_by_name_mock,
+    topological_sort_mock,
+    create_objects_mock,
+    needed_parameters_for_calling_mock,
 ):
     # Arrange
     algorithm = MagicMock()
@@ -24,6 +28,9 @@ def test__run__sanity(
     graph1 = MagicMock()
     graph2 = MagicMock()
     needed_parameters_for_calling_mock.side_effect = [graph1, graph2]
+    order1 = ["a"]
+    order2 = ["b"]
+    topological_sort_mock.side_effect = [order1, order2]
     create_objects_mock.side_effect = [alg_call_param | nested_params, call_param | nested_params]
     class_name = "MockH"
     func_name = "func"
@@ -84,7 +91,12 @@ def test__run__sanity(
             ),
         ]
     )
-    create_objects_mock.assert_has_calls([call(graph1), call(graph2, alg_call_param)])
+    create_objects_mock.assert_has_calls(
+        [
+            call(graph1, order=order1, compact=mock.ANY),
+            call(graph2, alg_call_param, order2, compact=mock.ANY),
+        ]
+    )
     find_class_by_name_mock.assert_has_calls([call(tests, class_name)])
     algorithm.func.assert_called_once_with(**call_param)
     class_mock_h.assert_called_once_with(**alg_call_param)
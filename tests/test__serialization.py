@@ -0,0 +1,60 @@
+import pickle
+
+import pytest
+
+from runner.serialization import (
+    dump_result,
+    dump_with_buffers,
+    load_result,
+    load_with_buffers,
+)
+
+
+def test__dump_with_buffers__out_of_band_round_trip(tmp_path):
+    # Arrange
+    path = tmp_path / "value.pkl5"
+    value = {"buffer": pickle.PickleBuffer(bytearray(b"abc" * 1000)), "meta": [1, 2]}
+
+    # Act
+    dump_with_buffers(value, path)
+    result = load_with_buffers(path)
+
+    # Assert
+    assert bytes(result["buffer"]) == b"abc" * 1000
+    assert result["meta"] == [1, 2]
+
+
+def test__dump_result__npy_for_arrays(tmp_path):
+    # Arrange
+    numpy = pytest.importorskip("numpy")
+    path = str(tmp_path / "result.npy")
+    value = numpy.arange(12, dtype=numpy.float32).reshape(3, 4)
+
+    # Act
+    dump_result(value, path)
+    result = load_result(path)
+
+    # Assert
+    assert isinstance(result, numpy.memmap)
+    assert (result == value).all()
+
+
+def test__dump_result__npy_rejects_non_arrays(tmp_path):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        dump_result({"a": 1}, str(tmp_path / "result.npy"))
+
+
+def test__dump_result__pickle_keeps_arrays_out_of_band(tmp_path):
+    # Arrange
+    numpy = pytest.importorskip("numpy")
+    path = str(tmp_path / "result.pkl5")
+    value = {"weights": numpy.ones(1000), "epochs": 3}
+
+    # Act
+    dump_result(value, path)
+    result = load_result(path)
+
+    # Assert
+    assert (result["weights"] == 1).all()
+    assert result["epochs"] == 3
@@ -0,0 +1,166 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from runner.object_creation import ParameterNode
+from runner.run import run
+from runner.shared_inputs import (
+    _attached_blocks,
+    attach,
+    build_objects,
+    attach_all,
+    detach_all,
+    init_worker,
+    published,
+    share_nodes,
+)
+from runner.sweep import grid_trials, run_sweep
+from tests.conftest import RUN_KWARGS
+
+GRAPH = {
+    "data": ParameterNode(type=dict, value=None, edges={"data.size": "size"}),
+    "data.size": ParameterNode(type=int, value=3, edges={}),
+    "model": ParameterNode(type=dict, value=None, edges={"data": "data"}),
+    "lr": ParameterNode(type=float, value=0.1, edges={}),
+}
+ORDER = ["data.size", "data", "lr", "model"]
+
+
+def array_runner(build_paths=None, shared_objects=None, scale=1, **kwargs):
+    numpy = pytest.importorskip("numpy")
+    if build_paths:
+        return {"data": numpy.arange(100, dtype=numpy.float64)}
+    data = shared_objects["data"]
+    return {"total": float(data.sum()) * scale, "writeable": data.flags.writeable}
+
+
+def test__build_objects__creates_only_the_shared_paths():
+    # Act
+    result = build_objects(GRAPH, ORDER, {}, [], ["data"])
+
+    # Assert
+    assert result == {"data": {"size": 3}}
+
+
+def test__build_objects__unknown_path():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        build_objects(GRAPH, ORDER, {}, [], ["missing"])
+
+
+def test__share_nodes__replaces_the_node_and_its_nested_nodes():
+    # Act
+    graph, order = share_nodes(GRAPH, ORDER, {"data": {"size": 5}})
+
+    # Assert
+    assert "data.size" not in graph
+    assert order == ["data", "lr", "model"]
+    assert graph["data"].creator(graph["data"], {}) == {"size": 5}
+    assert GRAPH["data"].creator is None
+
+
+def attached_prefix(shared):
+    return bytes(attach_all(shared)["data"][:4])
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test__published__workers_attach_and_the_parent_unlinks(start_method):
+    # Arrange
+    context = multiprocessing.get_context(start_method)
+
+    # Act
+    with published({"data": pickle.PickleBuffer(bytearray(b"abcd" * 100))}) as shared, ProcessPoolExecutor(
+        max_workers=2,
+        mp_context=context,
+        initializer=init_worker,
+        initargs=(context.Lock(),),
+    ) as pool:
+        results = [pool.submit(attached_prefix, shared).result() for _ in range(4)]
+
+    # Assert
+    assert results == [b"abcd"] * 4
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shared["data"].blocks[0][0])
+
+
+def test__attach__views_the_published_buffers_read_only():
+    # Arrange
+    numpy = pytest.importorskip("numpy")
+    array = numpy.arange(10, dtype=numpy.int64)
+
+    with published({"data": {"array": array, "name": "table"}}) as shared:
+        # Act
+        result = attach(shared["data"])
+
+        # Assert
+        assert result["name"] == "table"
+        assert result["array"].tolist() == list(range(10))
+        assert not result["array"].flags.writeable
+        assert not numpy.shares_memory(result["array"], array)
+        del result
+        detach_all()
+
+
+def test__detach_all__keeps_blocks_with_live_views():
+    # Arrange
+    numpy = pytest.importorskip("numpy")
+
+    with published({"kept": numpy.zeros(4), "dropped": numpy.ones(4)}) as shared:
+        kept = attach(shared["kept"])
+        attach(shared["dropped"])
+
+        # Act
+        detach_all()
+
+        # Assert
+        assert list(_attached_blocks) == [shared["kept"].blocks[0][0]]
+        del kept
+        detach_all()
+        assert not _attached_blocks
+
+
+def test__run__shared_objects_replace_the_creation():
+    # Act
+    result = run(**RUN_KWARGS, a=2, b=3, shared_objects={"a": 7})
+
+    # Assert
+    assert result == 21
+
+
+def test__run__build_paths_returns_the_objects():
+    # Act
+    result = run(**RUN_KWARGS, a=2, b=3, build_paths=["a"])
+
+    # Assert
+    assert result == {"a": 2}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test__run_sweep__shared_parameters_are_built_once(max_workers):
+    # Act
+    records = run_sweep(
+        grid_trials({"scale": [1, 2]}),
+        max_workers=max_workers,
+        runner=array_runner,
+        shared=["data"],
+    )
+
+    # Assert
+    assert [record.result["total"] for record in records] == [4950.0, 9900.0]
+    assert all(record.result["writeable"] == (max_workers == 1) for record in records)
+
+
+def test__published__unlinks_the_blocks():
+    # Arrange
+    numpy = pytest.importorskip("numpy")
+
+    # Act
+    with published({"data": numpy.zeros(4)}) as shared:
+        name = shared["data"].blocks[0][0]
+
+    # Assert
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
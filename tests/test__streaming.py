@@ -0,0 +1,236 @@
+import io
+import json
+import threading
+
+from runner.run import run
+from runner.serialization import load_result
+from runner.streaming import (
+    JsonlSink,
+    StreamOptions,
+    chunks,
+    read_frames,
+    read_jsonl,
+    stream_calls,
+    stream_items,
+    stream_result,
+)
+from tests import mock_module
+
+
+def run_arguments(**kwargs):
+    return dict(
+        class_name="MockI",
+        func_name="func",
+        base_module=mock_module,
+        default_config={},
+        default_assign_value={},
+        default_assign_type={},
+        default_assign_creator={},
+        default_assign_connection={},
+        assign_value={},
+        assign_type={},
+        assign_creator={},
+        assign_connection={},
+        add_options_from_outside_packages=True,
+        global_settings={},
+        use_config=None,
+        **kwargs,
+    )
+
+
+def test__read_jsonl__skips_empty_lines():
+    # Arrange
+    stream = io.StringIO('{"b": 1}\n\n{"b": 2}\n')
+
+    # Act
+    records = list(read_jsonl(stream))
+
+    # Assert
+    assert records == [{"b": 1}, {"b": 2}]
+
+
+def test__chunks__last_chunk_is_partial():
+    # Act
+    result = list(chunks(range(5), 2))
+
+    # Assert
+    assert result == [[0, 1], [2, 3], [4]]
+
+
+def test__stream_calls__records_override_parameters_in_order():
+    # Arrange
+    output = io.StringIO()
+    records = [{"b": value} for value in range(10)]
+
+    # Act
+    count = stream_calls(
+        lambda a, b: a * b,
+        lambda record: {"a": 3, "b": 0} | record,
+        records,
+        JsonlSink(output),
+        3,
+        4,
+    )
+
+    # Assert
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert count == 10
+    assert lines == [{"index": i, "result": 3 * i} for i in range(10)]
+
+
+def test__stream_calls__workers_overlap_with_the_default_chunk_size():
+    # Arrange
+    output = io.StringIO()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def function(b):
+        # Only returns when two records run at the same time
+        barrier.wait()
+        return b
+
+    # Act
+    stream_calls(function, dict, [{"b": b} for b in range(4)], JsonlSink(output), 1, 2)
+
+    # Assert
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert lines == [{"index": i, "result": i} for i in range(4)]
+
+
+def test__stream_calls__errors_are_written_per_record():
+    # Arrange
+    output = io.StringIO()
+
+    # Act
+    stream_calls(lambda b: 1 / b, dict, [{"b": 0}, {"b": 2}], JsonlSink(output))
+
+    # Assert
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert lines[0] == {"index": 0, "error": "ZeroDivisionError: division by zero"}
+    assert lines[1] == {"index": 1, "result": 0.5}
+
+
+def test__run__batch_input_builds_instance_once(tmp_path):
+    # Arrange
+    input_path = tmp_path / "inputs.jsonl"
+    output_path = tmp_path / "outputs.jsonl"
+    input_path.write_text("\n".join(json.dumps({"b": b}) for b in [1, 2, 3]))
+
+    # Act
+    result = run(
+        **run_arguments(
+            a=4,
+            batch_input=str(input_path),
+            batch_output=str(output_path),
+            batch_chunk_size=2,
+        )
+    )
+
+    # Assert
+    lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert result == 3
+    assert [line["result"] for line in lines] == [4, 8, 12]
+
+
+def test__run__batch_records_are_converted_like_cli_values(tmp_path):
+    # Arrange
+    input_path = tmp_path / "inputs.jsonl"
+    output_path = tmp_path / "outputs.jsonl"
+    input_path.write_text('{"b": "3"}\n{"c": 1}\n')
+
+    # Act
+    run(**run_arguments(a=4, batch_input=str(input_path), batch_output=str(output_path)))
+
+    # Assert
+    lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert lines[0] == {"index": 0, "result": 12}
+    assert lines[1] == {"index": 1, "error": "ValueError: c is not a parameter of the call"}
+
+
+class CountingSink(JsonlSink):
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.flushes = 0
+
+    def flush(self):
+        super().flush()
+        self.flushes += 1
+
+
+def test__stream_items__producer_never_runs_ahead_of_sink():
+    # Arrange
+    sink = CountingSink(io.StringIO())
+    produced = []
+
+    def producer():
+        for value in range(5):
+            assert sink.count == len(produced)
+            produced.append(value)
+            yield {"value": value}
+
+    # Act
+    count = stream_items(producer(), sink, flush_every=2, flush_interval=60)
+
+    # Assert
+    assert count == 5
+    assert sink.flushes == 3
+
+
+def test__stream_result__csv_writes_header_from_first_item(tmp_path):
+    # Arrange
+    path = tmp_path / "out.csv"
+    items = iter([{"step": 1, "loss": 0.5}, {"step": 2, "loss": 0.25}])
+
+    # Act
+    count = stream_result(items, StreamOptions(str(path), "csv"))
+
+    # Assert
+    assert count == 2
+    assert path.read_text().splitlines() == ["step,loss", "1,0.5", "2,0.25"]
+
+
+def test__stream_result__frames_round_trip(tmp_path):
+    # Arrange
+    path = tmp_path / "out.bin"
+    items = ({"step": step, "values": [step] * 3} for step in range(3))
+
+    # Act
+    stream_result(items, StreamOptions(str(path), "frames"))
+
+    # Assert
+    with open(path, "rb") as stream:
+        assert list(read_frames(stream)) == [
+            {"step": step, "values": [step] * 3} for step in range(3)
+        ]
+
+
+def test__stream_result__non_iterators_are_returned_as_is():
+    # Act
+    result = stream_result([1, 2], StreamOptions("unused.jsonl"))
+
+    # Assert
+    assert result == [1, 2]
+
+
+def test__run__result_out_saves_value(tmp_path):
+    # Arrange
+    path = str(tmp_path / "result.pkl5")
+
+    # Act
+    result = run(**run_arguments(a=2, b=5, result_out=path))
+
+    # Assert
+    assert result == 10
+    assert load_result(path) == 10
+
+
+def test__run__result_out_npy_falls_back_to_pickle(tmp_path):
+    # Arrange
+    path = tmp_path / "result.npy"
+
+    # Act
+    result = run(**run_arguments(a=2, b=5, result_out=str(path)))
+
+    # Assert
+    assert result == 10
+    assert not path.exists()
+    assert load_result(str(tmp_path / "result.pkl5")) == 10
@@ -0,0 +1,234 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from runner.result_cache import ResultCache
+from runner.results_store import JsonlResultsStore, COMPLETED_STATUS, FAILED_STATUS
+from runner.run import run
+from runner.sweep import (
+    grid_trials,
+    run_sweep,
+    successive_halving,
+    trial_config_hash,
+    MAXIMIZE,
+)
+from tests.conftest import RUN_KWARGS
+
+
+def failing_runner(**kwargs):
+    raise ValueError("bad trial")
+
+
+def score_runner(a, train, **kwargs):
+    return {"score": a * train["epochs"]}
+
+
+def partial_score_runner(a, train, **kwargs):
+    return {"score": a * train["epochs"]} if a != 4 else {"loss": 0}
+
+
+def test__grid_trials__nested_product():
+    # Act
+    result = grid_trials({"opt.lr": [1, 2], "b": [3]})
+
+    # Assert
+    assert result == [{"opt": {"lr": 1}, "b": 3}, {"opt": {"lr": 2}, "b": 3}]
+
+
+def test__run_sweep__sanity(tmp_path):
+    # Arrange
+    store = JsonlResultsStore(tmp_path / "results.jsonl")
+    trials = grid_trials({"a": [2, 3], "b": [5]})
+
+    # Act
+    records = run_sweep(trials, store, **RUN_KWARGS)
+
+    # Assert
+    assert [record.result for record in records] == [10, 15]
+    assert all(record.status == COMPLETED_STATUS for record in records)
+    assert all(record.usage["self"]["wall_time"] > 0 for record in records)
+    assert all("voluntary_context_switches" in record.usage["children"] for record in records)
+    assert all("max_rss" not in record.usage["self"] for record in records)
+    assert len(JsonlResultsStore(tmp_path / "results.jsonl").completed_hashes()) == 2
+
+
+def test__run_sweep__skips_completed_trials(tmp_path):
+    # Arrange
+    store_path = tmp_path / "results.jsonl"
+    trials = grid_trials({"a": [2, 3], "b": [5]})
+    run_sweep(trials[:1], JsonlResultsStore(store_path), **RUN_KWARGS)
+    runner = MagicMock(return_value=7)
+
+    # Act
+    records = run_sweep(trials, JsonlResultsStore(store_path), runner=runner, **RUN_KWARGS)
+
+    # Assert
+    runner.assert_called_once()
+    assert [record.result for record in records] == [10, 7]
+
+
+def test__run_sweep__resume_ignores_execution_options(tmp_path):
+    # Arrange
+    store_path = tmp_path / "results.jsonl"
+    trials = grid_trials({"a": [2, 3], "b": [5]})
+    run_sweep(
+        trials,
+        JsonlResultsStore(store_path),
+        result_cache=ResultCache(tmp_path / "cache"),
+        **RUN_KWARGS,
+    )
+    runner = MagicMock(return_value=7)
+
+    # Act
+    records = run_sweep(
+        trials,
+        JsonlResultsStore(store_path),
+        runner=runner,
+        result_cache=ResultCache(tmp_path / "cache"),
+        timing_hooks=[MagicMock()],
+        **RUN_KWARGS,
+    )
+
+    # Assert
+    runner.assert_not_called()
+    assert [record.result for record in records] == [10, 15]
+
+
+def test__trial_config_hash__follows_config_and_code_version():
+    # Arrange
+    run_kwargs = dict(RUN_KWARGS, a=2)
+
+    # Act
+    results = [
+        trial_config_hash(run_kwargs),
+        trial_config_hash(run_kwargs | {"a": 3}),
+        trial_config_hash(run_kwargs | {"code_version": "v2"}),
+    ]
+
+    # Assert
+    assert len(set(results)) == 3
+
+
+def test__run_sweep__failed_trial_is_rerun(tmp_path):
+    # Arrange
+    store_path = tmp_path / "results.jsonl"
+    trials = [{"a": 2}]
+    run_sweep(trials, JsonlResultsStore(store_path), runner=failing_runner, **RUN_KWARGS)
+
+    # Act
+    records = run_sweep(trials, JsonlResultsStore(store_path), **RUN_KWARGS)
+
+    # Assert
+    assert records[0].status == COMPLETED_STATUS
+    assert records[0].result == 4
+
+
+def test__jsonl_results_store__ignores_truncated_line(tmp_path):
+    # Arrange
+    store_path = tmp_path / "results.jsonl"
+    run_sweep([{"a": 2}], JsonlResultsStore(store_path), runner=failing_runner, **RUN_KWARGS)
+    with store_path.open("a") as store_file:
+        store_file.write('{"config_hash": "abc", "sta')
+
+    # Act
+    store = JsonlResultsStore(store_path)
+
+    # Assert
+    assert [record.status for record in store.records.values()] == [FAILED_STATUS]
+
+
+def test__run_sweep__process_pool(tmp_path):
+    # Arrange
+    usage_hook = MagicMock()
+
+    # Act
+    records = run_sweep(
+        grid_trials({"a": [1, 2, 3]}),
+        JsonlResultsStore(tmp_path / "results.jsonl"),
+        max_workers=2,
+        usage_hooks=[usage_hook],
+        **RUN_KWARGS,
+    )
+
+    # Assert
+    assert [record.result for record in records] == [2, 4, 6]
+    (measurement,), _ = usage_hook.call_args
+    workers_usage = measurement.children_usage
+    assert workers_usage.user_time + workers_usage.system_time > 0
+    assert workers_usage.max_rss > 0
+
+
+def test__successive_halving__promotes_best_trials():
+    # Arrange
+    runner = MagicMock(side_effect=run)
+
+    # Act
+    records = successive_halving(
+        grid_trials({"a": list(range(1, 10))}),
+        budget_path="b",
+        min_budget=1,
+        max_budget=9,
+        eta=3,
+        runner=runner,
+        **RUN_KWARGS,
+    )
+
+    # Assert
+    assert runner.call_count == 9 + 3 + 1
+    assert [(record.config, record.result) for record in records] == [
+        ({"a": 1, "b": 9}, 9)
+    ]
+
+
+def test__successive_halving__maximize_dict_metric():
+    # Act
+    records = successive_halving(
+        grid_trials({"a": [1, 2, 3, 4]}),
+        budget_path="train.epochs",
+        min_budget=2,
+        max_budget=4,
+        eta=2,
+        metric="score",
+        mode=MAXIMIZE,
+        runner=score_runner,
+        **RUN_KWARGS,
+    )
+
+    # Assert
+    assert [record.config["a"] for record in records] == [4, 3]
+    assert records[0].result == {"score": 16}
+
+
+@pytest.mark.parametrize(
+    "eta,min_budget,max_budget",
+    [(1, 1, 9), (0, 1, 9), (3, 0, 9), (3, 10, 9)],
+)
+def test__successive_halving__invalid_arguments(eta, min_budget, max_budget):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        successive_halving(
+            [{"a": 1}],
+            budget_path="b",
+            min_budget=min_budget,
+            max_budget=max_budget,
+            eta=eta,
+            **RUN_KWARGS,
+        )
+
+
+def test__successive_halving__missing_metric_ranks_as_failed():
+    # Act
+    records = successive_halving(
+        grid_trials({"a": [1, 2, 3, 4]}),
+        budget_path="train.epochs",
+        min_budget=2,
+        max_budget=4,
+        eta=2,
+        metric="score",
+        mode=MAXIMIZE,
+        runner=partial_score_runner,
+        **RUN_KWARGS,
+    )
+
+    # Assert
+    assert [record.config["a"] for record in records] == [3, 2]
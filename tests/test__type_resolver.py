@@ -0,0 +1,108 @@
+import re
+
+import mock
+import pytest
+from torch.optim import SGD
+
+from runner.parameters_analysis import Rules
+from runner.type_resolver import TypeResolver, warm_up_type_resolver
+from tests import mock_module
+from tests.mock_module.a import MockB
+from tests.mock_module.utils import create_opt
+
+
+@pytest.mark.parametrize(
+    "name,only_class,expected",
+    [
+        ("MockB", True, MockB),
+        ("torch.optim.SGD", True, SGD),
+        ("create_opt", False, create_opt),
+        ("int", True, int),
+        ("Optional", True, __import__("typing").Optional),
+        ("0.002", False, 0.002),
+        ("None", False, None),
+    ],
+)
+def test__type_resolver__resolve(name, only_class, expected):
+    # Act
+    result = TypeResolver().resolve(mock_module, name, only_class)
+
+    # Assert
+    assert result == expected
+
+
+def test__type_resolver__caches_results():
+    # Arrange
+    resolver = TypeResolver()
+
+    # Act
+    with mock.patch(
+        "runner.type_resolver.find_class_by_name", return_value=MockB
+    ) as find_mock:
+        results = [resolver.resolve(mock_module, "MockB") for _ in range(3)]
+
+    # Assert
+    assert results == [MockB] * 3
+    find_mock.assert_called_once()
+    assert resolver.hits == 2
+
+
+def test__type_resolver__caches_failures_without_eval():
+    # Arrange
+    resolver = TypeResolver()
+
+    # Act
+    with mock.patch(
+        "runner.type_resolver.find_class_by_name", return_value=None
+    ) as find_mock:
+        for _ in range(2):
+            with pytest.raises(NameError):
+                resolver.resolve(mock_module, "__import__('os')")
+
+    # Assert
+    find_mock.assert_called_once()
+
+
+def test__type_resolver__mutable_literals_are_not_shared():
+    # Arrange
+    resolver = TypeResolver()
+
+    # Act
+    first = resolver.resolve(mock_module, "[1, 2]", False)
+    first.append(3)
+    second = resolver.resolve(mock_module, "[1, 2]", False)
+
+    # Assert
+    assert second == [1, 2]
+
+
+def test__type_resolver__bounded_cache():
+    # Arrange
+    resolver = TypeResolver(max_size=2)
+
+    # Act
+    for name in ["1", "2", "3"]:
+        resolver.resolve(mock_module, name, False)
+    resolver.resolve(mock_module, "1", False)
+
+    # Assert
+    assert resolver.misses == 4
+
+
+def test__warm_up_type_resolver__config_and_rules():
+    # Arrange
+    resolver = TypeResolver()
+    config = {"a__type": "MockB", "a": {"b__creator": "create_opt", "c__const": "0.1"}}
+    rules = Rules(type_rules={re.compile("opt__type"): "torch.optim.SGD"})
+
+    # Act
+    result = warm_up_type_resolver(mock_module, config, [rules], resolver)
+
+    # Assert
+    assert result == {
+        "MockB": MockB,
+        "create_opt": create_opt,
+        "0.1": 0.1,
+        "torch.optim.SGD": SGD,
+    }
+    assert resolver.misses == 4
@@ -0,0 +1,55 @@
+import click
+import pytest
+
+from runner.object_creation import ParameterNode, create_object
+from runner.utils.click import ValueSourceType
+from runner.value_sources import TextValues, load_value_source
+
+
+def test__load_value_source__streams_text_lists(tmp_path):
+    # Arrange
+    path = tmp_path / "seeds.txt"
+    path.write_text("1\n2\n\n0.5\nname\n")
+
+    # Act
+    result = load_value_source(f"@file:{path}")
+
+    # Assert
+    assert isinstance(result, TextValues)
+    assert list(result) == [1, 2, 0.5, "name"]
+    assert list(result) == [1, 2, 0.5, "name"]
+
+
+def test__load_value_source__unsupported_suffix(tmp_path):
+    # Act + Assert
+    with pytest.raises(ValueError):
+        load_value_source(f"@file:{tmp_path / 'values.csv'}")
+
+
+def test__create_object__passes_memory_mapped_array(tmp_path):
+    # Arrange
+    numpy = pytest.importorskip("numpy")
+    path = tmp_path / "weights.npy"
+    numpy.save(path, numpy.arange(10, dtype=numpy.float32))
+    node = ParameterNode(type=None, value=(f"@file:{path}",), edges={})
+
+    # Act
+    result = create_object(node, {})
+
+    # Assert
+    assert isinstance(result, numpy.memmap)
+    assert result.dtype == numpy.float32
+    assert result[3] == 3.0
+
+
+def test__value_source_type__keeps_file_sources():
+    # Arrange
+    param_type = ValueSourceType(int)
+
+    # Act
+    results = [param_type.convert(value, None, None) for value in ["3", "@file:a.npy"]]
+
+    # Assert
+    assert results == [3, "@file:a.npy"]
+    with pytest.raises(click.BadParameter):
+        param_type.convert("abc", None, None)